@@ -0,0 +1,161 @@
+from maths.api import cache
+from maths.latex import compiler
+from maths.utils import disk_cache
+from concurrent import futures
+import argparse
+import exam
+import os
+import random
+import sys
+import time
+
+
+def _variant_seeds(variants, seed):
+    """Return the seed of every variant, drawn from one generator seeded with 'seed', so a given seed always gives the
+    same variants.
+    """
+
+    seed_generator = random.Random(seed)
+    return [seed_generator.getrandbits(32) for variant in range(variants)]
+
+
+def variant_path(directory, variant):
+    """Return the path of the .tex file of a variant.
+
+    >>> variant_path('exams', 3)
+    'exams/exam-3.tex'
+    """
+
+    return os.path.join(directory, 'exam-{0}.tex'.format(variant))
+
+
+def _generate_variant(path, seed, question_cache, time_limit):
+    """Write one variant's LaTeX to path, returning how many seconds it took.
+
+    This is what each generating process runs.
+    """
+
+    start = time.perf_counter()
+    exam.generate_exam(seed=seed, cache=question_cache, time_limit=time_limit, path=path)
+    return time.perf_counter() - start
+
+
+def _compile_variant(path, compile_cache):
+    """Compile a variant's .tex file to a PDF alongside it, returning whether it compiled and how many seconds it took.
+
+    This is what each compiling thread runs - the work is done by the TeX process it waits on.
+    """
+
+    start = time.perf_counter()
+    compiled = compiler.compile_file(path, compile_cache=compile_cache)
+    return compiled, time.perf_counter() - start
+
+
+def build_exams(variants, directory='exams', seed=None, processes=None, tex_processes=None, question_cache=None,
+                compile_cache=None, time_limit=None):
+    """Generate 'variants' different exams as exam-<variant>.tex in directory, and compile each to a PDF, returning a
+    dict about each variant, in order, of:
+
+    variant, seed -- the variant's number and the seed its exam was generated from
+    generate_seconds, compile_seconds -- how long its exam took to generate and to compile (None if it didn't get
+        that far)
+    error -- None if its PDF was built, otherwise why it wasn't
+
+    The exams are generated over 'processes' processes (default: one per core) and compiled by at most
+    'tex_processes' TeX processes at a time (default: one per core), each in a temporary directory of its own. A
+    variant is compiled as soon as it has been generated, so TeX runs alongside the generating processes rather than
+    after them. The same seed always gives the same variants.
+
+    question_cache, compile_cache -- a cache.QuestionCache and compiler.CompileCache to reuse work from earlier builds
+    time_limit -- see exam.generate_exam
+    """
+
+    os.makedirs(directory, exist_ok=True)
+
+    results = [{'variant': variant, 'seed': variant_seed, 'generate_seconds': None, 'compile_seconds': None,
+                'error': None}
+               for variant, variant_seed in enumerate(_variant_seeds(variants, seed))]
+
+    # build the preamble's format once up front, rather than in every compiling thread that gets to it first
+    compiler.preamble_format()
+
+    with futures.ProcessPoolExecutor(max_workers=processes) as generators, \
+            futures.ThreadPoolExecutor(max_workers=tex_processes or os.cpu_count()) as compilers:
+        generating = {generators.submit(_generate_variant, variant_path(directory, result['variant']), result['seed'],
+                                        question_cache, time_limit): result
+                      for result in results}
+
+        compiling = {}
+        for future in futures.as_completed(generating):
+            result = generating[future]
+            try:
+                result['generate_seconds'] = future.result()
+            except Exception as e:
+                result['error'] = 'generating failed: {0!r}'.format(e)
+                continue
+
+            compiling[compilers.submit(_compile_variant, variant_path(directory, result['variant']),
+                                       compile_cache)] = result
+
+        for future in futures.as_completed(compiling):
+            result = compiling[future]
+            try:
+                compiled, result['compile_seconds'] = future.result()
+            except Exception as e:  # e.g. xelatex isn't installed, or the variant's .tex couldn't be read
+                result['error'] = 'compiling failed: {0!r}'.format(e)
+                continue
+
+            if not compiled:
+                result['error'] = 'compiling failed, see {0}'.format(
+                    os.path.splitext(variant_path(directory, result['variant']))[0] + '.log')
+
+    return results
+
+
+def report(results):
+    """Return a table of how long each variant took to build, and why any of them failed.
+
+    >>> print(report([{'variant': 0, 'seed': 7, 'generate_seconds': 1.5, 'compile_seconds': 0.25, 'error': None},
+    ...               {'variant': 1, 'seed': 8, 'generate_seconds': 1.0, 'compile_seconds': None,
+    ...                'error': 'compiling failed'}]))
+    variant          seed  generate s   compile s  error
+          0             7        1.50        0.25
+          1             8        1.00           -  compiling failed
+    """
+
+    lines = ['{0:>7}{1:>14}{2:>12}{3:>12}  {4}'.format('variant', 'seed', 'generate s', 'compile s', 'error')]
+
+    for result in results:
+        seconds = ['{0:.2f}'.format(result[i]) if result[i] is not None else '-'
+                   for i in ['generate_seconds', 'compile_seconds']]
+        lines.append('{0:>7}{1:>14}{2:>12}{3:>12}  {4}'.format(
+            result['variant'], result['seed'], seconds[0], seconds[1], result['error'] or '').rstrip())
+
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate many variants of an exam, and compile each to a PDF')
+    parser.add_argument('variants', type=int, help='how many variants to build')
+    parser.add_argument('--directory', default='exams', help='where to put the variants (default: exams)')
+    parser.add_argument('--seed', type=int, default=None, help='seed for reproducible variants')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='generate variants over this many processes (default: one per core)')
+    parser.add_argument('--tex-processes', type=int, default=None,
+                        help='run at most this many TeX processes at a time (default: one per core)')
+    parser.add_argument('--cache', nargs='?', const=disk_cache.default_directory(), default=None,
+                        help='reuse questions built and exams compiled before, kept in this directory '
+                             '(default: $MATHS_CACHE_DIR or ~/.cache/mathsexams)')
+    parser.add_argument('--time-limit', type=float, default=None,
+                        help='seconds to spend building a question before building another from a fresh seed')
+    args = parser.parse_args()
+
+    question_cache = cache.QuestionCache(args.cache) if args.cache is not None else None
+    compile_cache = compiler.CompileCache(args.cache) if args.cache is not None else None
+
+    results = build_exams(args.variants, args.directory, args.seed, args.processes, args.tex_processes,
+                          question_cache, compile_cache, args.time_limit)
+    print(report(results))
+
+    if any(result['error'] is not None for result in results):
+        sys.exit(1)
@@ -1,13 +1,102 @@
 from maths.questions import relationships
-from maths.latex import latex
-from maths.api import api
+from maths.latex import compiler, latex
+from maths.api import api, cache
+from maths.utils import disk_cache, retries, time_budget
+from concurrent import futures
+import argparse
+import functools
+import io
 import os
+import random
 
 
-def generate_exam():
-    """Generate an exam with multiple questions, with solutions for each question!
+def _question_seeds(question_modules, seed):
+    """Return a (module name, tree index, seed) job for every question tree in the exam, in exam order.
 
-    It's quite simple for now.
+    The seeds are drawn from one generator seeded with 'seed', so a given seed always gives the same exam no matter
+    how the questions are spread across processes.
+    """
+
+    seed_generator = random.Random(seed)
+
+    jobs = []
+    for question in question_modules:
+        possible_questions = relationships.parse_structure(question)
+
+        for tree_index in range(len(possible_questions)):
+            jobs.append((question.__name__, tree_index, seed_generator.getrandbits(32)))
+
+    return jobs
+
+
+def _question_latex(job, cache=None, time_limit=None, reservoir=None):
+    """Return the LaTeX for one question and its solution.
+
+    The question is identified by its module name rather than the module object itself, so that worker processes can
+    build it too.
+    """
+
+    module_name, tree_index, seed = job
+    question = api.registry.question(module_name.rsplit('.', 1)[-1], seed=seed, tree_index=tree_index, cache=cache,
+                                     time_limit=time_limit, reservoir=reservoir)
+
+    return _exam_part(question)
+
+
+def _worker_question_latex(job, cache=None, time_limit=None):
+    """Return the LaTeX for one question and its solution, or None if every attempt at it runs out of time.
+
+    This is what each worker process runs during parallel generation - the reservoir to fall back on stays in the
+    parent process.
+    """
+
+    try:
+        return _question_latex(job, cache, time_limit)
+    except time_budget.BudgetExceeded:
+        return None
+
+
+def _reservoir_latex(reservoir, job):
+    """Return the LaTeX for one question and its solution, handed out from a reservoir's stock of built questions.
+    """
+
+    module_name, tree_index, seed = job
+    question = reservoir.question(module_name.rsplit('.', 1)[-1], tree_index)
+
+    return _exam_part(question)
+
+
+def _exam_part(question):
+    """Return the LaTeX for a built question followed by its solution, on a page of its own.
+    """
+
+    exam_part = io.StringIO()
+    exam_part.write(question['question'])
+
+    latex.decrement_question_counter(exam_part)
+
+    exam_part.write(question['solution'])
+    latex.new_page(exam_part)
+
+    return exam_part.getvalue()
+
+
+def generate_exam(seed=None, processes=None, reservoir=None, cache=None, time_limit=None, path='exam.tex'):
+    """Generate an exam with multiple questions, with solutions for each question, in the file 'path'.
+
+    Every question is built from its own seed, drawn from 'seed'. If 'processes' is given, the questions are built
+    in that many worker processes and stitched back together in their original order - the exam written is the
+    same as a serial run with the same seed.
+
+    If a reservoir.QuestionReservoir is given and there is no seed, the questions are handed out from its stock
+    instead of being built, and 'processes' has no effect. With a seed, the questions are still built, and a question
+    is only handed out from the reservoir if every attempt at it runs out of time.
+
+    If a cache.QuestionCache is given, questions that were built before with the same seed are read back from it, so
+    regenerating an exam only builds the questions whose code has changed.
+
+    If a time_limit is given, a question that takes longer than that many seconds to build is swapped for another
+    one from a fresh seed - see api.QuestionRegistry.question.
     """
 
     cur_dir = os.path.split(__file__)[0]
@@ -16,22 +105,56 @@ def generate_exam():
 
     question_modules = api.import_question_modules(question_paths)
 
-    with open('exam.tex', 'w') as exam_file:
-        latex.begin_tex_document(exam_file)
-
-        for question in question_modules:
-            possible_questions = relationships.parse_structure(question)
+    jobs = _question_seeds(question_modules, seed)
 
-            for i in possible_questions:
-                i.write_question(exam_file)
+    with open(path, 'w') as exam_file:
+        latex.begin_tex_document(exam_file)
 
-                latex.decrement_question_counter(exam_file)
+        if reservoir is not None and seed is None:
+            for job in jobs:
+                exam_file.write(_reservoir_latex(reservoir, job))
+        elif processes is None:
+            for job in jobs:
+                exam_file.write(_question_latex(job, cache, time_limit, reservoir))
+        else:
+            question_latex = functools.partial(_worker_question_latex, cache=cache, time_limit=time_limit)
 
-                i.write_solution(exam_file)
-                latex.new_page(exam_file)
+            with futures.ProcessPoolExecutor(max_workers=processes) as executor:
+                # map hands results back in the order the jobs were submitted, whichever worker finishes first
+                built = executor.map(functools.partial(retries.collect, question_latex), jobs)
+                for job, (exam_part, loop_counts) in zip(jobs, built):
+                    retries.merge(loop_counts)
+                    if exam_part is None:
+                        module_name, tree_index = job[:2]
+                        exam_part = _exam_part(api._stocked_question(module_name.rsplit('.', 1)[-1], tree_index,
+                                                                     reservoir))
+                    exam_file.write(exam_part)
 
         latex.end_tex_document(exam_file)
 
 
 if __name__ == '__main__':
-    generate_exam()
+    parser = argparse.ArgumentParser(description='Generate an exam, with solutions, in exam.tex')
+    parser.add_argument('--seed', type=int, default=None, help='seed for a reproducible exam')
+    parser.add_argument('--processes', type=int, nargs='?', const=os.cpu_count(), default=None,
+                        help='build questions in parallel over this many processes (default: one per core)')
+    parser.add_argument('--cache', nargs='?', const=disk_cache.default_directory(), default=None,
+                        help='reuse questions built (and, with --pdf, exams compiled) before, kept in this directory '
+                             '(default: $MATHS_CACHE_DIR or ~/.cache/mathsexams)')
+    parser.add_argument('--time-limit', type=float, default=None,
+                        help='seconds to spend building a question before building another from a fresh seed')
+    parser.add_argument('--retries', action='store_true',
+                        help="report how many attempts the question generators' retry loops took, and how long")
+    parser.add_argument('--pdf', action='store_true',
+                        help='compile exam.tex to exam.pdf, from the precompiled preamble when it can be built')
+    args = parser.parse_args()
+
+    question_cache = cache.QuestionCache(args.cache) if args.cache is not None else None
+    generate_exam(seed=args.seed, processes=args.processes, cache=question_cache, time_limit=args.time_limit)
+
+    compile_cache = compiler.CompileCache(args.cache) if args.cache is not None else None
+    if args.pdf and not compiler.compile_file('exam.tex', compile_cache=compile_cache):
+        print('exam.tex failed to compile, see exam.log')
+
+    if args.retries:
+        print(retries.report())
@@ -1 +1,30 @@
-from .api.api import *
\ No newline at end of file
+# the api's names, which are only imported when one of them is asked for, so that importing maths (or any of its
+# subpackages) doesn't pay for the api
+__all__ = [
+    'BACKGROUND_TIME_LIMIT',
+    'QuestionRegistry',
+    'TIMEOUT_RETRIES',
+    'cur_dir',
+    'get_question_paths',
+    'get_questions_dir',
+    'grandparent_dir',
+    'import_question_modules',
+    'parent_dir',
+    'questions_dir',
+    'random_question',
+    'random_questions',
+    'registry',
+    'retry_report',
+]
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError("module 'maths' has no attribute '{0}'".format(name))
+
+    from .api import api
+    return getattr(api, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,7 +3,8 @@ from .relations.trigonometry import trig
 from .relations.logarithms import log
 from .relations.exponentials import exp
 from .symbols import *
-import random
+from . import randomness
+from .utils import retries
 
 
 def random_function(linear_difficulty=None,
@@ -11,18 +12,21 @@ def random_function(linear_difficulty=None,
                     log_difficulty=None,
                     trig_difficulty=None,
                     exp_difficulty=None,
-                    exclude=None):
+                    exclude=None,
+                    rng=None):
+
+    rng = randomness.resolve(rng)
 
     if linear_difficulty is None:
-        linear_difficulty = random.randint(1, 2)
+        linear_difficulty = rng.randint(1, 2)
     if quadratic_difficulty is None:
-        quadratic_difficulty = random.randint(1, 3)
+        quadratic_difficulty = rng.randint(1, 3)
     if log_difficulty is None:
-        log_difficulty = random.randint(1, 2)
+        log_difficulty = rng.randint(1, 2)
     if trig_difficulty is None:
-        trig_difficulty = random.randint(1, 2)
+        trig_difficulty = rng.randint(1, 2)
     if exp_difficulty is None:
-        exp_difficulty = random.randint(1, 3)
+        exp_difficulty = rng.randint(1, 3)
     if exclude is None:
         exclude = []
 
@@ -53,26 +57,26 @@ def random_function(linear_difficulty=None,
                 3: y = a * e^(k * x) + c
     '''
 
-    while True:
-        function = random.sample(['linear', 'quadratic', 'log', 'trig', 'exp'], 1)[0]
+    for attempt in retries.attempts():
+        function = rng.sample(['linear', 'quadratic', 'log', 'trig', 'exp'], 1)[0]
         if function not in exclude:
             break
 
     if function == 'trig':
-        function = random.choice(['sin', 'cos', 'tan'])
+        function = rng.choice(['sin', 'cos', 'tan'])
 
     return {
-        'linear': linear.Linear(linear_difficulty),
-        'quadratic': quadratic.Quadratic(quadratic_difficulty),
-        'log': log.Log(log_difficulty),
-        'sin': trig.Sin(trig_difficulty),
-        'cos': trig.Cos(trig_difficulty),
-        'tan': trig.Tan(trig_difficulty),
-        'exp': exp.Exp(exp_difficulty)}[function]
+        'linear': linear.Linear(linear_difficulty, rng=rng),
+        'quadratic': quadratic.Quadratic(quadratic_difficulty, rng=rng),
+        'log': log.Log(log_difficulty, rng=rng),
+        'sin': trig.Sin(trig_difficulty, rng=rng),
+        'cos': trig.Cos(trig_difficulty, rng=rng),
+        'tan': trig.Tan(trig_difficulty, rng=rng),
+        'exp': exp.Exp(exp_difficulty, rng=rng)}[function]
 
 
-def random_function_type():
-    return random.choice([
+def random_function_type(rng=None):
+    return randomness.resolve(rng).choice([
         sympy.sin, sympy.cos, sympy.tan,
         sympy.log,  # it's the natural log, ln
         sympy.exp,
@@ -101,54 +105,56 @@ def inverse(function):  # requires future work as more things are included
         return solutions[0].replace(y, var)
 
 
-def request_linear(difficulty, var=x):
-    return linear.request_linear(difficulty, var)
+def request_linear(difficulty, var=x, rng=None):
+    return linear.request_linear(difficulty, var, rng)
+
 
+def request_quadratic(difficulty, rng=None):
+    return quadratic.Quadratic(difficulty, rng)
 
-def request_quadratic(difficulty):
-    return quadratic.Quadratic(difficulty)
 
+def request_exp(difficulty, rng=None):
+    return exp.Exp(difficulty, rng)
 
-def request_exp(difficulty):
-    return exp.Exp(difficulty)
 
+def request_log(difficulty, rng=None):
+    return log.Log(difficulty, rng)
 
-def request_log(difficulty):
-    return log.Log(difficulty)
 
+def request_absolute_value(difficulty, rng=None):
+    return absolute_value.AbsoluteValue(difficulty, rng)
 
-def request_absolute_value(difficulty):
-    return absolute_value.AbsoluteValue(difficulty)
 
+def request_hyperbola(difficulty, rng=None):
+    return hyperbola.Hyperbola(difficulty, rng)
 
-def request_hyperbola(difficulty):
-    return hyperbola.Hyperbola(difficulty)
 
+def request_sin(difficulty, rng=None):
+    return trig.Sin(difficulty, rng)
 
-def request_sin(difficulty):
-    return trig.Sin(difficulty)
 
+def request_cos(difficulty, rng=None):
+    return trig.Cos(difficulty, rng)
 
-def request_cos(difficulty):
-    return trig.Cos(difficulty)
 
+def request_tan(difficulty, rng=None):
+    return trig.Tan(difficulty, rng)
 
-def request_tan(difficulty):
-    return trig.Tan(difficulty)
 
+def request_trig(difficulty=None, rng=None):
+    rng = randomness.resolve(rng)
 
-def request_trig(difficulty=None):
-    function_type = random.choice(['sin', 'cos', 'tan'])
+    function_type = rng.choice(['sin', 'cos', 'tan'])
 
     if difficulty is None:
-        difficulty = random.randint(1, 2)
+        difficulty = rng.randint(1, 2)
 
     if function_type == 'sin':
-        return request_sin(difficulty)
+        return request_sin(difficulty, rng)
     if function_type == 'cos':
-        return request_cos(difficulty)
+        return request_cos(difficulty, rng)
     if function_type == 'tan':
-        return request_tan(difficulty)
+        return request_tan(difficulty, rng)
 
 
 # for use when matching - e.g. say we have y = tan(2*x), we have to do y.match(a*tan(b) + c) - what if we don't know what the trig function is?
@@ -174,7 +180,9 @@ def detect_expr_type(expr):
 
 
 # takes an ordered list of x-values, and selects two values to return as a lower/upper bound pair
-def choose_bounds(x_values):
+def choose_bounds(x_values, rng=None):
+    rng = randomness.resolve(rng)
+
     def test_is_list(x_values):
         assert isinstance(x_values, list)
 
@@ -182,8 +190,8 @@ def choose_bounds(x_values):
         assert x_values == sorted(x_values)
 
     # remember that len(list) - 1 (not len(list)) gives the final index of a list
-    l_index = random.randint(0, len(x_values) - 2)  # choose any index except the last
-    u_index = random.randint(l_index + 1, len(x_values) - 1)
+    l_index = rng.randint(0, len(x_values) - 2)  # choose any index except the last
+    u_index = rng.randint(l_index + 1, len(x_values) - 1)
 
     def test_indices_order(l_index, u_index):
         assert l_index < u_index
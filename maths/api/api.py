@@ -10,11 +10,22 @@ sys.path.append(grandparent_dir)
 
 
 from maths.questions import relationships
+from maths.utils import retries
+from maths.utils import time_budget
+from concurrent import futures
+import functools
 import glob
 import importlib
 import random
+import threading
 
 
+# how many fresh seeds to try when a question runs out of its time budget
+TIMEOUT_RETRIES = 2
+
+# the time limit of questions built in the background, by the reservoir and the server, so a worker never hangs
+BACKGROUND_TIME_LIMIT = 30
+
 
 def get_questions_dir():
     """Return the directory that houses the questions.
@@ -25,12 +36,13 @@ def get_questions_dir():
 
 
 def get_question_paths(questions_dir):
-    """Get all the module paths that have questions in them.
+    """Get all the module paths that have questions in them, sorted so that they are in the same order on every
+    machine - seeded questions are chosen from them by their position.
     """
 
     pattern = os.path.join(questions_dir, r'*.py')
 
-    module_paths = glob.glob(pattern)
+    module_paths = sorted(glob.glob(pattern))
 
     non_question_modules = ['__init__.py', 'relationships.py']
 
@@ -64,18 +76,249 @@ def import_question_modules(question_paths):
     return question_modules
 
 
-def random_question():
-    """Serve a random question along with its solution.
+class QuestionRegistry:
+    """Discover the question modules once and keep their parsed question trees for the life of the process.
+
+    Building a question then only costs building the question, instead of globbing, importing and parsing every
+    question module first.
     """
 
-    questions_dir = get_questions_dir()
-    question_paths = get_question_paths(questions_dir)
-    question_modules = import_question_modules(question_paths)
+    def __init__(self, questions_dir=None):
+        self.questions_dir = questions_dir
+
+        self._modules = None
+        self._trees = {}
+        self._lock = threading.Lock()
+
+    def modules(self):
+        """Return a dict of module name -> imported question module, discovering them on the first call.
+        """
+
+        with time_budget.uninterruptible(), self._lock:
+            if self._modules is None:
+                questions_dir = self.questions_dir if self.questions_dir is not None else get_questions_dir()
+                question_paths = get_question_paths(questions_dir)
+
+                # only kept once every module has imported, so a failed import is tried again on the next call
+                modules = {}
+                for module in import_question_modules(question_paths):
+                    module_name = module.__name__.rsplit('.', 1)[-1]
+                    modules[module_name] = module
+
+                self._modules = modules
+
+        return self._modules
+
+    def module_names(self):
+        """Return the names of all the question modules, in the order of their paths.
+        """
+
+        return list(self.modules())
+
+    def trees(self, module_name):
+        """Return the parsed question trees for a module. These are templates - build questions from copies of them.
+        """
+
+        modules = self.modules()
+        if module_name not in modules:
+            raise ValueError('There is no question module named: {0}'.format(module_name))
+
+        with time_budget.uninterruptible(), self._lock:
+            if module_name not in self._trees:
+                self._trees[module_name] = relationships.parse_structure(modules[module_name])
+
+        return self._trees[module_name]
+
+    def question(self, module_name, seed=None, tree_index=0, cache=None, time_limit=None, reservoir=None):
+        """Build a question from a module along with its solution. The same seed always gives the same question.
+
+        If a cache.QuestionCache is given, a seeded question that was built before is read back from it instead.
+
+        If a time_limit (in seconds) is given, a question that takes longer than that to build is abandoned, and
+        another one is built from a fresh seed instead, up to TIMEOUT_RETRIES times. Once they have all run out of time,
+        a question is handed out from the reservoir (a reservoir.QuestionReservoir) if it has one in stock, otherwise
+        time_budget.BudgetExceeded is raised. The fresh seeds are drawn from the seed, so a seeded question is still
+        the same question every time, as long as it runs out of time every time.
+        """
+
+        # looked up before the time budget starts, so its timer never goes off while the registry's lock is held
+        tree = self.trees(module_name)[tree_index]
+        module = self.modules()[module_name]
+
+        if time_limit is None:
+            return self._question(tree, module, seed, cache)
 
-    choice = random.choice(question_modules)
-    built_question = relationships.parse_structure(choice)[0]
+        seed_generator = random.Random(seed)
+        for attempt in range(TIMEOUT_RETRIES + 1):
+            try:
+                with time_budget.limit(time_limit):
+                    return self._question(tree, module, seed, cache)
+            except time_budget.BudgetExceeded:
+                seed = seed_generator.getrandbits(32) if seed is not None else None
+
+        return _stocked_question(module_name, tree_index, reservoir)
+
+    def _question(self, tree, module, seed, cache):
+        built_question = tree.copy(seed)
+
+        if cache is not None:
+            cached_question = cache.get(built_question, module)
+            if cached_question is not None:
+                return cached_question
+
+        question = {
+            'question': built_question.question_statement(),
+            'solution': built_question.solution_statement()
+        }
+
+        if cache is not None:
+            cache.put(built_question, module, question)
+
+        return question
+
+    def random_question(self, seed=None, cache=None, time_limit=None, reservoir=None):
+        """Serve a random question along with its solution. The same seed always serves the same question.
+        """
+
+        if seed is None:
+            return self.question(random.choice(self.module_names()), time_limit=time_limit, reservoir=reservoir)
+
+        seed_generator = random.Random(seed)
+        module_name = seed_generator.choice(self.module_names())
+
+        return self.question(module_name, seed=seed_generator.getrandbits(32), cache=cache, time_limit=time_limit,
+                             reservoir=reservoir)
+
+    def candidates(self, modules=None, part_classes=None):
+        """Return every (module name, tree index) that a question can be built from.
+
+        modules -- only use these question modules
+        part_classes -- only use question trees containing one of these parts, given as classes or class names
+        """
+
+        if modules is None:
+            modules = self.module_names()
+
+        if part_classes is not None:
+            part_class_names = {getattr(i, '__name__', i) for i in part_classes}
+
+        candidates = []
+        for module_name in modules:
+            for tree_index, tree in enumerate(self.trees(module_name)):
+                if part_classes is None or part_class_names & set(_tree_class_names(tree)):
+                    candidates.append((module_name, tree_index))
+
+        return candidates
+
+
+def _tree_class_names(tree):
+    """Return the names of all the parts in a question tree.
+    """
+
+    yield tree.cls.__name__
+    for child in tree.children:
+        yield from _tree_class_names(child)
+
+
+registry = QuestionRegistry()
+
+
+def _stocked_question(module_name, tree_index, reservoir):
+    """Return a question handed out from the reservoir's stock for a question whose every attempt ran out of time,
+    raising time_budget.BudgetExceeded if there is no reservoir or it has none in stock.
+    """
+
+    question = reservoir.stocked_question(module_name, tree_index) if reservoir is not None else None
+    if question is None:
+        raise time_budget.BudgetExceeded('Every attempt at a question from {0} (tree {1}) ran out of time'.format(
+            module_name, tree_index))
+
+    return question
+
+
+def _build_question(job, cache=None, time_limit=None, reservoir=None):
+    """Build one question for random_questions. Worker processes each build their own registry on the first job.
+    """
+
+    module_name, tree_index, seed = job
+
+    return registry.question(module_name, seed=seed, tree_index=tree_index, cache=cache, time_limit=time_limit,
+                             reservoir=reservoir)
+
+
+def _build_question_in_worker(job, cache=None, time_limit=None):
+    """Build one question in a worker process, returning None if every attempt at it runs out of time - the reservoir
+    to fall back on stays in the parent process, which calls _stocked_question itself.
+    """
+
+    try:
+        return _build_question(job, cache, time_limit)
+    except time_budget.BudgetExceeded:
+        return None
+
+
+def random_question(reservoir=None, seed=None, cache=None, time_limit=None):
+    """Serve a random question along with its solution. The same seed always serves the same question.
+
+    If a reservoir.QuestionReservoir is given, an unseeded question is handed out from its stock of built questions
+    instead. A seeded question is still built from its seed, and is only handed out from the reservoir if it runs out
+    of time. If a cache.QuestionCache is given, a seeded question is read back from it when it was built before. If
+    a time_limit is given, a question that takes longer than that many seconds to build is swapped for another - see
+    QuestionRegistry.question.
+    """
+
+    if reservoir is not None and seed is None:
+        return reservoir.question()
+
+    return registry.random_question(seed, cache=cache, time_limit=time_limit, reservoir=reservoir)
+
+
+def random_questions(n, modules=None, seed=None, part_classes=None, processes=None, cache=None, time_limit=None,
+                     reservoir=None):
+    """Serve a list of n random questions along with their solutions.
+
+    n -- how many questions to serve
+    modules -- only serve questions from these question modules
+    seed -- the same seed always serves the same list of questions
+    part_classes -- only serve questions containing one of these parts, given as classes or class names
+    processes -- build the questions over this many processes instead of in this one
+    cache -- read back questions that were built before from this cache.QuestionCache, and store new ones in it
+    time_limit -- the most seconds to spend building each question before trying another seed - see
+        QuestionRegistry.question
+    reservoir -- hand out a question from this reservoir.QuestionReservoir's stock when every seed runs out of time
+    """
+
+    candidates = registry.candidates(modules, part_classes)
+    if not candidates:
+        raise ValueError('No questions match modules: {0} and part classes: {1}'.format(modules, part_classes))
+
+    # every question's module and seed is chosen up front, so the list doesn't depend on how it is built
+    seed_generator = random.Random(seed)
+    jobs = [seed_generator.choice(candidates) + (seed_generator.getrandbits(32), ) for i in range(n)]
+
+    if processes is None:
+        return [_build_question(job, cache, time_limit, reservoir) for job in jobs]
+
+    build_question = functools.partial(_build_question_in_worker, cache=cache, time_limit=time_limit)
+
+    with futures.ProcessPoolExecutor(max_workers=processes) as executor:
+        # hand each worker a few questions at a time so its module setup is spread over more than one question
+        chunksize = max(1, n // (processes * 4))
+        built = list(executor.map(functools.partial(retries.collect, build_question), jobs, chunksize=chunksize))
+
+    # count the workers' retry loops here, so retry_report covers them
+    for question, loop_counts in built:
+        retries.merge(loop_counts)
+
+    return [question if question is not None else _stocked_question(job[0], job[1], reservoir)
+            for job, (question, loop_counts) in zip(jobs, built)]
+
+
+def retry_report(top=None):
+    """Return a table of how many attempts the question generators' retry loops have taken, and how long they spent,
+    the loops that spent the most time first. It covers every question built by this process or for it.
+
+    top -- only include this many loops
+    """
 
-    return {
-        'question': built_question.question_statement(),
-        'solution': built_question.solution_statement()
-    }
+    return retries.report(top=top)
@@ -0,0 +1,167 @@
+import functools
+import glob
+import inspect
+import os
+import re
+import shutil
+
+from .. import maths_path
+from ..utils import disk_cache
+
+
+# directories of the maths package that question generation never imports from
+_NOT_HELPERS = ['questions', 'tests', 'api', 'scripts', 'templates', 'exams', 'debug', 'benchmarks']
+
+# modules of the questions package that aren't questions, but render every question
+_QUESTION_HELPERS = ['relationships.py']
+
+_FIGURE_PATTERN = re.compile(r'\\includegraphics(?:\[[^\]]*\])?\{([^}]*)\}')
+
+
+@functools.lru_cache(maxsize=None)
+def helpers_hash(root=None):
+    """Return a hash of the source of every module that question modules build on - relations, latex, plot, the part
+    trees of relationships.py and so on.
+
+    Changing any of them changes the hash, so questions rendered with old helpers are never served from the cache.
+
+    root -- the maths package's directory, defaulting to this one's
+    """
+
+    if root is None:
+        root = maths_path.maths_path()
+
+    paths = []
+    for directory_path, directory_names, file_names in os.walk(root):
+        directory_names[:] = sorted(i for i in directory_names
+                                    if not (directory_path == root and i in _NOT_HELPERS) and i != '__pycache__')
+        paths.extend(os.path.join(directory_path, i) for i in sorted(file_names) if i.endswith('.py'))
+
+    paths.extend(os.path.join(root, 'questions', i) for i in _QUESTION_HELPERS)
+
+    return disk_cache.hash_files(paths)
+
+
+def storage_paths(module):
+    """Return the paths of the stored questions and banks (and their indexes) of a question module.
+    """
+
+    questions_folder, file_name = os.path.split(inspect.getsourcefile(module))
+    module_name = os.path.splitext(file_name)[0]
+    storage_folder = glob.escape(os.path.join(questions_folder, 'storage'))
+
+    return sorted(glob.glob(os.path.join(storage_folder, 'banks', glob.escape(module_name) + '_*.npy')) +
+                  glob.glob(os.path.join(storage_folder, 'data', glob.escape(file_name) + '_*')) +
+                  glob.glob(os.path.join(storage_folder, 'indices', glob.escape(file_name) + '_indices')))
+
+
+@functools.lru_cache(maxsize=64)
+def _hash_storage(stats):
+    return disk_cache.hash_files([path for path, modified, size in stats])
+
+
+def storage_hash(module):
+    """Return a hash of the stored questions of a question module, which questions may be served from.
+
+    The files are only read again once one of them changes, so storing questions again changes the hash.
+    """
+
+    stats = []
+    for path in storage_paths(module):
+        stat = os.stat(path)
+        stats.append((path, stat.st_mtime_ns, stat.st_size))
+
+    return _hash_storage(tuple(stats))
+
+
+def figure_paths(tex):
+    """Return the paths of the .eps figures that some LaTeX includes.
+
+    >>> figure_paths(r'\\includegraphics[scale=0.5]{/a/figures/1234}')
+    ['/a/figures/1234.eps']
+    """
+
+    return [os.path.splitext(i)[0] + '.eps' for i in _FIGURE_PATTERN.findall(tex)]
+
+
+class QuestionCache:
+    """An on-disk cache of rendered questions and their solutions, along with the figures they include.
+
+    A question is stored under its module, root class and seed, along with a hash of the source of its module and the
+    helpers it builds on and of its module's stored questions, so editing the question code or storing its questions
+    again never serves a stale question. Only seeded questions are cached - an unseeded question is meant to be
+    different every time. The least recently used questions are evicted once the cache grows past max_bytes.
+
+    A QuestionCache can be handed to worker processes, which all share the same directory.
+
+    directory -- where caches are kept, defaulting to $MATHS_CACHE_DIR or ~/.cache/mathsexams
+    max_bytes -- how big the cache can grow
+    """
+
+    def __init__(self, directory=None, max_bytes=500 * 1024 ** 2):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @property
+    def _disk_cache(self):
+        return disk_cache.DiskCache('questions', self.directory, self.max_bytes)
+
+    def key(self, tree, module):
+        """Return the key a question tree built from module is stored under.
+        """
+
+        return disk_cache.hash_key(
+            module.__name__,
+            tree.cls.__name__,
+            tree.seed,
+            disk_cache.hash_files([inspect.getsourcefile(module)]),
+            helpers_hash(),
+            storage_hash(module),
+        )
+
+    def get(self, tree, module):
+        """Return the cached {'question': ..., 'solution': ...} for a question tree, or None if it isn't cached.
+
+        Any figures the question includes are put back in place first.
+        """
+
+        if tree.seed is None:
+            return None
+
+        entry_path = self._disk_cache.get(self.key(tree, module))
+        if entry_path is None:
+            return None
+
+        try:
+            with open(os.path.join(entry_path, 'question.tex')) as f:
+                question = f.read()
+            with open(os.path.join(entry_path, 'solution.tex')) as f:
+                solution = f.read()
+
+            for figure_path in figure_paths(question + solution):
+                if not os.path.exists(figure_path):
+                    os.makedirs(os.path.dirname(figure_path), exist_ok=True)
+                    shutil.copyfile(os.path.join(entry_path, 'figures', os.path.basename(figure_path)), figure_path)
+        except OSError:
+            # the entry was evicted while it was being read
+            return None
+
+        return {'question': question, 'solution': solution}
+
+    def put(self, tree, module, question):
+        """Store a rendered {'question': ..., 'solution': ...} for a question tree, along with any figures it includes.
+        """
+
+        if tree.seed is None:
+            return
+
+        files = {'question.tex': question['question'], 'solution.tex': question['solution']}
+
+        try:
+            for figure_path in figure_paths(question['question'] + question['solution']):
+                with open(figure_path, 'rb') as f:
+                    files[os.path.join('figures', os.path.basename(figure_path))] = f.read()
+
+            self._disk_cache.put(self.key(tree, module), files)
+        except OSError:
+            pass  # the cache is only ever a shortcut - a full disk or a missing figure shouldn't fail the question
@@ -0,0 +1,124 @@
+from . import api
+from ..utils import retries
+from concurrent import futures
+import collections
+import functools
+import random
+import threading
+
+
+class QuestionReservoir:
+    """Keep a stock of built questions for every question tree, so a burst of questions isn't held up by sympy.
+
+    Questions are handed out in O(1). Whenever a tree's stock drops below the low-water mark it is topped back up in
+    the background, over a pool of worker processes. They are processes rather than threads as questions built on the
+    spot are built in this process, and neither sympy's caches nor pyplot's state are safe to share between threads.
+
+    size -- how many built questions to keep for each question tree
+    low_water -- refill a tree's stock once it drops below this, defaulting to half of size
+    modules -- only keep questions for these question modules
+    processes -- refill over this many processes
+    time_limit -- the most seconds to spend building each question before trying another seed, so a refill can't
+        hang on an unlucky question
+    """
+
+    def __init__(self, size=10, low_water=None, modules=None, processes=1, time_limit=api.BACKGROUND_TIME_LIMIT):
+        self.size = size
+        self.low_water = low_water if low_water is not None else size // 2
+        self._build_question = functools.partial(api._build_question, time_limit=time_limit)
+
+        self._stock = {candidate: collections.deque() for candidate in api.registry.candidates(modules)}
+        self._pending = collections.Counter()
+        self._lock = threading.Lock()
+
+        self._executor = futures.ProcessPoolExecutor(max_workers=processes)
+
+    def fill(self, wait=True):
+        """Top up the stock of every question tree, waiting until it is full unless wait is False.
+        """
+
+        requested = []
+        for candidate in self._stock:
+            requested.extend(self._refill(candidate))
+
+        if wait:
+            futures.wait(requested)
+
+    def question(self, module_name=None, tree_index=None):
+        """Hand out a built question along with its solution.
+
+        If the stock for the question has run dry, the question is built on the spot instead of waiting for a refill.
+        """
+
+        candidates = [i for i in self._stock
+                      if module_name in [None, i[0]] and tree_index in [None, i[1]]]
+        if not candidates:
+            raise ValueError('The reservoir has no questions for module: {0}, tree: {1}'.format(
+                module_name, tree_index))
+
+        if module_name is None or tree_index is None:
+            stocked = [i for i in candidates if self._stock[i]]
+            candidate = random.choice(stocked or candidates)
+        else:
+            candidate = candidates[0]
+
+        question = self._take(candidate)
+        if question is None:
+            question = self._build_question(candidate + (random.getrandbits(32), ))
+
+        return question
+
+    def stocked_question(self, module_name, tree_index):
+        """Hand out a built question for a question tree if there is one in stock, otherwise return None.
+        """
+
+        return self._take((module_name, tree_index)) if (module_name, tree_index) in self._stock else None
+
+    def _take(self, candidate):
+        """Take a question out of a question tree's stock, topping the stock up if it's running low.
+        """
+
+        try:
+            question = self._stock[candidate].popleft()
+        except IndexError:
+            question = None
+
+        if len(self._stock[candidate]) < self.low_water:
+            self._refill(candidate)
+
+        return question
+
+    def close(self):
+        """Stop refilling the stock.
+        """
+
+        self._executor.shutdown(cancel_futures=True)
+
+    def _refill(self, candidate):
+        """Request enough builds to bring a question tree's stock back up to size, returning the requested futures.
+        """
+
+        with self._lock:
+            missing = self.size - len(self._stock[candidate]) - self._pending[candidate]
+            self._pending[candidate] += max(0, missing)
+
+        requested = []
+        for i in range(missing):
+            job = candidate + (random.getrandbits(32), )
+            future = self._executor.submit(retries.collect, self._build_question, job)
+            future.add_done_callback(lambda future, candidate=candidate: self._restock(candidate, future))
+            requested.append(future)
+
+        return requested
+
+    def _restock(self, candidate, future):
+        built = not future.cancelled() and future.exception() is None
+        if built:
+            question, loop_counts = future.result()
+            retries.merge(loop_counts)
+
+        # the question is only no longer pending once it's in stock, so a refill in between doesn't request it again
+        with self._lock:
+            if built:
+                self._stock[candidate].append(question)
+            self._pending[candidate] -= 1
@@ -0,0 +1,244 @@
+"""A small local HTTP/JSON server for questions.
+
+Building a question can be slow - some modules retry sympy until they find nice numbers, others render plots - so
+the server keeps a queue of ready-made questions for every question module, topped up in the background by a pool
+of worker processes. A request is answered straight from a queue, and the generation happens off the request path.
+
+    python -m maths.api.server --port 8000
+
+    GET /modules                -- the names of the question modules
+    GET /question               -- a question from any module
+    GET /question/<module>      -- a question from a particular module
+    GET /retries                -- how many attempts the question generators' retry loops have taken, and how long
+"""
+
+from . import api
+from ..utils import retries
+from concurrent import futures
+import argparse
+import asyncio
+import functools
+import json
+import logging
+import random
+
+
+logger = logging.getLogger(__name__)
+
+# seconds to wait before building for a module again after a failure, doubling with each failure in a row
+FAILURE_BACKOFF = 1
+MAX_BACKOFF = 60
+
+# failures in a row after which a module is dropped, as it evidently can't be built
+MAX_FAILURES = 8
+
+# seconds a request waits for a ready-made question before one is built for it on the spot
+QUESTION_TIMEOUT = 10
+
+
+class QuestionServer:
+    """Serve questions over HTTP from per-module prefetch queues.
+
+    host -- the address to bind to, localhost unless you know better
+    port -- the port to listen on
+    prefetch -- how many ready-made questions to keep for each module
+    processes -- how many worker processes build questions, defaulting to one per core
+    time_limit -- the most seconds a worker spends building a question before trying another seed
+    timeout -- the most seconds a request waits for a ready-made question before one is built for it on the spot
+    """
+
+    def __init__(self, host='127.0.0.1', port=8000, prefetch=5, processes=None, time_limit=api.BACKGROUND_TIME_LIMIT,
+                 timeout=QUESTION_TIMEOUT):
+        self.host = host
+        self.port = port
+        self.prefetch = prefetch
+        self.processes = processes
+        self.timeout = timeout
+        self._build_question = functools.partial(api._build_question, time_limit=time_limit)
+
+        self.queues = {}
+        self._fillers = []
+        self._executor = None
+        self._server = None
+
+    async def start(self):
+        """Start filling the queues and start listening for requests.
+        """
+
+        self._executor = futures.ProcessPoolExecutor(max_workers=self.processes)
+
+        for module_name in api.registry.module_names():
+            self.queues[module_name] = asyncio.Queue(maxsize=self.prefetch)
+            self._fillers.append(asyncio.ensure_future(self._fill(module_name)))
+
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+
+    async def close(self):
+        """Stop listening for requests and stop building questions.
+        """
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+        for filler in self._fillers:
+            filler.cancel()
+        await asyncio.gather(*self._fillers, return_exceptions=True)
+
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def _build(self, module_name):
+        """Build a question from a module on a worker process.
+        """
+
+        loop = asyncio.get_running_loop()
+        job = (module_name, random.randrange(len(api.registry.trees(module_name))), random.getrandbits(32))
+
+        question, loop_counts = await loop.run_in_executor(self._executor, retries.collect, self._build_question, job)
+        retries.merge(loop_counts)
+
+        return question
+
+    async def _fill(self, module_name):
+        """Keep a module's queue topped up. Putting into a full queue waits until a request takes a question out.
+
+        After a failure the module waits before building again, longer after each failure in a row, and after
+        MAX_FAILURES in a row it is dropped.
+        """
+
+        queue = self.queues[module_name]
+
+        failures = 0
+        while True:
+            try:
+                question = await self._build(module_name)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # a question that can't be built shouldn't stop the module being served - try another seed
+                logger.exception('Could not build a question for: {0}'.format(module_name))
+
+                failures += 1
+                if failures >= MAX_FAILURES:
+                    logger.error('Dropping {0}, after {1} failures in a row'.format(module_name, failures))
+                    del self.queues[module_name]
+                    return
+
+                # back off, so a module that keeps failing doesn't keep the workers from the other modules
+                await asyncio.sleep(min(FAILURE_BACKOFF * 2 ** (failures - 1), MAX_BACKOFF))
+                continue
+
+            failures = 0
+            await queue.put(question)
+
+    async def question(self, module_name=None):
+        """Return a ready-made question, or if none is ready within the timeout, one built on the spot.
+        """
+
+        if module_name is None:
+            if not self.queues:
+                raise LookupError('There are no question modules left to serve')
+
+            ready = [name for name, queue in self.queues.items() if not queue.empty()]
+            module_name = random.choice(ready or list(self.queues))
+
+        queue = self.queues.get(module_name)
+        if queue is not None:
+            try:
+                return await asyncio.wait_for(queue.get(), self.timeout)
+            except asyncio.TimeoutError:
+                pass
+
+        return await self._build(module_name)
+
+    async def _respond(self, path):
+        """Return the status and JSON body for a request's path.
+        """
+
+        parts = [i for i in path.split('?', 1)[0].split('/') if i]
+
+        if parts == ['modules']:
+            return 200, list(self.queues)
+        elif parts == ['retries']:
+            return 200, [dict(loop, module=module_name, name=name)
+                         for (module_name, name), loop in sorted(retries.counts().items())]
+        elif parts == ['question'] or (len(parts) == 2 and parts[0] == 'question' and parts[1] in self.queues):
+            try:
+                return 200, await self.question(*parts[1:])
+            except Exception as e:
+                logger.exception('Could not serve a question for: {0}'.format(path))
+                return 503, {'error': 'Could not build a question: {0!r}'.format(e)}
+        else:
+            return 404, {'error': 'Not found: {0}'.format(path)}
+
+    async def _handle(self, reader, writer):
+        """Answer a single HTTP request, then close the connection.
+        """
+
+        try:
+            request_line = (await reader.readline()).decode('latin-1')
+            while (await reader.readline()) not in [b'\r\n', b'\n', b'']:  # the headers aren't needed
+                pass
+
+            try:
+                method, path, _ = request_line.split(' ', 2)
+            except ValueError:
+                status, body = 400, {'error': 'Malformed request line'}
+            else:
+                if method != 'GET':
+                    status, body = 405, {'error': 'Only GET is supported'}
+                else:
+                    status, body = await self._respond(path)
+
+            payload = json.dumps(body).encode('utf-8')
+            writer.write(
+                'HTTP/1.1 {status} {reason}\r\n'
+                'Content-Type: application/json\r\n'
+                'Content-Length: {length}\r\n'
+                'Connection: close\r\n'
+                '\r\n'.format(status=status, reason=_REASONS[status], length=len(payload)).encode('latin-1')
+            )
+            writer.write(payload)
+            await writer.drain()
+        finally:
+            writer.close()
+
+
+_REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    503: 'Service Unavailable',
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve questions over HTTP, with questions built ahead of time.')
+    parser.add_argument('--host', default='127.0.0.1', help='address to bind to (default: localhost)')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--prefetch', type=int, default=5, help='ready-made questions to keep for each module')
+    parser.add_argument('--processes', type=int, default=None, help='worker processes (default: one per core)')
+    parser.add_argument('--time-limit', type=float, default=api.BACKGROUND_TIME_LIMIT,
+                        help='seconds a worker spends on a question before trying another seed (default: %(default)s)')
+    parser.add_argument('--timeout', type=float, default=QUESTION_TIMEOUT,
+                        help='seconds a request waits for a ready-made question before one is built for it '
+                             '(default: %(default)s)')
+    args = parser.parse_args()
+
+    logging.basicConfig()
+
+    server = QuestionServer(args.host, args.port, args.prefetch, args.processes, args.time_limit, args.timeout)
+    asyncio.run(server.serve_forever())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+from maths.api import api
+from maths.utils import time_budget
+import os
+import pytest
+import random
+import types
+
+
+class _Reservoir:
+    def stocked_question(self, module_name, tree_index):
+        return {'question': 'stocked {0} {1}'.format(module_name, tree_index), 'solution': ''}
+
+
+@pytest.fixture
+def timing_out_registry(monkeypatch):
+    registry = api.QuestionRegistry()
+    registry._modules = {'slow': None}
+    registry._trees = {'slow': [None]}
+
+    def out_of_time(tree, module, seed, cache):
+        raise time_budget.BudgetExceeded('Ran out of time')
+
+    monkeypatch.setattr(registry, '_question', out_of_time)
+    monkeypatch.setattr(registry, 'candidates', lambda modules=None, part_classes=None: [('slow', 0)])
+    monkeypatch.setattr(api, 'registry', registry)
+
+    return registry
+
+
+def test_questions_that_run_out_of_time_come_from_the_reservoir(timing_out_registry):
+    assert api.random_question(_Reservoir(), seed=1, time_limit=1)['question'] == 'stocked slow 0'
+    assert [i['question'] for i in api.random_questions(2, seed=1, time_limit=1, reservoir=_Reservoir())] == \
+        ['stocked slow 0'] * 2
+
+
+def test_questions_that_run_out_of_time_without_a_reservoir_raise(timing_out_registry):
+    with pytest.raises(time_budget.BudgetExceeded):
+        api.random_questions(1, seed=1, time_limit=1)
+
+
+def test_seeded_questions_do_not_depend_on_the_directory_order(monkeypatch):
+    listing = ['/questions/{0}.py'.format(i) for i in ['alpha', 'beta', 'gamma', 'delta', '__init__', 'relationships']]
+
+    def import_question_modules(question_paths):
+        return [types.SimpleNamespace(__name__='maths.questions.' + os.path.splitext(os.path.basename(i))[0])
+                for i in question_paths]
+
+    monkeypatch.setattr(api, 'import_question_modules', import_question_modules)
+
+    chosen = set()
+    for order in range(5):
+        shuffled = random.Random(order).sample(listing, len(listing))
+        monkeypatch.setattr(api.glob, 'glob', lambda pattern: list(shuffled))
+
+        registry = api.QuestionRegistry('/questions')
+        monkeypatch.setattr(registry, 'question', lambda module_name, **kwargs: module_name)
+        chosen.add((tuple(registry.module_names()), registry.random_question(seed=1)))
+
+    assert chosen == {(('alpha', 'beta', 'delta', 'gamma'), registry.random_question(seed=1))}
+
+
+def test_modules_are_discovered_again_after_a_failed_import(monkeypatch):
+    imports = []
+
+    def import_question_modules(question_paths):
+        imports.append(question_paths)
+        if len(imports) == 1:
+            raise ImportError('a question module is broken')
+        return [types.SimpleNamespace(__name__='maths.questions.alpha')]
+
+    monkeypatch.setattr(api, 'import_question_modules', import_question_modules)
+    monkeypatch.setattr(api.glob, 'glob', lambda pattern: ['/questions/alpha.py'])
+
+    registry = api.QuestionRegistry('/questions')
+    with pytest.raises(ImportError):
+        registry.modules()
+
+    assert registry.module_names() == ['alpha']
+    assert len(imports) == 2
+
+
+def test_the_registry_lock_is_not_held_when_a_question_runs_out_of_time(timing_out_registry, monkeypatch):
+    held = []
+
+    def out_of_time(tree, module, seed, cache):
+        held.append(timing_out_registry._lock.locked())
+        raise time_budget.BudgetExceeded('Ran out of time')
+
+    monkeypatch.setattr(timing_out_registry, '_question', out_of_time)
+
+    with pytest.raises(time_budget.BudgetExceeded):
+        timing_out_registry.question('slow', seed=1, time_limit=1)
+
+    assert held == [False] * (api.TIMEOUT_RETRIES + 1)
@@ -0,0 +1,69 @@
+from maths.api import cache
+import importlib.util
+import types
+
+
+def _fake_maths(tmpdir):
+    root = tmpdir.mkdir('maths')
+    root.mkdir('latex').join('latex.py').write('# latex')
+    questions = root.mkdir('questions')
+    questions.join('relationships.py').write('# relationships')
+    questions.join('fake.py').write('# a question module')
+
+    return root
+
+
+def test_editing_relationships_changes_the_helpers_hash(tmpdir):
+    root = _fake_maths(tmpdir)
+    before = cache.helpers_hash(str(root))
+
+    root.join('questions', 'fake.py').write('# another question module')
+    cache.helpers_hash.cache_clear()
+    assert cache.helpers_hash(str(root)) == before
+
+    root.join('questions', 'relationships.py').write('# relationships, edited')
+    cache.helpers_hash.cache_clear()
+    assert cache.helpers_hash(str(root)) != before
+
+    cache.helpers_hash.cache_clear()
+
+
+def test_storing_questions_changes_the_key(tmpdir):
+    root = _fake_maths(tmpdir)
+    spec = importlib.util.spec_from_file_location('fake', str(root.join('questions', 'fake.py')))
+    module = importlib.util.module_from_spec(spec)
+    tree = types.SimpleNamespace(cls=cache.QuestionCache, seed=1)
+    question_cache = cache.QuestionCache(str(tmpdir.join('cache')))
+
+    keys = [question_cache.key(tree, module)]
+
+    banks = root.join('questions').mkdir('storage').mkdir('banks')
+    banks.join('fake_Fake.npy').write('a bank')
+    keys.append(question_cache.key(tree, module))
+
+    banks.join('fake_Fake.npy').write('another bank')
+    keys.append(question_cache.key(tree, module))
+
+    banks.join('other_Other.npy').write("another module's bank")
+    keys.append(question_cache.key(tree, module))
+
+    assert len(set(keys[:3])) == 3
+    assert keys[3] == keys[2]
+
+
+def test_questions_that_cannot_be_stored_are_still_built(tmpdir):
+    root = _fake_maths(tmpdir)
+    spec = importlib.util.spec_from_file_location('fake', str(root.join('questions', 'fake.py')))
+    module = importlib.util.module_from_spec(spec)
+    tree = types.SimpleNamespace(cls=cache.QuestionCache, seed=1)
+
+    # a file where the cache's directory should be can't be written to, even by root
+    tmpdir.join('cache').write('not a directory')
+    question_cache = cache.QuestionCache(str(tmpdir.join('cache')))
+    question_cache.put(tree, module, {'question': 'question', 'solution': 'solution'})
+    assert question_cache.get(tree, module) is None
+
+    question_cache = cache.QuestionCache(str(tmpdir.join('another cache')))
+    missing_figure = r'\includegraphics{{{0}}}'.format(tmpdir.join('figures', 'missing'))
+    question_cache.put(tree, module, {'question': missing_figure, 'solution': 'solution'})
+    assert question_cache.get(tree, module) is None
@@ -0,0 +1,42 @@
+from maths.api import api, reservoir
+from concurrent import futures
+import collections
+import pytest
+
+
+@pytest.fixture
+def question_reservoir(monkeypatch):
+    monkeypatch.setattr(api.registry, 'candidates', lambda modules=None: [('module', 0)])
+
+    question_reservoir = reservoir.QuestionReservoir(size=2)
+    yield question_reservoir
+    question_reservoir.close()
+
+
+def test_the_default_refill_is_in_another_process(question_reservoir):
+    assert isinstance(question_reservoir._executor, futures.ProcessPoolExecutor)
+
+
+def test_a_question_is_pending_until_it_is_in_stock(question_reservoir):
+    candidate = ('module', 0)
+    pending_when_stocked = []
+
+    class Stock(collections.deque):
+        def append(self, question):
+            pending_when_stocked.append(question_reservoir._pending[candidate])
+            super().append(question)
+
+    question_reservoir._stock[candidate] = Stock()
+    question_reservoir._pending[candidate] = 1
+
+    future = futures.Future()
+    future.set_result(({'question': 'q', 'solution': 's'}, {}))
+    question_reservoir._restock(candidate, future)
+
+    assert pending_when_stocked == [1]
+    assert question_reservoir._pending[candidate] == 0
+    assert list(question_reservoir._stock[candidate]) == [{'question': 'q', 'solution': 's'}]
+
+    # so a refill now only requests the one question missing
+    stocked, pending = len(question_reservoir._stock[candidate]), question_reservoir._pending[candidate]
+    assert question_reservoir.size - stocked - pending == 1
@@ -0,0 +1,59 @@
+from maths.api import api, server
+from concurrent import futures
+import asyncio
+import types
+import pytest
+
+
+@pytest.fixture
+def question_server(monkeypatch):
+    monkeypatch.setattr(api, 'registry', types.SimpleNamespace(trees=lambda module_name: [None]))
+    monkeypatch.setattr(server, 'FAILURE_BACKOFF', 0.001)
+
+    question_server = server.QuestionServer(timeout=0.05)
+    question_server._executor = futures.ThreadPoolExecutor(max_workers=1)
+    yield question_server
+    question_server._executor.shutdown()
+
+
+def _broken_build(job):
+    raise ValueError('Never builds')
+
+
+def test_modules_that_keep_failing_are_dropped(question_server):
+    builds = []
+
+    def build(job):
+        builds.append(job)
+        _broken_build(job)
+
+    question_server._build_question = build
+
+    async def fill():
+        question_server.queues['broken'] = asyncio.Queue()
+        await asyncio.wait_for(question_server._fill('broken'), 5)
+
+    asyncio.run(fill())
+
+    assert len(builds) == server.MAX_FAILURES
+    assert 'broken' not in question_server.queues
+
+
+def test_questions_are_built_on_the_spot_when_none_are_ready(question_server):
+    question_server._build_question = lambda job: {'question': job[0], 'solution': ''}
+
+    async def question():
+        question_server.queues['slow'] = asyncio.Queue()
+        return await question_server.question('slow')
+
+    assert asyncio.run(question())['question'] == 'slow'
+
+
+def test_questions_that_cannot_be_built_are_unavailable(question_server):
+    question_server._build_question = _broken_build
+
+    async def respond():
+        question_server.queues['broken'] = asyncio.Queue()
+        return await question_server._respond('/question/broken')
+
+    assert asyncio.run(respond())[0] == 503
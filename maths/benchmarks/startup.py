@@ -0,0 +1,235 @@
+"""Benchmarks for how long the entry points of the maths package take to start up.
+
+Each benchmark runs in a fresh interpreter, once cold - with nothing in the bytecode cache, so every module is
+compiled from source - and then warm, with the bytecode cached. For each run the wall time, the import time of every
+module imported and the peak resident memory are recorded.
+
+    python -m maths.benchmarks.startup                  -- run every benchmark and compare against the baselines
+    python -m maths.benchmarks.startup --save-baseline  -- run every benchmark and save the results as the baselines
+    python -m maths.benchmarks.startup exam api         -- only run benchmarks whose names start with these
+
+The comparison exits with a non-zero status if any benchmark is slower, or uses more memory, than its baseline by more
+than the threshold.
+"""
+
+import argparse
+import glob
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+benchmarks_path = os.path.split(os.path.abspath(__file__))[0]
+maths_path = os.path.split(benchmarks_path)[0]
+project_path = os.path.split(maths_path)[0]
+
+baselines_path = os.path.join(benchmarks_path, 'baselines.json')
+
+# printed by every benchmarked interpreter as it exits, so the parent can find the peak memory among the import times
+_MAX_RSS_MARKER = 'benchmark max rss:'
+_MAX_RSS_FOOTER = '''
+import resource, sys
+max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+sys.stderr.write('\\n{0}{{0}}\\n'.format(max_rss if sys.platform == 'darwin' else max_rss * 1024))
+'''.format(_MAX_RSS_MARKER)
+
+
+def benchmarks():
+    """Return a dict of benchmark name -> the Python code it runs.
+    """
+
+    exam_path = os.path.join(project_path, 'exam.py')
+
+    code = {
+        'exam': 'import runpy, sys\n'
+                'sys.argv = [{0!r}, "--seed", "0"]\n'
+                'runpy.run_path({0!r}, run_name="__main__")'.format(exam_path),
+        'api.random_question': 'from maths.api import api\n'
+                               'api.random_question(seed=0)',
+    }
+
+    for question_path in sorted(glob.glob(os.path.join(maths_path, 'questions', '*.py'))):
+        module_name = os.path.splitext(os.path.split(question_path)[1])[0]
+        if module_name not in ['__init__', 'relationships']:
+            code['import questions.' + module_name] = 'import maths.questions.{0}'.format(module_name)
+
+    return code
+
+
+def parse_import_times(output):
+    """Return a dict of module -> cumulative import time (in microseconds) from the output of `python -X importtime`.
+
+    >>> parse_import_times('import time: self [us] | cumulative | imported package\\n'
+    ...                    'import time:       120 |        150 |   maths.randomness\\n')
+    {'maths.randomness': 150}
+    """
+
+    import_times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:') or line.endswith('imported package'):
+            continue
+
+        self_time, cumulative_time, name = line.split(':', 1)[1].split('|')
+        import_times[name.strip()] = int(cumulative_time)
+
+    return import_times
+
+
+def run(code, pycache_prefix):
+    """Run some code in a fresh interpreter, returning its wall time, import times and peak memory.
+
+    pycache_prefix -- where the interpreter keeps its bytecode cache, so runs can be made cold or warm
+    """
+
+    env = dict(os.environ, PYTHONPATH=project_path)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)  # a warm run needs the bytecode the cold run wrote
+
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-X', 'pycache_prefix={0}'.format(pycache_prefix),
+         '-c', code + '\n' + _MAX_RSS_FOOTER],
+        cwd=pycache_prefix,  # exam.py writes exam.tex to the working directory, so keep it out of the project
+        env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True
+    )
+    wall_time = time.perf_counter() - start
+
+    result = {
+        'wall_time': wall_time,
+        'import_times_us': parse_import_times(process.stderr),
+    }
+
+    if process.returncode != 0:
+        result['error'] = process.stderr.strip().splitlines()[-1]
+    else:
+        max_rss_line = [i for i in process.stderr.splitlines() if i.startswith(_MAX_RSS_MARKER)][-1]
+        result['max_rss_bytes'] = int(max_rss_line[len(_MAX_RSS_MARKER):])
+
+    return result
+
+
+def run_benchmark(code, repeat=3):
+    """Return the cold and warm results of a benchmark, each the quickest of 'repeat' runs.
+    """
+
+    cold, warm = [], []
+    for i in range(repeat):
+        pycache_prefix = tempfile.mkdtemp(prefix='maths-benchmark-')
+        try:
+            cold.append(run(code, pycache_prefix))
+            warm.append(run(code, pycache_prefix))
+        finally:
+            shutil.rmtree(pycache_prefix, ignore_errors=True)
+
+    return {
+        'cold': min(cold, key=lambda result: result['wall_time']),
+        'warm': min(warm, key=lambda result: result['wall_time']),
+    }
+
+
+def compare(results, baselines, threshold=1.25):
+    """Return a list of regressions - descriptions of the results that are worse than their baseline by more than
+    the threshold, or that failed.
+
+    >>> baseline = {'exam': {'warm': {'wall_time': 1.0, 'max_rss_bytes': 100}}}
+    >>> compare({'exam': {'warm': {'wall_time': 1.1, 'max_rss_bytes': 100}}}, baseline)
+    []
+    >>> compare({'exam': {'warm': {'wall_time': 2.0, 'max_rss_bytes': 100}}}, baseline)
+    ['exam (warm): wall_time 1 -> 2 (2.00x)']
+    """
+
+    regressions = []
+    for name, result in sorted(results.items()):
+        for start in ['cold', 'warm']:
+            if start not in result:
+                continue
+
+            if 'error' in result[start]:
+                regressions.append('{0} ({1}): failed with {2}'.format(name, start, result[start]['error']))
+                continue
+
+            baseline = baselines.get(name, {}).get(start)
+            if baseline is None or 'error' in baseline:
+                continue
+
+            for measure in ['wall_time', 'max_rss_bytes']:
+                ratio = result[start][measure] / baseline[measure]
+                if ratio > threshold:
+                    regressions.append('{0} ({1}): {2} {3:g} -> {4:g} ({5:.2f}x)'.format(
+                        name, start, measure, baseline[measure], result[start][measure], ratio))
+
+    return regressions
+
+
+def report(name, result, top=5):
+    """Return a human readable summary of a benchmark's results, including its slowest imports.
+    """
+
+    lines = [name]
+    for start in ['cold', 'warm']:
+        if 'error' in result[start]:
+            lines.append('    {0}: failed with {1}'.format(start, result[start]['error']))
+            continue
+
+        lines.append('    {0}: {1:.3f}s, peak rss {2:.1f}MB'.format(
+            start, result[start]['wall_time'], result[start]['max_rss_bytes'] / 1024 ** 2))
+
+    import_times = result['cold']['import_times_us']
+    top_level = {module: us for module, us in import_times.items() if '.' not in module}
+    for module in sorted(top_level, key=top_level.get, reverse=True)[:top]:
+        lines.append('    import {0}: {1:.1f}ms (cold)'.format(module, top_level[module] / 1000))
+
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark how long the maths package takes to start up.')
+    parser.add_argument('names', nargs='*', help='only run benchmarks whose names start with one of these')
+    parser.add_argument('--repeat', type=int, default=3, help='runs of each benchmark, keeping the quickest')
+    parser.add_argument('--save-baseline', action='store_true', help='save the results as the new baselines')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='how many times worse than its baseline a benchmark can be before it is a regression')
+    parser.add_argument('--baselines', default=baselines_path, help='the JSON file baselines are kept in')
+    args = parser.parse_args()
+
+    results = {}
+    for name, code in benchmarks().items():
+        if args.names and not any(name.startswith(i) for i in args.names):
+            continue
+
+        results[name] = run_benchmark(code, args.repeat)
+        print(report(name, results[name]))
+
+    if args.save_baseline:
+        baselines = {}
+        if os.path.exists(args.baselines):
+            with open(args.baselines) as f:
+                baselines = json.load(f)
+
+        baselines.update(results)
+        with open(args.baselines, 'w') as f:
+            json.dump(baselines, f, indent=4, sort_keys=True)
+
+        print('Saved baselines to {0}'.format(args.baselines))
+        return
+
+    if not os.path.exists(args.baselines):
+        print('No baselines to compare against - save some with --save-baseline')
+        return
+
+    with open(args.baselines) as f:
+        regressions = compare(results, json.load(f), args.threshold)
+
+    for regression in regressions:
+        print('REGRESSION: ' + regression)
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
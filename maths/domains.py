@@ -1,19 +1,24 @@
+import functools
 import sympy
-import random
+from .utils import sampler
 
 
-def integer_domain(low=-5, high=5, minimum_distance=3):
+@functools.lru_cache(maxsize=None)
+def _bounds_sampler(low, high, minimum_distance):
+    """Return the sampler of the bounds of an integer domain - every pair of integers between low and high that are
+    at least minimum_distance apart.
+    """
+
+    return sampler.Sampler({'b1': range(low, high + 1), 'b2': range(low, high + 1)},
+                           lambda b1, b2: b1 + minimum_distance <= b2)
+
+
+def integer_domain(low=-5, high=5, minimum_distance=3, rng=None):
     """ Return a sympy.Interval domain with min/max bounds of input variables low and high.
 
-    The interval is chosen by selecting integers randomly: random.randint(low, high)
+    The interval is chosen uniformly from every interval with integer bounds that is at least minimum_distance long.
 
     """
 
-    while True:
-        b1 = random.randint(low, high)
-        b2 = random.randint(low, high)
-
-        if b1 + minimum_distance <= b2:
-            return sympy.Interval(b1, b2, False, False)
-        elif b2 + minimum_distance <= b1:
-            return sympy.Interval(b2, b1, False, False)
\ No newline at end of file
+    bounds = _bounds_sampler(low, high, minimum_distance).sample(rng)
+    return sympy.Interval(bounds['b1'], bounds['b2'], False, False)
@@ -0,0 +1,339 @@
+"""Compiling LaTeX documents of questions to PDFs.
+
+Every TeX run pays seconds of start up before it compiles a single page, so questions are compiled in batches - many
+questions in one document, one to a page - rather than one document each. When a batch fails to compile, it is split in
+half and each half compiled again, until the questions that fail have been found.
+
+TeX runs in a directory of its own, given to it as its working directory, so compiling never changes the working
+directory of this process and batches can be compiled side by side.
+
+Every document starts with the same preamble, and loading its packages is most of the work of compiling a short
+document. So the preamble is compiled once into a LaTeX format (a dump of TeX's memory once the preamble has been read)
+and documents are compiled from the format, with their copy of the preamble left out. The format is named after a hash
+of the preamble, latex.py and fillwithlines.sty, so it is rebuilt whenever any of them change.
+
+Documents that compile can also be kept in a CompileCache, so compiling the same document again - such as the same
+seeded questions in a later test run - copies out the PDF and log from last time instead of running TeX.
+"""
+
+import glob
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+from . import latex
+from .. import maths_path
+from ..api import cache
+from ..utils import disk_cache
+
+
+# engine -> the path of its preamble format, or None if it couldn't be built, once looked for in this process
+_preamble_formats = {}
+
+
+def document(pages):
+    """Return the LaTeX of a document with each of pages (LaTeX of their own, such as a question and its solution) on
+    a page of its own.
+    """
+
+    f = io.StringIO()
+
+    latex.begin_tex_document(f)
+    for page in pages:
+        f.write(page)
+        latex.new_page(f)
+    latex.end_tex_document(f)
+
+    return f.getvalue()
+
+
+def preamble():
+    """Return the LaTeX of the preamble every document starts with.
+    """
+
+    f = io.StringIO()
+    latex.preamble(f)
+    return f.getvalue()
+
+
+def _preamble_sources():
+    return [os.path.join(maths_path.maths_path(), 'latex', 'latex.py'),
+            os.path.join(maths_path.maths_path(), 'exams', 'fillwithlines.sty')]
+
+
+def format_directory():
+    """Return the directory preamble formats are kept in.
+    """
+
+    return os.path.join(disk_cache.default_directory(), 'latex-formats')
+
+
+def format_name(engine='xelatex'):
+    """Return the name of the preamble format for an engine, which changes whenever the preamble might.
+    """
+
+    digest = disk_cache.hash_key(preamble(), disk_cache.hash_files(_preamble_sources()))
+    return 'maths-preamble-{0}-{1}'.format(os.path.basename(engine), digest[:16])
+
+
+def build_format(engine='xelatex', directory=None):
+    """Compile the preamble into a format in directory (format_directory() by default), returning its path, or None if
+    the engine couldn't build it.
+
+    Formats of older preambles are removed.
+    """
+
+    if directory is None:
+        directory = format_directory()
+    os.makedirs(directory, exist_ok=True)
+
+    name = format_name(engine)
+    build_directory = tempfile.mkdtemp(prefix='format-', dir=directory)
+    try:
+        with open(os.path.join(build_directory, name + '.tex'), 'w') as f:
+            f.write(preamble() + r'\dump' + '\n')
+
+        # -ini with "&engine" starts from the engine's own LaTeX format, and \dump saves it with the preamble loaded
+        process = subprocess.run(
+            [engine, '-ini', '-interaction=batchmode', '-jobname=' + name, '&' + os.path.basename(engine),
+             name + '.tex'],
+            cwd=build_directory, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+
+        built_path = os.path.join(build_directory, name + '.fmt')
+        if process.returncode != 0 or not os.path.exists(built_path):
+            return None
+
+        # rename into place once it's complete, so no one compiles from a half-written format
+        format_path = os.path.join(directory, name + '.fmt')
+        os.replace(built_path, format_path)
+    finally:
+        shutil.rmtree(build_directory, ignore_errors=True)
+
+    old_formats = 'maths-preamble-{0}-*.fmt'.format(os.path.basename(engine))
+    for old_path in glob.glob(os.path.join(glob.escape(directory), old_formats)):
+        if old_path != format_path:
+            os.remove(old_path)
+
+    return format_path
+
+
+def preamble_format(engine='xelatex'):
+    """Return the path of the preamble format for an engine, building it if it hasn't been built, or None if it can't
+    be built.
+    """
+
+    if engine not in _preamble_formats:
+        format_path = os.path.join(format_directory(), format_name(engine) + '.fmt')
+        if not os.path.exists(format_path):
+            try:
+                format_path = build_format(engine)
+            except OSError:  # e.g. the engine isn't installed, or the cache directory can't be written to
+                format_path = None
+
+        _preamble_formats[engine] = format_path
+
+    return _preamble_formats[engine]
+
+
+class CompileCache:
+    """An on-disk cache of the PDFs and logs of documents that compiled.
+
+    A document is stored under a hash of its LaTeX, of the figures it includes, and of the preamble's sources and the
+    engine, so changing any of them compiles it again. Documents that fail aren't stored, as they may only fail
+    because of the TeX installation. The least recently used documents are evicted once the cache grows past max_bytes.
+
+    directory -- where caches are kept, defaulting to $MATHS_CACHE_DIR or ~/.cache/mathsexams
+    max_bytes -- how big the cache can grow
+    """
+
+    def __init__(self, directory=None, max_bytes=500 * 1024 ** 2):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @property
+    def _disk_cache(self):
+        return disk_cache.DiskCache('compiled', self.directory, self.max_bytes)
+
+    def key(self, tex, engine='xelatex'):
+        """Return the key the compiled tex is stored under.
+        """
+
+        # a figure that doesn't exist (yet) is hashed by its path alone
+        figures = [(path, disk_cache.hash_files([path]) if os.path.exists(path) else '')
+                   for path in cache.figure_paths(tex)]
+
+        return disk_cache.hash_key(tex, figures, disk_cache.hash_files(_preamble_sources()), os.path.basename(engine))
+
+    def get(self, tex, directory, name, engine='xelatex'):
+        """Copy the PDF and log of tex, if it is stored, to directory/<name>.pdf and .log, returning whether it was.
+        """
+
+        entry_path = self._disk_cache.get(self.key(tex, engine))
+        if entry_path is None:
+            return False
+
+        try:
+            for extension in ['.pdf', '.log']:
+                if os.path.exists(os.path.join(entry_path, 'document' + extension)):
+                    shutil.copyfile(os.path.join(entry_path, 'document' + extension),
+                                    os.path.join(directory, name + extension))
+        except OSError:
+            # the entry was evicted while it was being read
+            return False
+
+        return True
+
+    def put(self, tex, directory, name, engine='xelatex'):
+        """Store the PDF and log that compiling tex left in directory as <name>.pdf and .log.
+        """
+
+        files = {}
+        for extension in ['.pdf', '.log']:
+            output_path = os.path.join(directory, name + extension)
+            if os.path.exists(output_path):
+                with open(output_path, 'rb') as f:
+                    files['document' + extension] = f.read()
+
+        self._disk_cache.put(self.key(tex, engine), files)
+
+
+def compile_document(tex, directory, name, engine='xelatex', precompiled=True, compile_cache=None):
+    """Compile the LaTeX document tex to directory/<name>.pdf, returning whether it compiled.
+
+    If precompiled is True and the document starts with the usual preamble, it is compiled from the preamble format
+    instead, whenever the format can be built. If it fails with the format, it is compiled again in full before it is
+    counted as failing. The .tex, .log and .aux files are left in directory alongside the PDF.
+
+    compile_cache -- a CompileCache to copy the PDF and log out of instead, if the document has compiled before
+    """
+
+    if compile_cache is not None and compile_cache.get(tex, directory, name, engine):
+        with open(os.path.join(directory, name + '.tex'), 'w') as f:
+            f.write(tex)
+        return True
+
+    format_path = preamble_format(engine) if precompiled and preamble() in tex else None
+
+    compiled = _run_engine(tex, directory, name, engine, format_path)
+    if not compiled and format_path is not None:
+        # the document may only fail with the format, which is built in a way TeX doesn't guarantee - try it in full
+        compiled = _run_engine(tex, directory, name, engine, None)
+        if compiled:
+            # the format is at fault, so stop using it in this process
+            _preamble_formats[engine] = None
+
+    if compiled and compile_cache is not None:
+        compile_cache.put(tex, directory, name, engine)
+
+    return compiled
+
+
+def _run_engine(tex, directory, name, engine, format_path):
+    """Run the engine on tex, from the preamble format at format_path (leaving out tex's preamble) unless it is None,
+    returning whether it compiled.
+    """
+
+    command = [engine, '-halt-on-error', '-interaction=batchmode', '-output-directory', directory]
+    env = None
+
+    if format_path is not None:
+        tex = tex.replace(preamble(), '', 1)
+        command.append('-fmt=' + os.path.splitext(os.path.basename(format_path))[0])
+        # an empty entry on the end of the format search path keeps the engine's own formats on it
+        env = dict(os.environ, TEXFORMATS=os.path.dirname(format_path) + os.pathsep)
+
+    tex_path = os.path.join(directory, name + '.tex')
+    with open(tex_path, 'w') as f:
+        f.write(tex)
+
+    process = subprocess.run(
+        command + [tex_path],
+        cwd=directory, env=env, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+    return process.returncode == 0
+
+
+def compile_file(tex_path, engine='xelatex', compile_cache=None):
+    """Compile a .tex file to a PDF alongside it, returning whether it compiled. The .tex file itself is left as is.
+
+    If it doesn't compile, its log is left alongside it as well.
+    """
+
+    directory, file_name = os.path.split(os.path.abspath(tex_path))
+    name = os.path.splitext(file_name)[0]
+
+    with open(tex_path) as f:
+        tex = f.read()
+
+    build_directory = tempfile.mkdtemp(prefix='compile-', dir=directory)
+    try:
+        compiled = compile_document(tex, build_directory, name, engine, compile_cache=compile_cache)
+
+        for extension in ['.pdf'] if compiled else ['.log']:
+            output_path = os.path.join(build_directory, name + extension)
+            if os.path.exists(output_path):
+                os.replace(output_path, os.path.join(directory, name + extension))
+    finally:
+        shutil.rmtree(build_directory, ignore_errors=True)
+
+    return compiled
+
+
+def batch_name(start, stop):
+    """Return the name of the document of pages[start:stop], as compiled by failing_pages.
+
+    >>> batch_name(0, 4)
+    'pages-0-4'
+    """
+
+    return 'pages-{0}-{1}'.format(start, stop)
+
+
+def remove_outputs(directory, name):
+    """Remove every file compiling the document 'name' left in directory.
+    """
+
+    for path in glob.glob(os.path.join(glob.escape(directory), glob.escape(name) + '.*')):
+        os.remove(path)
+
+
+def failing_pages(pages, directory, engine='xelatex', compile_cache=None):
+    """Compile pages as one document in directory, returning the indexes of the pages that stop it compiling.
+
+    If the document fails, each half of the pages is compiled on its own, and so on down to the failing pages, so
+    finding k failing pages out of n takes about k * log2(n) extra compilations. Pages that only fail together are
+    returned together. Only the outputs of the smallest failing documents are left in directory - named by batch_name
+    - so their logs can be read. If every page compiles, the whole document's PDF is left in directory instead.
+    """
+
+    if compile_document(document(pages), directory, batch_name(0, len(pages)), engine, compile_cache=compile_cache):
+        return []
+
+    return _bisect(pages, directory, engine, compile_cache, 0)
+
+
+def _bisect(pages, directory, engine, compile_cache, start):
+    """Return the indexes of the pages that stop a document of pages (which has already failed) compiling.
+    """
+
+    if len(pages) == 1:
+        return [start]
+
+    middle = len(pages) // 2
+
+    failing = []
+    for half, half_start in [(pages[:middle], start), (pages[middle:], start + middle)]:
+        name = batch_name(half_start, half_start + len(half))
+        if compile_document(document(half), directory, name, engine, compile_cache=compile_cache):
+            remove_outputs(directory, name)
+        else:
+            failing.extend(_bisect(half, directory, engine, compile_cache, half_start))
+
+    if not failing:  # no page fails without the others
+        return list(range(start, start + len(pages)))
+
+    remove_outputs(directory, batch_name(start, start + len(pages)))
+    return failing
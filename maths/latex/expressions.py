@@ -1,5 +1,5 @@
 from ..symbols import x0, x1, x2, x
-from . import latex, solutions
+from . import latex, solutions, printer
 from ..utils import functions
 import sympy
 
@@ -11,7 +11,7 @@ def integral(lb, ub, expr, var=x):
     if expr.has(sympy.log):
         expr = expr.replace(sympy.log(x0), sympy.log(x0, evaluate=False))
 
-    return r'\displaystyle\int^{{{0}}}_{{{1}}} {2}\ d{3}'.format(sympy.latex(ub), sympy.latex(lb), sympy.latex(expr), sympy.latex(var))
+    return r'\displaystyle\int^{{{0}}}_{{{1}}} {2}\ d{3}'.format(printer.latex(ub), printer.latex(lb), printer.latex(expr), printer.latex(var))
 
 
 def integral_intermediate(lb, ub, expr, var=x):
@@ -24,7 +24,7 @@ def integral_intermediate(lb, ub, expr, var=x):
     if antideriv.has(sympy.log):
         antideriv = antideriv.replace(sympy.log(x0), sympy.log(sympy.Abs(x0), evaluate=False))
 
-    return r'\left[{0}\right]^{{{1}}}_{{{2}}}'.format(sympy.latex(antideriv), sympy.latex(ub), sympy.latex(lb))
+    return r'\left[{0}\right]^{{{1}}}_{{{2}}}'.format(printer.latex(antideriv), printer.latex(ub), printer.latex(lb))
 
 
 def integral_intermediate_eval(lb, ub, expr, var=x):
@@ -45,11 +45,11 @@ def integral_intermediate_eval(lb, ub, expr, var=x):
     right = antideriv.subs({var: lb})
 
     if isinstance(right, sympy.Add):  # an expression like (-1 + sqrt(3)/2) or (k + 1)
-        return r'{0} - ({1})'.format(sympy.latex(left), sympy.latex(right))
+        return r'{0} - ({1})'.format(printer.latex(left), printer.latex(right))
     elif right.could_extract_minus_sign():
-        return r'{0} - ({1})'.format(sympy.latex(left), sympy.latex(right))
+        return r'{0} - ({1})'.format(printer.latex(left), printer.latex(right))
     else:
-        return r'{0} - {1}'.format(sympy.latex(left), sympy.latex(right))
+        return r'{0} - {1}'.format(printer.latex(left), printer.latex(right))
 
 
 def integral_trifecta(lb, ub, expr, var=x):
@@ -91,10 +91,10 @@ def piecewise(func):
     lines = []
     for expr in func.args:
         if isinstance(expr[1], (sympy.StrictLessThan, sympy.LessThan, sympy.StrictGreaterThan, sympy.GreaterThan, sympy.And, sympy.Or)):
-            interval = sympy.latex(functions.relation_to_interval(expr[1]))
-            lines.append('\t' + r'{0} & \text{{for}}\: {1} \in {2}'.format(sympy.latex(expr[0]), func.free_symbols.pop(), interval) + '\n')
+            interval = printer.latex(functions.relation_to_interval(expr[1]))
+            lines.append('\t' + r'{0} & \text{{for}}\: {1} \in {2}'.format(printer.latex(expr[0]), func.free_symbols.pop(), interval) + '\n')
         else:
-            lines.append('\t' + r'{0} & \: \text{{otherwise}}'.format(sympy.latex(expr[0])) + '\n')
+            lines.append('\t' + r'{0} & \: \text{{otherwise}}'.format(printer.latex(expr[0])) + '\n')
 
         lines.append(latex.latex_newline())
 
@@ -118,7 +118,7 @@ def discrete_expectation_x_squared(prob_table):
     the expectation of a variable squared.
     """
 
-    return ' + '.join([r'{0}^2 \times {1}'.format(k, sympy.latex(v)) for k, v in prob_table.items()])
+    return ' + '.join([r'{0}^2 \times {1}'.format(k, printer.latex(v)) for k, v in prob_table.items()])
 
 
 def discrete_expectation_x(prob_table):
@@ -126,7 +126,7 @@ def discrete_expectation_x(prob_table):
     the expectation of a variable.
     """
 
-    return ' + '.join([r'{0} \times {1}'.format(k, sympy.latex(v)) for k, v in prob_table.items()])
+    return ' + '.join([r'{0} \times {1}'.format(k, printer.latex(v)) for k, v in prob_table.items()])
 
 
 def quadratic_formula(quadratic, var=x):
@@ -135,9 +135,9 @@ def quadratic_formula(quadratic, var=x):
     """
     match = quadratic.match(x0 * var ** 2 + x1 * var + x2)
 
-    a = r'({0})'.format(sympy.latex(match[x0])) if match[x0].could_extract_minus_sign() else sympy.latex(match[x0])
-    b = r'({0})'.format(sympy.latex(match[x1])) if match[x1].could_extract_minus_sign() else sympy.latex(match[x1])
-    c = r'({0})'.format(sympy.latex(match[x2])) if match[x2].could_extract_minus_sign() else sympy.latex(match[x2])
+    a = r'({0})'.format(printer.latex(match[x0])) if match[x0].could_extract_minus_sign() else printer.latex(match[x0])
+    b = r'({0})'.format(printer.latex(match[x1])) if match[x1].could_extract_minus_sign() else printer.latex(match[x1])
+    c = r'({0})'.format(printer.latex(match[x2])) if match[x2].could_extract_minus_sign() else printer.latex(match[x2])
 
     return r'\dfrac{{-{1} \pm \sqrt{{{1}^2 - 4 \times {0} \times {2}}}}}{{2 \times{0}}}'.format(a, b, c)
 
@@ -160,20 +160,20 @@ def shrink_solution_set(expr, domain, expr_equal_to=0, var=x):
 
     lines = solutions.Lines()
 
-    var_solutions_text = ', '.join([sympy.latex(i) for i in var_solutions])
+    var_solutions_text = ', '.join([printer.latex(i) for i in var_solutions])
     # HERE IS WHERE I WAS WORKING UP TO
-    lines += r'${0} = {1}$'.format(sympy.latex(var), var_solutions_text)
+    lines += r'${0} = {1}$'.format(printer.latex(var), var_solutions_text)
 
-    smaller_set_text = ', '.join([sympy.latex(i) for i in var_solutions if i in domain])
+    smaller_set_text = ', '.join([printer.latex(i) for i in var_solutions if i in domain])
 
     if isinstance(domain, sympy.Interval) and domain.left == -sympy.oo:
-        domain_text = r'{0} {1} {2}'.format(sympy.latex(var), r'\le' if domain.right_open else r'\lte', sympy.latex(domain.right))
+        domain_text = r'{0} {1} {2}'.format(printer.latex(var), r'\le' if domain.right_open else r'\lte', printer.latex(domain.right))
     elif isinstance(domain, sympy.Interval) and domain.right == sympy.oo:
-        domain_text = r'{0} {1} {2}'.format(sympy.latex(var), r'\ge' if domain.right_open else r'\gte', sympy.latex(domain.left))
+        domain_text = r'{0} {1} {2}'.format(printer.latex(var), r'\ge' if domain.right_open else r'\gte', printer.latex(domain.left))
     else:
-        domain_text = r'{0} \in {1}'.format(sympy.latex(var), sympy.latex(domain))
+        domain_text = r'{0} \in {1}'.format(printer.latex(var), printer.latex(domain))
 
-    lines += r'but ${0}$, so ${1} = {2}$'.format(domain_text, sympy.latex(var), smaller_set_text)
+    lines += r'but ${0}$, so ${1} = {2}$'.format(domain_text, printer.latex(var), smaller_set_text)
 
     return lines
 
@@ -192,22 +192,22 @@ def relation(interval_or_relation, var=x):
         raise NotImplementedError('unions are not yet supported')
 
     if interval.left == -sympy.oo and interval.right == sympy.oo:
-        return r'{0} < {1} < {2}'.format(sympy.latex(-sympy.oo), sympy.latex(var), sympy.latex(sympy.oo))
+        return r'{0} < {1} < {2}'.format(printer.latex(-sympy.oo), printer.latex(var), printer.latex(sympy.oo))
     elif interval.left == -sympy.oo:
         operator = r'<' if interval.right_open else r'\le'
-        return r'{0} {1} {2}'.format(sympy.latex(var), operator, sympy.latex(interval.right))
+        return r'{0} {1} {2}'.format(printer.latex(var), operator, printer.latex(interval.right))
     elif interval.right == sympy.oo:
         operator = r'>' if interval.left_open else r'\ge'
-        return r'{0} {1} {2}'.format(sympy.latex(var), operator, sympy.latex(interval.left))
+        return r'{0} {1} {2}'.format(printer.latex(var), operator, printer.latex(interval.left))
     else:
         left_operator = r'<' if interval.left_open else r'\le'
         right_operator = r'<' if interval.right_open else r'\le'
         return r'{0} {1} {2} {3} {4}'.format(
-            sympy.latex(interval.left),
+            printer.latex(interval.left),
             left_operator,
-            sympy.latex(var),
+            printer.latex(var),
             right_operator,
-            sympy.latex(interval.right)
+            printer.latex(interval.right)
         )
 
 
@@ -71,8 +71,11 @@ def begin(f):
     f.write(r'\begin{parts}' + '\n')
 
 
-def begin_tex_document(f):
-    f.write(r'\batchmode' + '\n')
+def preamble(f):
+    r"""Write everything that comes before \begin{document} - the same for every document, so it can be compiled into a
+    LaTeX format ahead of time (see compiler.preamble_format).
+    """
+
     document_class(f)
     f.write('\n')
     packages(f)
@@ -83,6 +86,11 @@ def begin_tex_document(f):
     f.write('\n')
     settings(f)
     f.write('\n')
+
+
+def begin_tex_document(f):
+    f.write(r'\batchmode' + '\n')
+    preamble(f)
     f.write(r'\scrollmode' + '\n')
     begin(f)
 
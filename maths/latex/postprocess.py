@@ -1,11 +1,12 @@
 import re
 import sympy
+from . import printer
 
 
 operators = r'[+-%/*]'
 
 def log(latex, base=sympy.E):
     latex = re.sub('log\\{\\\\left \\(([\w+-/*% ]*)\\\\right \\)\\}', r'log{\\left\\lvert {\1} \\right\\rvert }', latex)
-    latex = re.sub('log{', 'log_{{{0}}}{{'.format(sympy.latex(base)), latex)
+    latex = re.sub('log{', 'log_{{{0}}}{{'.format(printer.latex(base)), latex)
 
     return latex
@@ -0,0 +1,113 @@
+"""Printing sympy objects as LaTeX, remembering what has been printed.
+
+Rendering a question prints the same small objects - its equation, its domain, its probabilities - over and over, in
+its statement, its solution and the helpers they call, and sympy's printer starts from scratch every time. latex()
+prints like sympy.latex, but keeps the most recently printed objects and their LaTeX, so printing an object again is a
+dictionary lookup:
+
+    printer.latex(expr)                                      # sympy.latex(expr)
+    printer.latex(expr, printer=noevals.NoEvalLatexPrinter)  # noevals.latex(expr)
+
+Objects are remembered by their structure - each node's type as well as its value - rather than by equality, as
+objects that are equal can still print differently (1 and 1.0, or x + 1 and noevalAdd(x, 1)). Objects that can't be
+hashed, such as matrices, are printed every time.
+"""
+
+import collections
+import threading
+import sympy
+from sympy.printing.latex import LatexPrinter
+from ..utils import time_budget
+
+
+# how many objects' LaTeX to keep, the least recently printed being forgotten first
+MAXSIZE = 4096
+
+# (printer, settings, structure of the object) -> its LaTeX, the most recently printed last
+_printed = collections.OrderedDict()
+_lock = threading.Lock()
+_hits = 0
+_misses = 0
+
+
+class _Unhashable(Exception):
+    pass
+
+
+def _structure(obj):
+    """Return a hashable key that is only equal for objects of the same types with the same values, all the way down.
+    """
+
+    if isinstance(obj, sympy.Basic) and obj.args:
+        return type(obj), tuple(_structure(arg) for arg in obj.args)
+    elif isinstance(obj, (tuple, list)):
+        return type(obj), tuple(_structure(item) for item in obj)
+    elif isinstance(obj, dict):
+        return dict, tuple((_structure(key), _structure(value)) for key, value in obj.items())
+
+    try:
+        hash(obj)
+    except TypeError:
+        raise _Unhashable()
+
+    if isinstance(obj, sympy.Float):
+        # floats of different precisions can be equal, but print different numbers of digits
+        return type(obj), obj, obj._prec
+
+    return type(obj), obj
+
+
+def latex(expr, printer=LatexPrinter, **settings):
+    """Return the LaTeX of expr, as printed by printer with settings.
+
+    >>> x = sympy.Symbol('x')
+    >>> latex(x ** 2 / 2)
+    '\\\\frac{x^{2}}{2}'
+    >>> latex(1), latex(1.0)
+    ('1', '1.0')
+    """
+
+    global _hits, _misses
+
+    try:
+        key = (printer, tuple(sorted(settings.items())), _structure(expr))
+        hash(key)
+    except (_Unhashable, TypeError):
+        return printer(settings).doprint(expr)
+
+    with time_budget.uninterruptible(), _lock:
+        tex = _printed.get(key)
+        if tex is not None:
+            _printed.move_to_end(key)
+            _hits += 1
+            return tex
+
+        _misses += 1
+
+    tex = printer(settings).doprint(expr)
+
+    with time_budget.uninterruptible(), _lock:
+        _printed[key] = tex
+        while len(_printed) > MAXSIZE:
+            _printed.popitem(last=False)
+
+    return tex
+
+
+def cache_info():
+    """Return a dict of how many prints were looked up (hits) and printed (misses), and how many are kept (size).
+    """
+
+    with time_budget.uninterruptible(), _lock:
+        return {'hits': _hits, 'misses': _misses, 'size': len(_printed), 'maxsize': MAXSIZE}
+
+
+def cache_clear():
+    """Forget everything printed so far, and reset the counts.
+    """
+
+    global _hits, _misses
+
+    with time_budget.uninterruptible(), _lock:
+        _printed.clear()
+        _hits = _misses = 0
@@ -15,45 +15,66 @@ class Part(object):
 
 
     # does use the enumitem package, few hbox errors
-    def new_question_traversal_to_latex(self, obj, depth):
-        total_string = r'\item' + '\n'
+    def new_question_traversal(self, obj, depth):
+        yield r'\item' + '\n'
 
         if obj.question_statement and depth == 0:
-            total_string += r'$ $\newline' + '\n' + obj.question_statement + '\n'
+            yield r'$ $\newline' + '\n'
+            yield obj.question_statement
+            yield '\n'
         elif obj.question_statement:
-            total_string += obj.question_statement + '\n'
+            yield obj.question_statement
+            yield '\n'
         else:
-            total_string += r'$ $'
+            yield r'$ $'
 
         if obj.num_lines != 0:
-            total_string += r'\fillwithlines{{{0}in}}'.format(obj.num_lines / 4) + '\n'
+            yield r'\fillwithlines{{{0}in}}'.format(obj.num_lines / 4) + '\n'
 
         if obj.children:
-            total_string += r'\begin{parts}' + '\n' + '\n'.join(
-                        obj.new_question_traversal_to_latex(i, depth + 1) for i in obj.children) + r'\end{parts}' + '\n'
+            yield r'\begin{parts}' + '\n'
+            for index, child in enumerate(obj.children):
+                if index != 0:
+                    yield '\n'
+                yield from obj.new_question_traversal(child, depth + 1)
+            yield r'\end{parts}' + '\n'
 
-        return total_string + '\n'
+        yield '\n'
 
 
     # does use the enumitem package, few hbox errors
-    def new_solution_traversal_to_latex(self, obj, depth):
-        total_string = ''
+    def new_solution_traversal(self, obj, depth):
         if depth == 0:
-            total_string += r'\addtocounter{partsi}{-1}' + '\n'
-        total_string += r'\item' + '\n'
+            yield r'\addtocounter{partsi}{-1}' + '\n'
+        yield r'\item' + '\n'
 
         if obj.solution_statement and depth == 0:
-            total_string += r'$ $\newline' + '\n' + obj.solution_statement + '\n'
+            yield r'$ $\newline' + '\n'
+            yield obj.solution_statement
+            yield '\n'
         elif obj.solution_statement:
-            total_string += obj.solution_statement + '\n'
+            yield obj.solution_statement
+            yield '\n'
         else:
-            total_string += r'$ $'
+            yield r'$ $'
 
         if obj.children:
-            total_string += r'\begin{parts}' + '\n' + '\n'.join(
-                        obj.new_solution_traversal_to_latex(i, depth + 1) for i in obj.children) + r'\end{parts}' + '\n'
+            yield r'\begin{parts}' + '\n'
+            for index, child in enumerate(obj.children):
+                if index != 0:
+                    yield '\n'
+                yield from obj.new_solution_traversal(child, depth + 1)
+            yield r'\end{parts}' + '\n'
 
-        return total_string + '\n'
+        yield '\n'
+
+
+    def new_question_traversal_to_latex(self, obj, depth):
+        return ''.join(self.new_question_traversal(obj, depth))
+
+
+    def new_solution_traversal_to_latex(self, obj, depth):
+        return ''.join(self.new_solution_traversal(obj, depth))
 
 
     def _question_lines(self, depth, num_lines):
@@ -77,10 +98,12 @@ class QuestionTree(object):
                                 part.question_statement(), part.solution_statement(), part.num_lines, part.num_marks)
 
     def write_question(self, f):
-        f.write(self.root.new_question_traversal_to_latex(self.root, depth=0))
+        for chunk in self.root.new_question_traversal(self.root, depth=0):
+            f.write(chunk)
 
     def write_solution(self, f):
-        f.write(self.root.new_solution_traversal_to_latex(self.root, depth=0))
+        for chunk in self.root.new_solution_traversal(self.root, depth=0):
+            f.write(chunk)
 
     def question_latex(self):
         return self.root.new_question_traversal_to_latex(self.root, depth=0)
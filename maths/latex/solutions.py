@@ -1,5 +1,4 @@
-import sympy
-from . import latex
+from . import latex, printer
 
 
 class Lines:
@@ -30,8 +29,8 @@ def latexify_question_information(information):
 
     def question_statement(self):
         return r'Let $f:{domain} \rightarrow R$, where $f(x) = {equation}$. Find the inverse of $f$.'.format(
-            equation=sympy.latex(self._qp['equation']),
-            domain=sympy.latex(self._qp['domain'])
+            equation=printer.latex(self._qp['equation']),
+            domain=printer.latex(self._qp['domain'])
         )
 
     could be converted to
@@ -42,4 +41,4 @@ def latexify_question_information(information):
         )
     """
 
-    return {key: sympy.latex(value) for key, value in information.items()}
+    return {key: printer.latex(value) for key, value in information.items()}
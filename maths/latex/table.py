@@ -1,12 +1,12 @@
-import sympy
+from . import printer
 
 
 def probability_table(prob_table):
 
     try:
-        values = ' & '.join([sympy.latex(float(value)) for value in prob_table.values()])
+        values = ' & '.join([printer.latex(float(value)) for value in prob_table.values()])
     except:
-        values = ' & '.join([r'${0}$'.format(sympy.latex(value.together())) for value in prob_table.values()])
+        values = ' & '.join([r'${0}$'.format(printer.latex(value.together())) for value in prob_table.values()])
 
     return r'''
         \begin{{tabularx}}{{\textwidth}}{{ {0} }}
@@ -17,7 +17,7 @@ def probability_table(prob_table):
             \hline
         \end{{tabularx}}'''.format('|' + 'X|' * (len(prob_table) + 1),
                                     'x',
-                                    ' & '.join([sympy.latex(key) for key in list(prob_table.keys())]),
+                                    ' & '.join([printer.latex(key) for key in list(prob_table.keys())]),
                                     r'Pr(X = $x_{i}$)',
                                     values
                                 )
@@ -0,0 +1,169 @@
+from maths.latex import compiler
+import os
+import shutil
+import stat
+import sys
+import pytest
+
+
+# stands in for xelatex: "compiles" a document unless it includes a page containing BROKEN (or NO FORMAT, when it is
+# compiled from a format), logging its arguments,
+# and "builds" a format with -ini, counting its runs in the file 'runs' alongside it
+FAKE_ENGINE = '''#!{python}
+import os, sys
+with open(os.path.join(os.path.dirname(sys.argv[0]), 'runs'), 'a') as f:
+    f.write('run\\n')
+if '-ini' in sys.argv:
+    job_name = [argument for argument in sys.argv if argument.startswith('-jobname=')][0][len('-jobname='):]
+    with open(job_name + '.fmt', 'w') as f:
+        f.write('format')
+    sys.exit(0)
+tex_path = sys.argv[-1]
+with open(tex_path) as f:
+    tex = f.read()
+with open(os.path.splitext(tex_path)[0] + '.log', 'w') as f:
+    f.write(' '.join(sys.argv))
+if 'BROKEN' in tex or ('NO FORMAT' in tex and any(i.startswith('-fmt=') for i in sys.argv)):
+    sys.exit(1)
+with open(os.path.splitext(tex_path)[0] + '.pdf', 'w') as f:
+    f.write('pdf')
+'''
+
+
+@pytest.fixture
+def engine(tmpdir, monkeypatch):
+    path = str(tmpdir.join('fake-xelatex'))
+    with open(path, 'w') as f:
+        f.write(FAKE_ENGINE.format(python=sys.executable))
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+
+    # formats are built in a cache of the test's own
+    monkeypatch.setenv('MATHS_CACHE_DIR', str(tmpdir.join('cache')))
+    monkeypatch.setattr(compiler, '_preamble_formats', {})
+
+    return path
+
+
+def test_document_has_a_page_per_part():
+    tex = compiler.document(['first', 'second'])
+
+    assert tex.index('first') < tex.index('second')
+    assert tex.count(r'\newpage') == 2
+
+
+def test_a_compiling_batch(tmpdir, engine):
+    directory = str(tmpdir.mkdir('batch'))
+    cwd = os.getcwd()
+
+    assert compiler.failing_pages(['a', 'b', 'c'], directory, engine) == []
+    assert os.getcwd() == cwd
+    assert os.path.exists(os.path.join(directory, compiler.batch_name(0, 3) + '.tex'))
+
+
+def test_failing_pages_are_bisected(tmpdir, engine):
+    directory = str(tmpdir.mkdir('batch'))
+    pages = ['ok'] * 9
+    pages[2] = pages[7] = 'BROKEN'
+
+    assert compiler.failing_pages(pages, directory, engine) == [2, 7]
+
+    # only the failing pages' outputs are left to look at
+    assert sorted(os.listdir(directory)) == sorted(
+        compiler.batch_name(i, i + 1) + extension for i in [2, 7] for extension in ['.tex', '.log'])
+
+
+def test_documents_are_compiled_from_the_preamble_format(tmpdir, engine):
+    format_path = compiler.preamble_format(engine)
+    assert os.path.dirname(format_path) == compiler.format_directory()
+    assert os.listdir(compiler.format_directory()) == [os.path.basename(format_path)]
+
+    directory = str(tmpdir.mkdir('batch'))
+    assert compiler.compile_document(compiler.document(['page']), directory, 'document', engine)
+
+    with open(os.path.join(directory, 'document.tex')) as f:
+        tex = f.read()
+    assert compiler.preamble() not in tex and 'page' in tex
+
+    with open(os.path.join(directory, 'document.log')) as f:
+        assert '-fmt=' + compiler.format_name(engine) in f.read()
+
+
+def test_compile_file_leaves_the_tex_as_it_is(tmpdir, engine):
+    tex_path = str(tmpdir.join('exam.tex'))
+    with open(tex_path, 'w') as f:
+        f.write(compiler.document(['BROKEN']))
+
+    assert not compiler.compile_file(tex_path, engine)
+    with open(tex_path) as f:
+        assert f.read() == compiler.document(['BROKEN'])
+    assert sorted(os.listdir(str(tmpdir))) == sorted(['cache', 'exam.log', 'exam.tex', 'fake-xelatex', 'runs'])
+
+
+def _runs(tmpdir):
+    with open(str(tmpdir.join('runs'))) as f:
+        return len(f.readlines())
+
+
+def test_compiled_documents_are_cached(tmpdir, engine):
+    compile_cache = compiler.CompileCache(str(tmpdir.join('compiled')))
+    tex = compiler.document(['page'])
+
+    first, second = str(tmpdir.mkdir('first')), str(tmpdir.mkdir('second'))
+    assert compiler.compile_document(tex, first, 'document', engine, compile_cache=compile_cache)
+    runs = _runs(tmpdir)
+
+    assert compiler.compile_document(tex, second, 'document', engine, compile_cache=compile_cache)
+    assert _runs(tmpdir) == runs
+    for extension in ['.pdf', '.log']:
+        with open(os.path.join(first, 'document' + extension)) as f, \
+                open(os.path.join(second, 'document' + extension)) as g:
+            assert f.read() == g.read()
+
+    # a different document, or a failing one, is compiled every time - a failing one twice, once without the format
+    assert compiler.compile_document(compiler.document(['other']), second, 'other', engine,
+                                     compile_cache=compile_cache)
+    for i in range(2):
+        assert not compiler.compile_document(compiler.document(['BROKEN']), second, 'broken', engine,
+                                             compile_cache=compile_cache)
+    assert _runs(tmpdir) == runs + 1 + 2 * 2
+
+
+def test_the_cache_key_covers_figures(tmpdir):
+    compile_cache = compiler.CompileCache(str(tmpdir.join('compiled')))
+    figure_path = str(tmpdir.join('figure.eps'))
+    tex = compiler.document([r'\includegraphics{{{0}}}'.format(figure_path[:-len('.eps')])])
+
+    missing_key = compile_cache.key(tex)
+    tmpdir.join('figure.eps').write('first')
+    first_key = compile_cache.key(tex)
+    tmpdir.join('figure.eps').write('second')
+
+    assert len({missing_key, first_key, compile_cache.key(tex)}) == 3
+
+
+def test_documents_that_fail_with_the_format_are_compiled_in_full(tmpdir, engine):
+    directory = str(tmpdir.mkdir('batch'))
+    assert compiler.compile_document(compiler.document(['NO FORMAT']), directory, 'document', engine)
+
+    with open(os.path.join(directory, 'document.tex')) as f:
+        assert compiler.preamble() in f.read()
+
+    # and the format isn't used again
+    assert compiler.compile_document(compiler.document(['page']), directory, 'other', engine)
+    with open(os.path.join(directory, 'other.log')) as f:
+        assert '-fmt=' not in f.read()
+
+
+@pytest.mark.skipif(shutil.which('xelatex') is None, reason='xelatex is not installed')
+def test_xelatex_compiles_from_the_preamble_format(tmpdir, monkeypatch):
+    monkeypatch.setenv('MATHS_CACHE_DIR', str(tmpdir.join('cache')))
+    monkeypatch.setattr(compiler, '_preamble_formats', {})
+
+    assert compiler.preamble_format() is not None
+
+    directory = str(tmpdir.mkdir('batch'))
+    assert compiler.compile_document(compiler.document([r'$x^2$']), directory, 'document')
+    assert os.path.exists(os.path.join(directory, 'document.pdf'))
+    assert compiler.preamble_format() is not None  # compiled from the format, rather than in full after it failed
+
+    assert compiler.failing_pages([r'$x^2$', r'\undefinedcommand'], directory) == [1]
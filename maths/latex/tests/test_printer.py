@@ -0,0 +1,64 @@
+from .. import printer
+import sympy
+import pytest
+
+
+x = sympy.Symbol('x')
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    printer.cache_clear()
+    yield
+    printer.cache_clear()
+
+
+def test_prints_like_sympy():
+    for expr in [x ** 2 / 2, sympy.Interval(0, sympy.pi, True), sympy.Rational(3, 7), (1, x), 0.5]:
+        assert printer.latex(expr) == sympy.latex(expr)
+
+    assert printer.latex(x, mul_symbol='times') == sympy.latex(x, mul_symbol='times')
+
+
+def test_printing_again_is_a_hit():
+    printer.latex(sympy.sin(x) + 1)
+    printer.latex(sympy.sin(x) + 1)
+    printer.latex(sympy.sin(x) + 1, fold_short_frac=True)
+
+    info = printer.cache_info()
+    assert (info['hits'], info['misses'], info['size']) == (1, 2, 2)
+
+
+def test_equal_objects_of_different_types_are_printed_apart():
+    assert printer.latex(1) == '1'
+    assert printer.latex(1.0) == '1.0'
+    assert printer.latex((x, 2)) == sympy.latex((x, 2))
+    assert printer.latex((x, 2.0)) == sympy.latex((x, 2.0))
+    assert printer.cache_info()['hits'] == 0
+
+
+def test_floats_of_different_precisions_are_printed_apart():
+    for precision in [3, 30, 3]:
+        small = sympy.Float(2.0 ** -20, precision)
+        assert printer.latex(small) == sympy.latex(small)
+        assert printer.latex(x + small) == sympy.latex(x + small)
+
+
+def test_unhashable_objects_are_printed_every_time():
+    matrix = sympy.Matrix([1, 2])
+
+    assert printer.latex(matrix) == printer.latex(matrix) == sympy.latex(matrix)
+    assert printer.cache_info()['size'] == 0
+
+
+def test_the_least_recently_printed_are_forgotten(monkeypatch):
+    monkeypatch.setattr(printer, 'MAXSIZE', 2)
+
+    printer.latex(x)
+    printer.latex(x + 1)
+    printer.latex(x)
+    printer.latex(x + 2)
+
+    assert printer.cache_info()['size'] == 2
+    printer.latex(x)
+    assert printer.cache_info()['hits'] == 2
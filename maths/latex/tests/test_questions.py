@@ -0,0 +1,49 @@
+from .. import questions
+import io
+
+
+def example_part():
+    root = questions.Part('Find $x$.', 'x = 1', num_lines=4, num_marks=2)
+    root.add_child('a', 'sa', num_lines=2, num_marks=1)
+    root.add_child()
+    root.children[0].add_child('i', 'si', num_lines=1, num_marks=1)
+
+    return root
+
+
+def test_new_question_traversal_to_latex():
+    root = example_part()
+
+    assert root.new_question_traversal_to_latex(root, depth=0) == (
+        '\\item\n$ $\\newline\nFind $x$.\n\\fillwithlines{1.0in}\n'
+        '\\begin{parts}\n'
+        '\\item\na\n\\fillwithlines{0.5in}\n\\begin{parts}\n\\item\ni\n\\fillwithlines{0.25in}\n\n\\end{parts}\n\n'
+        '\n'
+        '\\item\n$ $\n'
+        '\\end{parts}\n\n'
+    )
+
+
+def test_new_solution_traversal_to_latex():
+    root = example_part()
+
+    assert root.new_solution_traversal_to_latex(root, depth=0) == (
+        '\\addtocounter{partsi}{-1}\n\\item\n$ $\\newline\nx = 1\n'
+        '\\begin{parts}\n'
+        '\\item\nsa\n\\begin{parts}\n\\item\nsi\n\n\\end{parts}\n\n'
+        '\n'
+        '\\item\n$ $\n'
+        '\\end{parts}\n\n'
+    )
+
+
+def test_streamed_traversal_matches_string():
+    root = example_part()
+
+    f = io.StringIO()
+    for chunk in root.new_question_traversal(root, depth=0):
+        f.write(chunk)
+    for chunk in root.new_solution_traversal(root, depth=0):
+        f.write(chunk)
+
+    assert f.getvalue() == root.new_question_traversal_to_latex(root, 0) + root.new_solution_traversal_to_latex(root, 0)
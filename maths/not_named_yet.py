@@ -1,13 +1,13 @@
-import random
 import sympy
+from . import randomness
 from sympy.abc import *
 
 
-def randint_no_zero(low, high):
-    return randint(low, high, exclude=[0])
+def randint_no_zero(low, high, rng=None):
+    return randint(low, high, exclude=[0], rng=rng)
 
 
-def randint(low, high, exclude=[]):
+def randint(low, high, exclude=[], rng=None):
     """ Return a number in the range (low, high), except for the numbers in exclude.
     """
 
@@ -16,7 +16,7 @@ def randint(low, high, exclude=[]):
     for num in exclude:
         nums.remove(num)
 
-    return random.choice(nums)
+    return randomness.resolve(rng).choice(nums)
 
 
 def add_log_abs(function):
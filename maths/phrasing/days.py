@@ -1,4 +1,4 @@
-import random
+from ..randomness import random
 
 
 days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
@@ -1,6 +1,6 @@
 import pickle
 import os
-import random
+from ..randomness import random
 
 
 def full_path():
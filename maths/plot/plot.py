@@ -1,12 +1,11 @@
 import sympy
-import numpy
 from ..symbols import *
 from .. import maths_path
 
-from matplotlib.transforms import BlendedGenericTransform
-from mpl_toolkits.axes_grid.axislines import SubplotZero
-import matplotlib.pyplot as plt
+# numpy and matplotlib are imported inside the functions that plot - they are slow to import and most questions
+# never plot anything
 
+from ..randomness import random
 import re
 import uuid
 import os
@@ -42,6 +41,7 @@ def asymptote_proof(array):
     '''
     Takes a numpy.ndarray and asymptote-proofs the values so we don't plot over asymptotes.
     '''
+    import numpy
 
     threshold = 1000
     array[array > threshold] = numpy.inf
@@ -73,6 +73,10 @@ def latex(path):
 
 
 def _blank_plot(domain, ran):
+    from matplotlib.transforms import BlendedGenericTransform
+    from mpl_toolkits.axes_grid.axislines import SubplotZero
+    import matplotlib.pyplot as plt
+
     # make the plot
     fig = plt.figure(1)
     ax = SubplotZero(fig, 111)
@@ -113,8 +117,11 @@ def _blank_plot(domain, ran):
 
 
 def _save_plot():
+    import matplotlib.pyplot as plt
+
     # save the image and return the path name so the caller can include it in the latex
-    uid = uuid.uuid1()
+    # the name is drawn from the seeded random state, so the same seed always references the same figure
+    uid = uuid.UUID(int=random.getrandbits(128), version=4)
 
 
     plot_path = os.path.join(maths_path.maths_path(), 'exams', 'figures', str(uid) + '.eps')
@@ -132,6 +139,9 @@ def blank_plot(domain, ran):
 
 
 def plot(expr, plot_domain, plot_range, expr_domain=None):
+    import numpy
+    import matplotlib.pyplot as plt
+
     if len(expr.atoms(sympy.Symbol)) != 1:
         raise ValueError(r'The supplied expression, {0}, must rely on only one symbol.'.format(expr))
     else:
@@ -1,16 +1,21 @@
 from ...relations.trigonometry import trig
 import sympy
-import random
+from ...randomness import random
+from ...utils import sampler
+
+
+# the curves of cdf, which can be any but the plain sin(x) and cos(x), so are sampled by rejection
+_plain_curves = [sympy.sin(sympy.Symbol('x')), sympy.cos(sympy.Symbol('x'))]
+_curve_sampler = sampler.Sampler({'y': lambda rng: trig.Trig(1, exclude=['tan'], rng=rng)},
+                                 lambda y: y.equation not in _plain_curves)
+
 
 class cdf(object):
     def __init__(self):
         
         x = sympy.Symbol('x')
         k = sympy.Symbol('k')
-        while True:
-            y = trig.Trig(1, exclude = ['tan'])
-            if y.equation not in [sympy.sin(x), sympy.cos(x)]:
-                break        
+        y = _curve_sampler.sample()['y']
 
         self.lower_bound = y.general_solutions[0].subs(k, 0)
         self.upper_bound = y.general_solutions[0].subs(k, 1)
@@ -18,12 +23,8 @@ class cdf(object):
 
         choices = trig.domain(self.equation, self.lower_bound, self.upper_bound)
         
-        while True:
-            self.integral_lower_bound = random.sample(choices, 1)[0]
-            self.integral_middle_bound = random.sample(choices, 1)[0]
-            self.integral_upper_bound = random.sample(choices, 1)[0]
-            if self.integral_lower_bound < self.integral_middle_bound < self.integral_upper_bound:
-                break
+        # any 3 of the choices, in order - as likely as drawing 3 until they happen to be in order, without the redraws
+        self.integral_lower_bound, self.integral_middle_bound, self.integral_upper_bound = sorted(random.sample(choices, 3))
     
         print(self.equation)
         print(self.integral_lower_bound, self.equation.subs(x, self.integral_lower_bound))
@@ -1,4 +1,4 @@
-import random
+from ...randomness import random
 import itertools
 import operator
 from functools import reduce
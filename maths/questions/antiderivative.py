@@ -1,7 +1,7 @@
 import sympy
-import random
+from ..randomness import random
 from .. import all_functions, not_named_yet
-from ..latex import solutions
+from ..latex import solutions, printer
 from ..symbols import x0
 from . import relationships
 
@@ -53,7 +53,7 @@ class Antiderivative(relationships.QuestionPart):
 
     def question_statement(self):
         return 'Find an antiderivative of ${equation}$ with respect to $x$.'.format(
-            equation=sympy.latex(self._qp['equation'])
+            equation=printer.latex(self._qp['equation'])
         )
 
     def solution_statement(self):
@@ -66,7 +66,7 @@ class Antiderivative(relationships.QuestionPart):
 
         # without using .factor() here, we could have (x + 1)**(-3) integrate to -1/(2*x**2 + 4*x + 2) which is expanded
         antiderivative = proper_antiderivative.factor() + constant_of_integration
-        lines += r'${antiderivative}$'.format(antiderivative=sympy.latex(antiderivative))
+        lines += r'${antiderivative}$'.format(antiderivative=printer.latex(antiderivative))
         lines += r'We arbitrarily choose our constant of integration to be ${constant_of_integration}$. It can be any real number, including zero.'.format(
             constant_of_integration=constant_of_integration
         )
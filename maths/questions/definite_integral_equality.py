@@ -1,8 +1,8 @@
 import sympy
-import random
+from ..randomness import random
 from ..symbols import x0, x1, x
 from .. import all_functions, not_named_yet
-from ..latex import latex, expressions, solutions
+from ..latex import latex, expressions, solutions, printer
 from ..utils import noevals
 from . import relationships
 
@@ -60,7 +60,7 @@ class DefiniteIntegralEquality(relationships.QuestionPart):
         integral = expressions.integral(lb=self._qp['boundary'].left, ub=self._qp['boundary'].right, expr=self._qp['equation'])
         return r'Find p given that ${integral} = {result}$'.format(
             integral=integral,
-            result=sympy.latex(self._qp['variable_expression'])
+            result=printer.latex(self._qp['variable_expression'])
         )
 
     def solution_statement(self):
@@ -79,11 +79,11 @@ class DefiniteIntegralEquality(relationships.QuestionPart):
         force_real_numbers = self._qp['equation'].integrate().replace(sympy.log(x0), sympy.log(sympy.Abs(x0)))
         integral_value = force_real_numbers.subs({x: self._qp['boundary'].right}) - force_real_numbers.subs({x: self._qp['boundary'].left})
         lines += r'$= {result}$'.format(
-            result=sympy.latex(not_named_yet.soft_logcombine(integral_value))
+            result=printer.latex(not_named_yet.soft_logcombine(integral_value))
         )
 
         lines += r'$\therefore p = {p_value}.$'.format(
-            p_value=sympy.latex(self._qp['answer'])
+            p_value=printer.latex(self._qp['answer'])
         )
 
         return lines.write()
@@ -1,8 +1,7 @@
 import sympy
-import random
-from ..latex import solutions, expressions
+from ..randomness import random
+from ..latex import solutions, expressions, printer
 from ..phrasing import item_position, items
-import copy
 import functools
 import operator
 import itertools
@@ -69,7 +68,7 @@ class SpecificPermutation(relationships.QuestionPart):
     def __init__(self, part):
         self.num_lines, self.num_marks = 4, 1
 
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
     def question_statement(self):
         self._qp['choices'] = random.sample(self._qp['items'], self._qp['n_selections'])
@@ -91,14 +90,14 @@ class SpecificPermutation(relationships.QuestionPart):
             probability = sympy.Rational(1, n_items - n_already_chosen)
             fractions.append(probability)
 
-        probabilities_multiplied = r' \times '.join(map(sympy.latex, fractions))
+        probabilities_multiplied = r' \times '.join(map(printer.latex, fractions))
 
         answer = functools.reduce(operator.mul, fractions)
 
         lines += r'$Pr({probabilities_union}) = {probabilities_multiplied} = {answer}$'.format(
             probabilities_union=probabilities_union,
             probabilities_multiplied=probabilities_multiplied,
-            answer=sympy.latex(answer)
+            answer=printer.latex(answer)
         )
 
         return lines.write()
@@ -179,7 +178,7 @@ class Sum(relationships.QuestionPart, DiscreteSum):
 
     def __init__(self, part):
         self.num_lines, self.num_marks = 5, 1
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
         self._qp['sum'] = random.choice(self.appropriate_sums())
 
@@ -203,7 +202,7 @@ class Sum(relationships.QuestionPart, DiscreteSum):
         probability_of_a_single_combination = self.single_combination_probability()
         prob_instance = r'{n_valid_permutations} \times {probability_of_a_single_combination}'.format(
             n_valid_permutations=math.factorial(self._qp['n_selections']),
-            probability_of_a_single_combination=sympy.latex(probability_of_a_single_combination)
+            probability_of_a_single_combination=printer.latex(probability_of_a_single_combination)
         )
 
         # e.g. = 6 * (1/120) + 6 * (1/120)
@@ -213,7 +212,7 @@ class Sum(relationships.QuestionPart, DiscreteSum):
 
         answer = probability_of_a_single_combination * math.factorial(self._qp['n_selections']) * len(valid_total_sum_combinations)
         # e.g. = 1/20
-        lines += r'$= {answer}$'.format(answer=sympy.latex(answer))
+        lines += r'$= {answer}$'.format(answer=printer.latex(answer))
 
         return lines.write()
 
@@ -233,7 +232,7 @@ class ConditionalSum(relationships.QuestionPart, DiscreteSum):
     """
 
     def __init__(self, part):
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
         self.num_lines, self.num_marks = (4, 1) if self._qp['n_selections'] == 2 else (5, 2)
 
         self._qp['sum'] = random.choice(self.appropriate_sums())
@@ -273,7 +272,7 @@ class ConditionalSum(relationships.QuestionPart, DiscreteSum):
         # e.g. = 6 * (1/120) + 6 * (1/120)
         prob_instance = r'{n_permutations} \times {probability_of_combination}'.format(
             n_permutations=math.factorial(self._qp['n_selections']),
-            probability_of_combination=sympy.latex(probability_of_a_single_combination)
+            probability_of_combination=printer.latex(probability_of_a_single_combination)
         )
         lines += r'$= {probabilities}$'.format(
             probabilities=' + '.join([prob_instance] * len(valid_total_sum_combinations))
@@ -281,7 +280,7 @@ class ConditionalSum(relationships.QuestionPart, DiscreteSum):
 
         given_result = probability_of_a_single_combination * math.factorial(self._qp['n_selections']) * len(valid_total_sum_combinations)
         # e.g. = 1/10
-        lines += r'$= {givee_result}$'.format(givee_result=sympy.latex(given_result))
+        lines += r'$= {givee_result}$'.format(givee_result=printer.latex(given_result))
 
         ball_permutations = itertools.permutations(self._qp['items'], self._qp['n_selections'])
         valid_ball_permutations = [i for i in ball_permutations if sum(i) == self._qp['sum']]
@@ -295,7 +294,7 @@ class ConditionalSum(relationships.QuestionPart, DiscreteSum):
 
         # e.g. = 1/30
         givee_result = probability_of_a_single_combination * len(valid_givee_permutations)
-        lines += r'$= {givee_result}$'.format(givee_result=sympy.latex(givee_result))
+        lines += r'$= {givee_result}$'.format(givee_result=printer.latex(givee_result))
 
         givee_event = 'ball_{ball_index} = {ball_value}'.format(**self._qp)
         given_event = 'sum = {sum}'.format(**self._qp)
@@ -310,9 +309,9 @@ class ConditionalSum(relationships.QuestionPart, DiscreteSum):
             givee_event=givee_event,
             given_event=given_event,
             conditional_probability=conditional_probability,
-            givee_result=sympy.latex(givee_result),
-            given_result=sympy.latex(given_result),
-            answer=sympy.latex(givee_result / given_result)
+            givee_result=printer.latex(givee_result),
+            given_result=printer.latex(given_result),
+            answer=printer.latex(givee_result / given_result)
         )
 
         return lines.write()
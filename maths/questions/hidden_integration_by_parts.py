@@ -1,9 +1,8 @@
 import sympy
-import random
+from ..randomness import random
 from ..symbols import x
-from ..latex import solutions, expressions
+from ..latex import solutions, expressions, printer
 from ..utils import sensible_values
-import copy
 from . import relationships
 
 
@@ -46,7 +45,7 @@ class HiddenIntegrationByParts(relationships.QuestionPart):
                 self._qp['other_deriv_part'] = product_rule_half
 
     def question_statement(self):
-        return r'''Let $f(x) = {0}$.'''.format(sympy.latex(self._qp['equation']))
+        return r'''Let $f(x) = {0}$.'''.format(printer.latex(self._qp['equation']))
 
 
 @relationships.is_child_of(HiddenIntegrationByParts)
@@ -67,7 +66,7 @@ class Derivative(relationships.QuestionPart):
 
     def __init__(self, part):
         self.num_lines, self.num_marks = 3, 1
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
     def question_statement(self):
         return r'''Find $f'(x)$.'''
@@ -76,7 +75,7 @@ class Derivative(relationships.QuestionPart):
         lines = solutions.Lines()
 
         # e.g. f'(x) = 2 * x * log(x) + x
-        lines += r'''$f'(x) = {0}$'''.format(sympy.latex(self._qp['equation'].diff()))
+        lines += r'''$f'(x) = {0}$'''.format(printer.latex(self._qp['equation'].diff()))
 
         return lines.write()
 
@@ -99,7 +98,7 @@ class Integration(relationships.QuestionPart):
 
     def __init__(self, part):
         self.num_lines, self.num_marks = 12, 3
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
         domain = sympy.Interval(-2 * sympy.pi, 2 * sympy.pi)
         bounds = sensible_values.integral_domain(self._qp['equation'], domain)
@@ -122,8 +121,8 @@ class Integration(relationships.QuestionPart):
         hidden_objective_equivalent = (f_ - self._qp['other_deriv_part']) / self._qp['hidden_objective_coefficient']
         # e.g. x*log(x) = f'(x)/2 - x/2
         lines += r'${hidden_objective} = {hidden_objective_equivalent}$'.format(
-            hidden_objective=sympy.latex(self._qp['hidden_objective']),
-            hidden_objective_equivalent=sympy.latex(hidden_objective_equivalent)
+            hidden_objective=printer.latex(self._qp['hidden_objective']),
+            hidden_objective_equivalent=printer.latex(hidden_objective_equivalent)
         )
 
         # e.g. integral(x*log(x), e^(-4), e^(3)) = integral(f'(x)/2 - x/2, e^(-4), e^(3))
@@ -135,9 +134,9 @@ class Integration(relationships.QuestionPart):
         hidden_objective_equivalent_antiderivative = (f - self._qp['other_deriv_part'].integrate()) / self._qp['hidden_objective_coefficient']
         # e.g. = [f(x)/2 - (x^2)/4](e^(-4), e^3)
         lines += r'$= \left[{expression}\right]^{{{upper_bound}}}_{{{lower_bound}}}$'.format(
-            expression=sympy.latex(hidden_objective_equivalent_antiderivative),
-            lower_bound=sympy.latex(self._qp['domain'].left),
-            upper_bound=sympy.latex(self._qp['domain'].right)
+            expression=printer.latex(hidden_objective_equivalent_antiderivative),
+            lower_bound=printer.latex(self._qp['domain'].left),
+            upper_bound=printer.latex(self._qp['domain'].right)
         )
 
         hidden_objective_equivalent_derivative = hidden_objective_equivalent.subs({f_: self._qp['equation'].diff()})
@@ -156,7 +155,7 @@ class Integration(relationships.QuestionPart):
 
         # e.g. = (-9) / (4e^8) + 5e^6 / 4
         lines += r'''$= {answer}$'''.format(
-            answer=sympy.latex(self._qp['answer'])
+            answer=printer.latex(self._qp['answer'])
         )
 
         return lines.write()
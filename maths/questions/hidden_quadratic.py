@@ -1,7 +1,7 @@
 import sympy
-import random
+from ..randomness import random
 from ..symbols import x
-from ..latex import solutions, expressions
+from ..latex import solutions, expressions, printer
 from . import relationships
 
 
@@ -31,7 +31,7 @@ class HiddenQuadratic(relationships.QuestionPart):
 
     def question_statement(self):
         return r'Solve ${equation}$ for $x$.'.format(
-            equation=sympy.latex(self._qp['equation'])
+            equation=printer.latex(self._qp['equation'])
         )
 
     def solution_statement(self):
@@ -39,30 +39,30 @@ class HiddenQuadratic(relationships.QuestionPart):
 
         X = sympy.Symbol('X')
         lines += r'Let $X = {exp_of_x}$'.format(
-            exp_of_x=sympy.latex(sympy.exp(x))
+            exp_of_x=printer.latex(sympy.exp(x))
         )
 
         hidden_quadratic = self._qp['equation'].replace(sympy.exp(x), X). replace(sympy.exp(2 * x), X ** 2)
         lines += r'$\therefore {equation} = {hidden_quadratic}$'.format(
-            equation=sympy.latex(self._qp['equation']),
-            hidden_quadratic=sympy.latex(hidden_quadratic)
+            equation=printer.latex(self._qp['equation']),
+            hidden_quadratic=printer.latex(hidden_quadratic)
         )
 
         lines += r'$= {factorised_hidden_quadratic}$'.format(
-            factorised_hidden_quadratic=sympy.latex(hidden_quadratic.factor())
+            factorised_hidden_quadratic=printer.latex(hidden_quadratic.factor())
         )
 
         lines += expressions.shrink_solution_set(expr=hidden_quadratic, domain=sympy.Interval(0, sympy.oo), var=X)
 
         valid_solution = [i for i in sympy.solve(hidden_quadratic) if i > 0][0]
         lines += r'${exp_of_x} = {valid_solution}$'.format(
-            exp_of_x=sympy.latex(sympy.exp(x)),
+            exp_of_x=printer.latex(sympy.exp(x)),
             valid_solution=valid_solution
         )
 
         answer = sympy.log(valid_solution)
         lines += r'$x = {answer}$'.format(
-            answer=sympy.latex(answer)
+            answer=printer.latex(answer)
         )
 
         return lines.write()
@@ -1,10 +1,9 @@
 import sympy
-import random
+from ..randomness import random
 from ..symbols import x
 from .. import not_named_yet
-from ..latex import solutions, expressions
+from ..latex import solutions, expressions, printer
 from ..utils import noevals, functions
-import copy
 import decimal
 from . import relationships
 
@@ -56,21 +55,21 @@ class LinearApproximation(relationships.QuestionPart):
     def __init__(self, part):
         self.num_lines, self.num_marks = 7, 4
 
-        self._qp = copy.deepcopy(part._qp)
-        self._qi = copy.deepcopy(part._qi)
+        self._qp = relationships.copy_parameters(part._qp)
+        self._qi = relationships.copy_parameters(part._qi)
 
     def question_statement(self):
         f_of_new_location = self._qi['noeval_equation'].subs({x: self._qp['new_location']})
         return r'''Use the relationship $f(x + h) \approx f(x) + h f'(x)$ for a small positive value of h,
-            to find an approximate value for ${f_of_new_location}$.'''.format(f_of_new_location=sympy.latex(f_of_new_location))
+            to find an approximate value for ${f_of_new_location}$.'''.format(f_of_new_location=printer.latex(f_of_new_location))
 
     def solution_statement(self):
         lines = solutions.Lines()
 
         derivative = self._qp['equation'].diff()
         lines += r'''$y = {equation}, y' = {derivative}$'''.format(
-            equation=sympy.latex(self._qp['equation']),
-            derivative=sympy.latex(derivative)
+            equation=printer.latex(self._qp['equation']),
+            derivative=printer.latex(derivative)
         )
 
         original_y_coordinate = self._qp['equation'].subs({x: self._qp['location']})
@@ -82,7 +81,7 @@ class LinearApproximation(relationships.QuestionPart):
         derivative_at_original_location = derivative.subs({x: self._qp['location']})
         lines += r'''$y'({original_x_coordinate}) = {derivative_at_original_location}$'''.format(
             original_x_coordinate=self._qp['location'],
-            derivative_at_original_location=sympy.latex(derivative_at_original_location)
+            derivative_at_original_location=printer.latex(derivative_at_original_location)
         )
 
         unevaluated_approximation_of_answer = noevals.noevalAdd(original_y_coordinate, noevals.noevalMul(self._qp['delta'], derivative_at_original_location))
@@ -90,7 +89,7 @@ class LinearApproximation(relationships.QuestionPart):
         lines += r'$\therefore y({new_x_coordinate}) \approx {unevaluated_approximation_of_answer} = {answer}$'.format(
             new_x_coordinate=self._qp['new_location'],
             unevaluated_approximation_of_answer=noevals.latex(unevaluated_approximation_of_answer),
-            answer=sympy.latex(answer)
+            answer=printer.latex(answer)
         )
 
         return lines.write()
@@ -114,8 +113,8 @@ class LinearApproximationExplain(relationships.QuestionPart):
     def __init__(self, part):
         self.num_lines, self.num_marks = 4, 1
 
-        self._qp = copy.deepcopy(part._qp)
-        self._qi = copy.deepcopy(part._qi)
+        self._qp = relationships.copy_parameters(part._qp)
+        self._qi = relationships.copy_parameters(part._qi)
 
         self._qp['concave_or_convex'] = functions.concave_or_convex(self._qp['equation'], self._qp['location'])
 
@@ -124,7 +123,7 @@ class LinearApproximationExplain(relationships.QuestionPart):
 
         return r'''Explain why this approximate value is {inequality} than the exact value for ${unevaluated_f_of_new_location}$.'''.format(
             inequality=direction,
-            unevaluated_f_of_new_location=sympy.latex(self._qi['noeval_equation'].subs({x: self._qp['new_location']}))
+            unevaluated_f_of_new_location=printer.latex(self._qi['noeval_equation'].subs({x: self._qp['new_location']}))
         )
 
     def solution_statement(self):
@@ -141,18 +140,18 @@ class LinearApproximationExplain(relationships.QuestionPart):
             concave_or_convex=self._qp['concave_or_convex'],
             location=self._qp['location'],
             second_derivative_leibniz_form=second_derivative_leibniz_form,
-            second_derivative_at_original_location=sympy.latex(second_derivative_at_original_location),
+            second_derivative_at_original_location=printer.latex(second_derivative_at_original_location),
             greater_than_or_less_than='greater than' if second_derivative_at_original_location > 0 else 'less than'
         )
 
         lines += r'''Therefore, the gradient of ${equation}$ {increases_or_decreases} as $x$ moves from ${location}$ to ${new_location}$
             and as a result, linear approximation {under_or_over}estimates the true value of ${unevaluated_f_of_new_location}$'''.format(
-            equation=sympy.latex(self._qp['equation']),
+            equation=printer.latex(self._qp['equation']),
             increases_or_decreases='increases' if second_derivative_at_original_location > 0 else 'decreases',
             location=self._qp['location'],
             new_location=self._qp['new_location'],
             under_or_over='under' if self._qp['concave_or_convex'] else 'over',
-            unevaluated_f_of_new_location=sympy.latex(self._qi['noeval_equation'].subs({x: self._qp['new_location']}))
+            unevaluated_f_of_new_location=printer.latex(self._qi['noeval_equation'].subs({x: self._qp['new_location']}))
         )
 
         return lines.write()
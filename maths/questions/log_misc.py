@@ -1,9 +1,9 @@
 import sympy
-import random
+from ..randomness import random
 from ..symbols import x, x0, coeff0
 from .. import all_functions
-from ..utils import sensible_values
-from ..latex import solutions
+from ..utils import retries, sensible_values
+from ..latex import solutions, printer
 import functools
 import operator
 from . import relationships
@@ -49,7 +49,7 @@ class SolveLogEquation(relationships.QuestionPart):
         """Return linear expressions that will be used as the interiors of the logs.
         """
 
-        while True:
+        for attempt in retries.attempts():
             left_log_interiors = [all_functions.request_linear(difficulty=3).equation for solution in range(2)]
             if left_log_interiors[0] != left_log_interiors[1]:
                 return left_log_interiors
@@ -144,7 +144,7 @@ class SolveLogEquation(relationships.QuestionPart):
         self.num_lines, self.num_marks = 8, 3
         self._qp = {}
 
-        while True:
+        for attempt in retries.attempts():
             left_orders = SolveLogEquation.log_orders()
             left_coefficients = SolveLogEquation.log_coefficients()
             left_log_interiors = SolveLogEquation.log_interiors()
@@ -185,8 +185,8 @@ class SolveLogEquation(relationships.QuestionPart):
 
     def question_statement(self):
         return r'''Solve the equation ${left_side} = {right_side}$ for $x$.'''.format(
-            left_side=sympy.latex(self._qp['left_side']),
-            right_side=sympy.latex(self._qp['right_side'])
+            left_side=printer.latex(self._qp['left_side']),
+            right_side=printer.latex(self._qp['right_side'])
         )
 
     def solution_statement(self):
@@ -195,41 +195,41 @@ class SolveLogEquation(relationships.QuestionPart):
         left_combined = SolveLogEquation.logcombine_include_negative_power(self._qp['left_side'], force=True)
         right_combined = SolveLogEquation.logcombine_include_negative_power(self._qp['right_side'], force=True)
         lines += r'${left_combined} = {right_combined}$'.format(
-            left_combined=sympy.latex(left_combined),
-            right_combined=sympy.latex(right_combined)
+            left_combined=printer.latex(left_combined),
+            right_combined=printer.latex(right_combined)
         )
 
         lines += r'$\therefore {left_interior} = {right_interior}$'.format(
-            left_interior=sympy.latex(left_combined.args[0]),
-            right_interior=sympy.latex(right_combined.args[0])
+            left_interior=printer.latex(left_combined.args[0]),
+            right_interior=printer.latex(right_combined.args[0])
         )
 
         left_numer, left_denom = left_combined.args[0].as_numer_denom()
         right_numer, right_denom = right_combined.args[0].as_numer_denom()
         lines += r'${left_intermediate} = {right_intermediate}$'.format(
-            left_intermediate=sympy.latex((left_numer * right_denom).expand()),
-            right_intermediate=sympy.latex((right_numer * left_denom).expand())
+            left_intermediate=printer.latex((left_numer * right_denom).expand()),
+            right_intermediate=printer.latex((right_numer * left_denom).expand())
         )
 
         collected_like_terms = (left_numer * right_denom - right_numer * left_denom).expand()
         lines += r'${collected_like_terms} = 0$'.format(
-            collected_like_terms=sympy.latex(collected_like_terms)
+            collected_like_terms=printer.latex(collected_like_terms)
         )
 
         solutions_for_x = sympy.solve(collected_like_terms)
         lines += r'$x = {solutions}$'.format(
-            solutions=', '.join([sympy.latex(solution) for solution in solutions_for_x])
+            solutions=', '.join([printer.latex(solution) for solution in solutions_for_x])
         )
 
         invalid_solutions = set(self._qp['maybe_invalid_solutions']) - set(self._qp['valid_solutions'])
         if len(invalid_solutions) > 0:
             invalid_solution = invalid_solutions.pop()
             lines += r'but $x = {invalid_solution}$ is an invalid solution since a log can only accept positive values'.format(
-                invalid_solution=sympy.latex(invalid_solution)
+                invalid_solution=printer.latex(invalid_solution)
             )
 
             lines += r'$\therefore x = {valid_solution}$'.format(
-                valid_solution=', '.join([sympy.latex(i) for i in self._qp['valid_solutions']])
+                valid_solution=', '.join([printer.latex(i) for i in self._qp['valid_solutions']])
             )
 
         return lines.write()
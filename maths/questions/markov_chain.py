@@ -1,5 +1,5 @@
 import sympy
-import random
+from ..randomness import random
 import decimal
 import itertools
 import functools
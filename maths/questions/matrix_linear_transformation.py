@@ -1,8 +1,8 @@
 import sympy
-import random
+from ..randomness import random
 from .. import all_functions
 from ..symbols import x, y, x0, x1, x2, x3, a, b, c, d, coeff0, coeff1, coeff2, coeff3
-from ..latex import solutions
+from ..latex import solutions, printer
 from ..utils import transformations, noevals
 import collections
 from . import relationships
@@ -113,9 +113,9 @@ class MatrixLinearTransformation(relationships.QuestionPart):
                                                        [0, self._qp['y_dilation_and_reflection']]])
         translation_matrix = sympy.Matrix([self._qp['x_translation'], self._qp['y_translation']])
         mapping = r'''T({symbols_matrix}) = {dilation_and_reflection_matrix}{symbols_matrix} + {translation_matrix}'''.format(
-            symbols_matrix=sympy.latex(symbols_matrix),
-            dilation_and_reflection_matrix=sympy.latex(dilation_and_reflection_matrix),
-            translation_matrix=sympy.latex(translation_matrix)
+            symbols_matrix=printer.latex(symbols_matrix),
+            dilation_and_reflection_matrix=printer.latex(dilation_and_reflection_matrix),
+            translation_matrix=printer.latex(translation_matrix)
         )
 
         # the symbols can get pulled out of order when looking at expr.free_symbols
@@ -127,9 +127,9 @@ class MatrixLinearTransformation(relationships.QuestionPart):
             The image of the curve $y = {equation}$ under the transformation $T$ has equation y = ${wildcard_equation}$.
             Find the values of ${wilds}$.'''.format(
             mapping=mapping,
-            equation=sympy.latex(self._qp['equation']),
-            wildcard_equation=sympy.latex(self._qp['wildcard_equation']),
-            wilds=', '.join([sympy.latex(i) for i in wilds])
+            equation=printer.latex(self._qp['equation']),
+            wildcard_equation=printer.latex(self._qp['wildcard_equation']),
+            wilds=', '.join([printer.latex(i) for i in wilds])
         )
 
     def solution_statement(self):
@@ -138,25 +138,25 @@ class MatrixLinearTransformation(relationships.QuestionPart):
         # e.g. T([x; y]) = [x - 2; y] = [x'; y']
         x_, y_ = sympy.symbols("x' y'")
         lines += r'''$T({pre_transformation_symbols_matrix}) = {overall_transformation} = {post_transformation_symbols_matrix}$'''.format(
-            pre_transformation_symbols_matrix=sympy.latex(sympy.Matrix([x, y])),
-            overall_transformation=sympy.latex(sympy.Matrix(self._qp['pre_to_post_transformation'])),
-            post_transformation_symbols_matrix=sympy.latex(sympy.Matrix([x_, y_]))
+            pre_transformation_symbols_matrix=printer.latex(sympy.Matrix([x, y])),
+            overall_transformation=printer.latex(sympy.Matrix(self._qp['pre_to_post_transformation'])),
+            post_transformation_symbols_matrix=printer.latex(sympy.Matrix([x_, y_]))
         )
 
         pre_to_post_transformation = transformations.overall_transformation(self._qp['transformation'])
         post_to_pre_transformation = transformations.reverse_mapping(pre_to_post_transformation)
         lines += r'${pre_transformation_symbols_matrix} = {post_to_pre_transformation}$'.format(
-            pre_transformation_symbols_matrix=sympy.latex(sympy.Matrix([x, y])),
-            post_to_pre_transformation=sympy.latex(post_to_pre_transformation.subs({x: x_, y: y_}))
+            pre_transformation_symbols_matrix=printer.latex(sympy.Matrix([x, y])),
+            post_to_pre_transformation=printer.latex(post_to_pre_transformation.subs({x: x_, y: y_}))
         )
 
         noevaled = noevals.noevalify(self._qp['equation'])
         noevaled = noevaled.subs({x: post_to_pre_transformation[0]})
         # e.g. \therefore y = tan(-x + 3*pi/4) transforms to y = -tan(x/2 - 2 + pi/4)
         lines += r'$\therefore y = {equation}$ transforms to ${post_transformation_y} = {post_transformation_equation}$'.format(
-            equation=sympy.latex(self._qp['equation']),
-            post_transformation_y=sympy.latex(post_to_pre_transformation[1].subs({y: y_})),
-            post_transformation_equation=sympy.latex(noevaled.subs({x: x_}))
+            equation=printer.latex(self._qp['equation']),
+            post_transformation_y=printer.latex(post_to_pre_transformation[1].subs({y: y_})),
+            post_transformation_equation=printer.latex(noevaled.subs({x: x_}))
         )
 
         noevalified_equation = noevals.noevalify(self._qp['equation'])
@@ -166,14 +166,14 @@ class MatrixLinearTransformation(relationships.QuestionPart):
             noevalified_transformed_equation = noevalified_transformed_equation.expand()
         # e.g. = -tan(2x + pi/4 + 4)
         lines += r'The transformed equation is $y = {noevalified_transformed_equation}$'.format(
-            noevalified_transformed_equation=sympy.latex(noevalified_transformed_equation)
+            noevalified_transformed_equation=printer.latex(noevalified_transformed_equation)
         )
 
         # e.g. \therefore a = -1, b = 2, c = pi/4 + 4, d = 0
         match = MatrixLinearTransformation.match(noevalified_transformed_equation)
         answer = ', '.join(['{wildcard} = {wildcard_value}'.format(
             wildcard=k,
-            wildcard_value=sympy.latex(v))
+            wildcard_value=printer.latex(v))
             for k, v in match.items()]
         )
 
@@ -1,10 +1,9 @@
 import sympy
-import random
+from ..randomness import random
 from .. import not_named_yet
-from ..latex import solutions, expressions
+from ..latex import solutions, expressions, printer
 from ..symbols import a
 from . import relationships
-import copy
 
 
 X = sympy.Symbol('X')
@@ -72,7 +71,7 @@ class SimpleNormalDistribution(relationships.QuestionPart):
 
     def __init__(self, part):
         self.num_lines, self.num_marks = 6, 2
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
         self._qi = {}
         self._qi['unknown_variable'] = a
@@ -149,9 +148,9 @@ class SimpleNormalDistribution(relationships.QuestionPart):
 
         # e.g. = (1/2) - (-c + 1) = c - 1/2
         lines += r'$= ({half_interval_probability}) - ({probability_derived_from_question}) = {answer}$'.format(
-            half_interval_probability=sympy.latex(left_pr),
-            probability_derived_from_question=sympy.latex(right_pr),
-            answer=sympy.latex(self._qp['answer'])
+            half_interval_probability=printer.latex(left_pr),
+            probability_derived_from_question=printer.latex(right_pr),
+            answer=printer.latex(self._qp['answer'])
         )
 
         return lines.write()
@@ -174,7 +173,7 @@ class OneSidedHalf(relationships.QuestionPart):
 
     def __init__(self, part):
         self.num_lines, self.num_marks = 2, 1
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
         self._qp['interval'] = random.choice([
             sympy.Interval(-sympy.oo, self._qp['mean']),
@@ -189,7 +188,7 @@ class OneSidedHalf(relationships.QuestionPart):
     def solution_statement(self):
         lines = solutions.Lines()
         lines += r'${answer}$'.format(
-            answer=sympy.latex(sympy.Rational(1, 2))
+            answer=printer.latex(sympy.Rational(1, 2))
         )
 
         return lines.write()
@@ -254,7 +253,7 @@ class ProbabilityEquality(relationships.QuestionPart):
 
     def __init__(self, part):
         self.num_lines, self.num_marks = 4, 2
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
         self._qp['num_standard_deviations'] = sympy.Rational(
             not_named_yet.randint(-3, 3, exclude=[0]),
@@ -308,7 +307,7 @@ class ProbabilityEquality(relationships.QuestionPart):
             # e.g. Pr(X >= 13) = Pr(Z >= (13 - 15)/9) = Pr(Z >= -2/9)
             lines += r'''$Pr({0}) = Pr({1}) = Pr({2})$'''.format(
                 expressions.relation(self._qp['question_original_interval'], var="X"),
-                expressions.relation(interval, var="Z").replace(sympy.latex(value), z_score),
+                expressions.relation(interval, var="Z").replace(printer.latex(value), z_score),
                 expressions.relation(interval, var="Z")
             )
         else:
@@ -319,12 +318,12 @@ class ProbabilityEquality(relationships.QuestionPart):
             )
             value = interval.left if interval.left != -sympy.oo else interval.right
             num_sds = self._qp['num_standard_deviations'] * (-1 if self._qp['flipped'] else 1)
-            n_score = r'{0} \times {standard_deviation} + {mean}'.format(sympy.latex(num_sds), **self._qp)
+            n_score = r'{0} \times {standard_deviation} + {mean}'.format(printer.latex(num_sds), **self._qp)
 
             # e.g. Pr(Z >= -3) = Pr(X >= -3 * 7 + 40) = Pr(X >= 19)
             lines += r'''$Pr({0}) = Pr({1}) = Pr({2})$'''.format(
                 expressions.relation(self._qp['question_Z_interval'], var="Z"),
-                expressions.relation(interval, var="X").replace(sympy.latex(value), n_score),
+                expressions.relation(interval, var="X").replace(printer.latex(value), n_score),
                 expressions.relation(interval, var="X")
             )
 
@@ -338,7 +337,7 @@ class ProbabilityEquality(relationships.QuestionPart):
 
         # e.g. \therefore c = 79
         lines += r'''$\therefore c = {answer}$'''.format(
-            answer=sympy.latex(answer)
+            answer=printer.latex(answer)
         )
 
         return lines.write()
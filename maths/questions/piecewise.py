@@ -1,11 +1,11 @@
 import sympy
-import random
+from ..randomness import random
 from ..rich_requests import requests
 from ..plot import plot
+from ..latex import printer
 from ..utils import functions
 from ..symbols import x, coeff0, coeff1, coeff2, coeff3
 from . import relationships
-import copy
 
 
 @relationships.root
@@ -58,7 +58,7 @@ class Piecewise(relationships.QuestionPart):
         path = plot.plot(self._qp['equation'], self._qp['plot_domain'], self._qp['plot_range'])
 
         return r'''The graph of the function $f$ is shown, where $f = {equation}$ {plot}'''.format(
-            equation=sympy.latex(self._qp['equation']),
+            equation=printer.latex(self._qp['equation']),
             plot=plot.latex(path)
         )
 
@@ -97,7 +97,7 @@ class DomainDerivative(relationships.QuestionPart):
 
     def __init__(self, part):
         self.num_lines, self.num_marks = 3, 1
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
         self._qp['domain'] = sympy.Interval(-sympy.oo, sympy.oo)
         for piecewise_part in self._qp['equation'].args:
@@ -120,7 +120,7 @@ class DomainDerivative(relationships.QuestionPart):
 
     def solution_statement(self):
         return r'${answer}$'.format(
-            answer=sympy.latex(self._qp['domain'])
+            answer=printer.latex(self._qp['domain'])
         )
 
 
@@ -141,7 +141,7 @@ class AbsoluteValue(relationships.QuestionPart):
 
     def __init__(self, part):
         self.num_lines, self.num_marks = 0, 2
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
         # find the half of the piecewise that is not already an absolute value
         func_left, func_right = self._qp['equation'].args
@@ -165,8 +165,8 @@ class AbsoluteValue(relationships.QuestionPart):
 
         return r'''By referring to the graph of $f$, sketch the graph of the function with rule
             $y = {equation}$, for ${domain}$. {cubic_statement} {plot}'''.format(
-            equation=sympy.latex(self._qp['equation']),
-            domain=sympy.latex(self._qp['domain']),
+            equation=printer.latex(self._qp['equation']),
+            domain=printer.latex(self._qp['domain']),
             cubic_statement=cubic_statement,
             plot=plot.latex(path)
         )
@@ -1,11 +1,23 @@
+import functools
 import sympy
-import random
+from ..randomness import random
 from .. import domains
 from ..symbols import x, k
-from ..latex import expressions, solutions
-from ..utils import sensible_values
+from ..latex import expressions, solutions, printer
+from ..utils import sampler, sensible_values
 from . import relationships
-import copy
+
+
+@functools.lru_cache(maxsize=None)
+def _trig_sampler(function_type):
+    """Return the sampler of the domain and period of a sine or cosine density function, which can be any whose area
+    isn't 0, so it can be scaled to 1.
+    """
+
+    def feasible(left, right, m):
+        return left + 1 <= right and function_type(m * x).integrate((x, left, right)) != 0
+
+    return sampler.Sampler({'left': range(0, 3), 'right': range(0, 3), 'm': [sympy.pi / 2, sympy.pi]}, feasible)
 
 
 class PiecewiseProbDensityFunction:
@@ -17,19 +29,12 @@ class PiecewiseProbDensityFunction:
         function_type = random.choice([sympy.sin, sympy.cos, 'linear', 'quadratic'])
 
         if function_type in [sympy.sin, sympy.cos]:
-            while True:
-                self._qp['domain'] = domains.integer_domain(low=0, high=2, minimum_distance=1)
-                m = random.choice([sympy.pi / 2, sympy.pi])
-                self._qp['equation'] = k * function_type(m * x)
+            parameters = _trig_sampler(function_type).sample()
+            self._qp['domain'] = sympy.Interval(parameters['left'], parameters['right'], False, False)
+            self._qp['equation'] = k * function_type(parameters['m'] * x)
 
-                area = self._qp['equation'].integrate((x, self._qp['domain'].left, self._qp['domain'].right))
-
-                solution = sympy.solve(area - 1)
-                if len(solution) == 0:
-                    continue
-
-                self._qp['k'] = solution[0]
-                break
+            area = self._qp['equation'].integrate((x, self._qp['domain'].left, self._qp['domain'].right))
+            self._qp['k'] = sympy.solve(area - 1)[0]
 
         elif function_type == 'linear':
             self._qp['domain'] = domains.integer_domain()
@@ -103,7 +108,7 @@ class PiecewiseProbDensityFunctionUnknown(relationships.QuestionPart):
     """
 
     def __init__(self, part):
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
         self.num_marks, self.num_lines = 3, 12
 
     def question_statement(self):
@@ -111,7 +116,7 @@ class PiecewiseProbDensityFunctionUnknown(relationships.QuestionPart):
 
         return r'''Show that $k = {k}$.'''.format(
             equation=expressions.piecewise(piecewise),
-            k=sympy.latex(self._qp['k'])
+            k=printer.latex(self._qp['k'])
         )
 
     def solution_statement(self):
@@ -128,11 +133,11 @@ class PiecewiseProbDensityFunctionUnknown(relationships.QuestionPart):
         lines += r'${integral_intermediate} = {integral_intermediate_eval} = {answer} = 1$'.format(
             integral_intermediate=integral_intermediate,
             integral_intermediate_eval=integral_intermediate_eval,
-            answer=sympy.latex(answer)
+            answer=printer.latex(answer)
         )
 
         lines += r'$\therefore k = {k}$'.format(
-            k=sympy.latex(self._qp['k'])
+            k=printer.latex(self._qp['k'])
         )
 
         return lines.write()
@@ -164,7 +169,7 @@ class SimpleInterval(relationships.QuestionPart):
         # 2011 Q5a [5 lines] [2 marks]
         self.num_lines, self.num_marks = 5, 2
 
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
         choices = [self._qp['domain'].left + sympy.Rational(i, 4) * self._qp['domain'].measure for i in [1, 2, 3]]
         self._qp['bound'] = random.choice(choices)
@@ -179,7 +184,7 @@ class SimpleInterval(relationships.QuestionPart):
     def question_statement(self):
         return r'''Find $Pr(X {direction} {bound})$.'''.format(
             direction=r'\le' if self._qp['direction'] == 'left' else r'\ge',
-            bound=sympy.latex(self._qp['bound'])
+            bound=printer.latex(self._qp['bound'])
         )
 
     def solution_statement(self):
@@ -195,7 +200,7 @@ class SimpleInterval(relationships.QuestionPart):
 
         answer = self._qp['equation'].integrate((x, self._qp['domain'].left, self._qp['domain'].right))
         lines += '$= {answer}$'.format(
-            answer=sympy.latex(answer)
+            answer=printer.latex(answer)
         )
 
         return lines.write()
@@ -225,7 +230,7 @@ class Conditional:
 
         self.num_lines, self.num_marks = 8, 2
 
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
         self._qp['major_bound'], self._qp['minor_bound'] = sensible_values.conditional_integral(self._qp['equation'], self._qp['domain'])
 
@@ -235,9 +240,9 @@ class Conditional:
     def question_statement(self):
         return r'Find $Pr(X {minor_direction} {minor_bound} | X {major_direction} {major_bound})$.'.format(
             minor_direction=self._qp['minor_direction'],
-            minor_bound=sympy.latex(self._qp['minor_bound']),
+            minor_bound=printer.latex(self._qp['minor_bound']),
             major_direction=self._qp['major_direction'],
-            major_bound=sympy.latex(self._qp['major_bound'])
+            major_bound=printer.latex(self._qp['major_bound'])
         )
 
     def solution_statement(self):
@@ -272,7 +277,7 @@ class Conditional:
         lines += r'$= \frac{{ {0} }}{{ {1} }}$'.format(top_eval, bottom_eval)
 
         lines += r'$= {answer}$'.format(
-            answer=sympy.latex(top_value / bottom_value)
+            answer=printer.latex(top_value / bottom_value)
         )
 
         return lines.write()
@@ -297,7 +302,7 @@ class Cumulative(relationships.QuestionPart):
     def __init__(self, part):
         self.num_lines, self.num_marks = 12, 3
 
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
         stripped_endpoints = sympy.Interval(self._qp['domain'].left, self._qp['domain'].right, True, True)
         self._qp['location'] = sensible_values.antiderivative(self._qp['equation'], stripped_endpoints)
@@ -317,9 +322,9 @@ class Cumulative(relationships.QuestionPart):
             self._qi['domain'] = sympy.Interval(self._qi['unknown'], self._qp['domain'].right, True, False)
 
         return r'Find the value of {unknown} such that $Pr(X {direction} {unknown}) = {value}$.'.format(
-            unknown=sympy.latex(self._qi['unknown']),
+            unknown=printer.latex(self._qi['unknown']),
             direction=self._qi['inequality'],
-            value=sympy.latex(self._qi['value'])
+            value=printer.latex(self._qi['value'])
         )
 
     def solution_statement(self):
@@ -338,7 +343,7 @@ class Cumulative(relationships.QuestionPart):
 
         lines += r'$= {integral_intermediate_eval} = {value}$'.format(
             integral_intermediate_eval=integral_intermediate_eval,
-            value=sympy.latex(self._qi['value'])
+            value=printer.latex(self._qi['value'])
         )
 
         if self._qp['direction'] == 'left':
@@ -348,7 +353,7 @@ class Cumulative(relationships.QuestionPart):
             left_side = -1 * self._qp['equation'].integrate().subs({x: self._qi['unknown']})
             right_side = self._qi['value'] - self._qp['equation'].integrate().subs({x: self._qp['domain'].right})
 
-        lines += r'${0} = {1}$'.format(sympy.latex(left_side), sympy.latex(right_side))
+        lines += r'${0} = {1}$'.format(printer.latex(left_side), printer.latex(right_side))
 
         lines += expressions.shrink_solution_set(left_side, self._qp['domain'], expr_equal_to=right_side, var=self._qi['unknown'])
 
@@ -1,15 +1,14 @@
-import random
+from ..randomness import random
 import sympy
 from sympy import GreaterThan, LessThan, StrictGreaterThan, StrictLessThan
 from .. import not_named_yet
 from ..phrasing import first_names
-from ..latex import expressions, table, solutions
+from ..latex import expressions, table, solutions, printer
 from ..probability.discrete import prob_table
 from . import relationships
 import operator
 from collections import OrderedDict
 import functools
-import copy
 import itertools
 
 
@@ -80,7 +79,7 @@ class Property(relationships.QuestionPart):
     """
 
     def __init__(self, part):
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
         self._qp['question_type'] = random.choice(['mean', 'variance', 'mode'])
 
@@ -128,9 +127,9 @@ class Property(relationships.QuestionPart):
             expectation_of_x = prob_table.expectation_x(self._qp['prob_table'])
             expectation_of_x_squared = prob_table.expectation_x(self._qp['prob_table'], power=2)
             lines += r'$= {expectation_of_x_squared} - {expectation_of_x}^2 = {answer}$'.format(
-                expectation_of_x_squared=sympy.latex(expectation_of_x_squared),
-                expectation_of_x=sympy.latex(expectation_of_x),
-                answer=sympy.latex(self._qp['answer'])
+                expectation_of_x_squared=printer.latex(expectation_of_x_squared),
+                expectation_of_x=printer.latex(expectation_of_x),
+                answer=printer.latex(self._qp['answer'])
             )
 
         elif self._qp['question_type'] == 'mode':
@@ -158,8 +157,8 @@ class Multinomial(relationships.QuestionPart):
     """
 
     def __init__(self, part):
-        self._qp = copy.deepcopy(part._qp)
-        self._qi = copy.deepcopy(part._qi)
+        self._qp = relationships.copy_parameters(part._qp)
+        self._qi = relationships.copy_parameters(part._qi)
 
         self._qp['question_type'] = random.choice(['one_x', 'any_x'])
 
@@ -195,8 +194,8 @@ class Multinomial(relationships.QuestionPart):
             lines += r'$Pr(X = {x_value}$, {n_days} days in a row$) = {probability_of_x}^{n_days} = {answer}.$'.format(
                 x_value=self._qp['x_value'],
                 n_days=self._qp['n_days'],
-                probability_of_x=sympy.latex(self._qp['prob_table'][self._qp['x_value']]),
-                answer=sympy.latex(answer)
+                probability_of_x=printer.latex(self._qp['prob_table'][self._qp['x_value']]),
+                answer=printer.latex(answer)
             )
 
         elif self._qp['question_type'] == 'any_x':
@@ -206,11 +205,11 @@ class Multinomial(relationships.QuestionPart):
                 sum_of_probabilities=sum_of_probabilities
             )
 
-            sum_of_probabilities = ' + '.join(['({0})^{1}'.format(sympy.latex(v), self._qp['n_days']) for v in self._qp['prob_table'].values()])
+            sum_of_probabilities = ' + '.join(['({0})^{1}'.format(printer.latex(v), self._qp['n_days']) for v in self._qp['prob_table'].values()])
             answer = sum(v ** self._qp['n_days'] for v in self._qp['prob_table'].values())
             lines += r'''$= {sum_of_probabilities} = {answer}$'''.format(
                 sum_of_probabilities=sum_of_probabilities,
-                answer=sympy.latex(answer)
+                answer=printer.latex(answer)
             )
 
         return lines.write()
@@ -234,7 +233,7 @@ class Conditional(relationships.QuestionPart):
     """
 
     def __init__(self, part):
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
         self.num_lines, self.num_marks = 4, 2
 
@@ -278,9 +277,9 @@ class Conditional(relationships.QuestionPart):
         )
 
         lines += r'''$= \frac{{{minor_probability}}}{{{major_probability}}} = {answer}$'''.format(
-            minor_probability=sympy.latex(self._qp['pr_minor']),
-            major_probability=sympy.latex(self._qp['pr_major']),
-            answer=sympy.latex(self._qp['pr_minor'] / self._qp['pr_major'])
+            minor_probability=printer.latex(self._qp['pr_minor']),
+            major_probability=printer.latex(self._qp['pr_major']),
+            answer=printer.latex(self._qp['pr_minor'] / self._qp['pr_major'])
         )
 
         return lines.write()
@@ -302,8 +301,8 @@ class Cumulative(relationships.QuestionPart):
     """
 
     def __init__(self, part):
-        self._qp = copy.deepcopy(part._qp)
-        self._qi = copy.deepcopy(part._qi)
+        self._qp = relationships.copy_parameters(part._qp)
+        self._qi = relationships.copy_parameters(part._qi)
 
         self.num_lines, self.num_marks = 5, 3
 
@@ -343,9 +342,9 @@ class Cumulative(relationships.QuestionPart):
             probability_of_permutation = functools.reduce(operator.mul, probabilities_of_indivudual_permutation_events)
             probabilities_of_permutations.append(probability_of_permutation)
 
-        sum_permutations_numeric = ' + '.join(sympy.latex(i) for i in probabilities_of_permutations)
+        sum_permutations_numeric = ' + '.join(printer.latex(i) for i in probabilities_of_permutations)
         lines += r'''$= {0}$'''.format(sum_permutations_numeric)
 
-        lines += r'''$= {0}$'''.format(sympy.latex(self._qp['answer']))
+        lines += r'''$= {0}$'''.format(printer.latex(self._qp['answer']))
 
         return lines.write()
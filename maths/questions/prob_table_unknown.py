@@ -1,8 +1,9 @@
-import random
+from ..randomness import random
 import sympy
 from ..latex.table import probability_table
-from ..latex import expressions, solutions
+from ..latex import expressions, solutions, printer
 from .. import not_named_yet
+from ..utils import retries
 from ..symbols import k, coeff0, coeff1, coeff2
 from . import relationships
 from collections import OrderedDict
@@ -32,7 +33,7 @@ class ProbTableUnknown(relationships.QuestionPart):
 
         self._qp = {}
 
-        while True:
+        for attempt in retries.attempts():
             # ensure we will have only one positive root for k
             pos_root_numerator = random.randint(1, 3)
             pos_root_denom = pos_root_numerator + random.randint(1, 2)
@@ -111,27 +112,27 @@ class ProbTableUnknown(relationships.QuestionPart):
 
         lines += r'$E(X) = {symbolic_expectation_of_x} = {total_probability} = 1$'.format(
             symbolic_expectation_of_x=expressions.symbolic_discrete_expectation_x(),
-            total_probability=sympy.latex(sum(self._qp['prob_table'].values()))
+            total_probability=printer.latex(sum(self._qp['prob_table'].values()))
         )
 
         quadratic = sum(self._qp['prob_table'].values()) - 1
         lines += r'${0} = 0$'.format(
-            sympy.latex(quadratic)
+            printer.latex(quadratic)
         )
 
         quadratic *= self._qp['quadratic_shrinkage_factor']
         lines += r'${0} = 0$'.format(
-            sympy.latex(quadratic)
+            printer.latex(quadratic)
         )
 
         lines += r'$k = {quadratic_formula} = {solution_1}, {solution_2}$'.format(
             quadratic_formula=expressions.quadratic_formula(quadratic, var=k),
-            solution_1=sympy.latex(self._qp['quadratic_solutions'][0]),
-            solution_2=sympy.latex(self._qp['quadratic_solutions'][1])
+            solution_1=printer.latex(self._qp['quadratic_solutions'][0]),
+            solution_2=printer.latex(self._qp['quadratic_solutions'][1])
         )
 
         lines += r'''but $k > 0$ so k = ${answer}$'''.format(
-            answer=sympy.latex(self._qp['answer'])
+            answer=printer.latex(self._qp['answer'])
         )
 
         return lines.write()
@@ -1,6 +1,6 @@
 import sympy
-import random
-from ..latex import solutions, expressions
+from ..randomness import random
+from ..latex import solutions, expressions, printer
 from ..utils import sympy_shortcuts
 from . import relationships
 
@@ -96,7 +96,7 @@ class RelatedRates(relationships.QuestionPart):
                 'time_unit': 'minute',
                 'variable_change_variable_name': 'angle',
                 'what': "observer's view between the launch position and the rocket's current location",
-                'already_latexed_value': sympy.latex(self._qp['dependent_variable_value'])
+                'already_latexed_value': printer.latex(self._qp['dependent_variable_value'])
             }
         }[self._qp['shape']]
 
@@ -137,14 +137,14 @@ class RelatedRates(relationships.QuestionPart):
         # e.g. dV/dr = 4 * pi * r
         lines += r'${leibniz_derivative} = {value}$'.format(
             leibniz_derivative=expressions.derivative(self._qp['constant_change_variable'], self._qp['variable_change_variable']),
-            value=sympy.latex(self._qp['implicit_shape_relationship'].diff())
+            value=printer.latex(self._qp['implicit_shape_relationship'].diff())
         )
 
         # e.g. dr/dV = 1 / (dV/dr) = 1 / (4 * pi * r)
         lines += r'${leibniz_derivative} = \frac{{1}}{{{inverted_leibniz_derivative}}} = \frac{{1}}{{{value}}}$'.format(
             leibniz_derivative=expressions.derivative(self._qp['variable_change_variable'], self._qp['constant_change_variable']),
             inverted_leibniz_derivative=expressions.derivative(self._qp['constant_change_variable'], self._qp['variable_change_variable']),
-            value=sympy.latex(self._qp['implicit_shape_relationship'].diff())
+            value=printer.latex(self._qp['implicit_shape_relationship'].diff())
         )
 
         # e.g. dr/dt = dr/dV * dV/dt
@@ -158,14 +158,14 @@ class RelatedRates(relationships.QuestionPart):
         # e.g. \therefore dr/dt = 5 / (2 * pi * r)
         lines += r'$\therefore {leibniz_derivative} = {value}$'.format(
             leibniz_derivative=expressions.derivative(self._qp['variable_change_variable'], self._qp['time_variable']),
-            value=sympy.latex(final_rate_of_change)
+            value=printer.latex(final_rate_of_change)
         )
 
         # e.g. dr/dt(30) = 1 / (12 * pi)
         lines += r'${leibniz_derivative}({dependent_variable_value}) = {answer} \text{{{units}}}$'.format(
             leibniz_derivative=expressions.derivative(self._qp['variable_change_variable'], self._qp['time_variable']),
-            dependent_variable_value=sympy.latex(self._qp['dependent_variable_value']),
-            answer=sympy.latex(sympy_shortcuts.easy_sub(final_rate_of_change, self._qp['dependent_variable_value'])),
+            dependent_variable_value=printer.latex(self._qp['dependent_variable_value']),
+            answer=printer.latex(sympy_shortcuts.easy_sub(final_rate_of_change, self._qp['dependent_variable_value'])),
             units=r'{0}/{1}'.format(self._qi['variable_change_variable_units'], self._qi['time_unit'])
         )
 
@@ -1,11 +1,30 @@
+import collections
+import collections.abc
 import inspect
+import itertools
+import mmap
+import numbers
 import os
 import pickle
-import random
+import shutil
+import sys
+import threading
+import types
+from .. import randomness
+from ..utils import disk_cache, question_bank, time_budget
+from concurrent import futures
 import copy
+import json
 import re
 
 
+# how many shards a sharded store_question splits the questions into by default - a fixed number rather than one that
+# depends on the processes, so an interrupted run can be resumed over any number of processes
+STORE_SHARDS = 32
+
+_SEGMENT_PATTERN = re.compile(r'shard-\d+-of-(\d+)$')
+
+
 class DummyPart:
     """A dummy question part for when a question should be structured like so:
         1. (no question text)
@@ -20,6 +39,150 @@ class DummyPart:
         pass
 
 
+def _is_immutable(value):
+    """State whether a parameter can never change, so it can be shared between parts rather than copied.
+
+    >>> _is_immutable((1, 'a')), _is_immutable([1])
+    (True, False)
+    """
+
+    if isinstance(value, (numbers.Number, str, bytes, type(None), frozenset, range, type, types.FunctionType)):
+        return True
+    elif isinstance(value, tuple):
+        return all(_is_immutable(i) for i in value)
+
+    # sympy objects are immutable, and if sympy hasn't been imported the value can't be one
+    sympy = sys.modules.get('sympy')
+    return sympy is not None and isinstance(value, sympy.Basic)
+
+
+def _private_copy(value):
+    """Return a copy of a parameter that behaves like copy.deepcopy(value), but shares every immutable part of it.
+    """
+
+    if _is_immutable(value):
+        return value
+    elif isinstance(value, dict):  # including OrderedDicts, such as probability tables
+        copied = copy.copy(value)
+        for key, item in value.items():
+            copied[key] = _private_copy(item)
+        return copied
+    elif isinstance(value, list):
+        copied = copy.copy(value)
+        copied[:] = [_private_copy(i) for i in value]
+        return copied
+    elif type(value) in [set, tuple]:
+        return type(value)(_private_copy(i) for i in value)
+    else:
+        return copy.deepcopy(value)
+
+
+class ParameterDict(collections.abc.MutableMapping):
+    """A dict of a part's question parameters (its _qp or _qi) that child parts can copy in O(1).
+
+    A copy shares its parameters with the original. Immutable parameters, such as sympy objects and numbers, are
+    shared for good. A mutable parameter, such as a probability table, is copied the first time either dict reads it
+    after they were copied, and the dicts themselves are only copied when one of them is changed. So a copy behaves
+    like a deep copy, as long as parameters are only reached through the dict.
+
+    >>> parent = ParameterDict({'a': 1, 'table': [1, 2]})
+    >>> child = parent.copy()
+    >>> child['table'].append(3)
+    >>> child['b'] = 2
+    >>> sorted(parent.items()), sorted(child.items())
+    ([('a', 1), ('table', [1, 2])], [('a', 1), ('b', 2), ('table', [1, 2, 3])])
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._data = {}
+        self._shared = False  # whether _data is shared with a copy
+        self._owned = set()  # the keys whose values aren't shared with a copy
+        self.update(*args, **kwargs)
+
+    @classmethod
+    def adopt(cls, parameters):
+        """Return a ParameterDict that takes over a dict of parameters, without copying it.
+        """
+
+        adopted = cls()
+        adopted._data = parameters
+        adopted._owned = set(parameters)
+        return adopted
+
+    def copy(self):
+        copied = type(self)()
+        copied._data = self._data
+        copied._shared = self._shared = True
+        self._owned = set()
+        return copied
+
+    def _write(self):
+        """Make _data this dict's own before it is changed.
+        """
+
+        if self._shared:
+            self._data = dict(self._data)
+            self._shared = False
+
+    def __getitem__(self, key):
+        value = self._data[key]
+
+        if key not in self._owned:
+            if not _is_immutable(value):
+                value = _private_copy(value)
+                self._write()
+                self._data[key] = value
+            self._owned.add(key)
+
+        return value
+
+    def __setitem__(self, key, value):
+        self._write()
+        self._data[key] = value
+        self._owned.add(key)
+
+    def __delitem__(self, key):
+        self._write()
+        del self._data[key]
+        self._owned.discard(key)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(type(self).__name__, self._data)
+
+
+def copy_parameters(parameters):
+    """Return a copy of a part's parameters (its _qp or _qi) for a child part to start from.
+
+    The copy behaves like copy.deepcopy(part._qp), but shares the parent's immutable parameters instead of rebuilding
+    them. See ParameterDict.
+    """
+
+    if isinstance(parameters, ParameterDict):
+        return parameters.copy()
+
+    return ParameterDict.adopt({key: _private_copy(value) for key, value in parameters.items()})
+
+
+# (module name, class name, ...) -> the class' stored questions and indexes, opened once per process
+_opened_storage = {}
+
+# how many queries' matches to remember, the least recently made being forgotten first
+MAX_QUERIES = 256
+
+# (module name, class name, query) -> the numbers of the stored questions matching it, the most recently made last
+_queries = collections.OrderedDict()
+_queries_lock = threading.Lock()
+
+
 class QuestionPart:
     """Base class for all question parts.
     """
@@ -27,6 +190,14 @@ class QuestionPart:
     is_root = False
     parents = []
 
+    # the question_bank fields of a question dict from enumerate_questions, if this class' questions are stored in a
+    # compact bank rather than pickled
+    bank_fields = None
+
+    # index name -> the key of every record of the bank, as the name of a bank column or a function of the whole bank,
+    # so scan_random_question can sample from the questions matching a query without scanning the bank
+    bank_indexes = {}
+
     @classmethod
     def storage_paths(cls):
         """Return the paths that are involved in storing this class' questions.
@@ -45,16 +216,112 @@ class QuestionPart:
         return indices_path, data_path
 
     @classmethod
-    def store_question(cls):
+    def bank_path(cls):
+        """Return the path of the compact bank this class' questions are stored in, if it has bank_fields.
+        """
+        class_path = inspect.getfile(cls)
+        questions_folder, module_name = os.path.split(class_path)
+
+        bank_name = '{module_name}_{class_name}.npy'.format(module_name=os.path.splitext(module_name)[0],
+                                                           class_name=cls.__name__)
+        return os.path.join(questions_folder, 'storage', 'banks', bank_name)
+
+    @classmethod
+    def index_path(cls, index_name):
+        """Return the path of one of the secondary indexes over this class' bank.
+        """
+        return '{0}.{1}.index.npy'.format(os.path.splitext(cls.bank_path())[0], index_name)
+
+    @classmethod
+    def segments_folder(cls):
+        """Return the folder that a sharded store_question keeps its finished shards in until they are merged.
+        """
+        storage_path = cls.bank_path() if cls.bank_fields is not None else cls.storage_paths()[1]
+        return storage_path + '.segments'
+
+    @classmethod
+    def store_question(cls, processes=None, shards=None):
         """Store all possible question numbers that have student-friendly values.
+
+        A class with bank_fields can define enumerate_columns, returning the bank's columns as arrays (see
+        question_bank.from_columns) rather than enumerating question dicts, so storing never builds sympy objects.
+
+        If processes is given, the questions are enumerated in shards over that many processes, and enumerate_questions
+        (or enumerate_columns) has to take the shard to enumerate and the number of shards - see the shard function.
+        Every shard is saved as a segment as soon as it is done, so if the run is interrupted, running it again only
+        enumerates the shards that weren't done. The segments are merged into the stored questions once every shard is
+        done.
+
+        processes -- how many processes to enumerate the questions over
+        shards -- how many shards to split the questions into, defaulting to as many as the interrupted run being
+            resumed had, or STORE_SHARDS
         """
-        indices_path, data_path = cls.storage_paths()
+        for key in [i for i in _opened_storage if i[:2] == (cls.__module__, cls.__name__)]:
+            del _opened_storage[key]
+        with time_budget.uninterruptible(), _queries_lock:
+            for key in [i for i in _queries if i[:2] == (cls.__module__, cls.__name__)]:
+                del _queries[key]
+
+        if processes is None:
+            if hasattr(cls, 'enumerate_columns'):
+                question_bank.write_columns(cls.bank_path(), cls.bank_fields, cls.enumerate_columns())
+            elif cls.bank_fields is not None:
+                question_bank.write_bank(cls.bank_path(), cls.bank_fields, cls.enumerate_questions())
+            else:
+                indices_path, data_path = cls.storage_paths()
+                cls._store_indices(_write_pickled(data_path, cls.enumerate_questions()))
+
+            cls.store_bank_indexes()
+            return
+
+        segments_folder = cls.segments_folder()
+        resumed_shards = _segment_shards(segments_folder)
+
+        if shards is None:
+            shards = resumed_shards if resumed_shards is not None else STORE_SHARDS
+        elif resumed_shards is not None and resumed_shards != shards:
+            # the interrupted run's segments are of different shards, so none of them can be used
+            shutil.rmtree(segments_folder)
+
+        os.makedirs(segments_folder, exist_ok=True)
+
+        segment_paths = [os.path.join(segments_folder, 'shard-{0}-of-{1}'.format(i, shards)) for i in range(shards)]
+        unfinished = [i for i in range(shards) if not os.path.exists(segment_paths[i])]
+
+        with futures.ProcessPoolExecutor(max_workers=processes) as executor:
+            finished = executor.map(_store_shard, itertools.repeat(cls), unfinished, itertools.repeat(shards),
+                                    [segment_paths[i] for i in unfinished])
+            list(finished)  # raise any shard's exception here
+
+        if cls.bank_fields is not None:
+            question_bank.merge_banks(cls.bank_path(), segment_paths)
+        else:
+            cls._merge_pickled(segment_paths)
 
-        byte_indices = [0]
-        with open(data_path, 'wb') as f:
-            for question in cls.enumerate_questions():
-                pickle.dump(question, f)
-                byte_indices.append(f.tell())
+        shutil.rmtree(segments_folder)
+        cls.store_bank_indexes()
+
+    @classmethod
+    def store_bank_indexes(cls):
+        """Store every secondary index in bank_indexes alongside this class' bank.
+        """
+        if not cls.bank_indexes:
+            return
+
+        bank = question_bank.load_bank(cls.bank_path())
+        for index_name in cls.bank_indexes:
+            question_bank.write_index(cls.index_path(index_name), cls._index_keys(bank, index_name))
+
+    @classmethod
+    def _index_keys(cls, bank, index_name):
+        keys = cls.bank_indexes[index_name]
+        return bank[keys] if isinstance(keys, str) else keys(bank)
+
+    @classmethod
+    def _store_indices(cls, byte_indices):
+        """Save the byte offsets of this class' pickled questions alongside the module's other classes'.
+        """
+        indices_path, data_path = cls.storage_paths()
 
         if os.path.exists(indices_path):
             with open(indices_path, 'rb') as f:
@@ -67,36 +334,222 @@ class QuestionPart:
             pickle.dump(cur_indices, f)
 
     @classmethod
-    def scan_random_question(cls):
-        """Return a random set of valid coefficients for this question.
+    def _merge_pickled(cls, segment_paths):
+        """Concatenate the pickled questions of every segment into this class' data file.
         """
         indices_path, data_path = cls.storage_paths()
 
-        with open(indices_path, 'rb') as f:
-            all_indices = pickle.load(f)
-            byte_indices = all_indices[cls.__name__]
+        byte_indices = [0]
+        with open(data_path, 'wb') as f:
+            for segment_path in segment_paths:
+                with open(segment_path, 'rb') as segment_indices:
+                    segment_byte_indices = pickle.load(segment_indices)
+
+                start = f.tell()
+                with open(segment_path + '.data', 'rb') as segment_data:
+                    shutil.copyfileobj(segment_data, f)
+
+                byte_indices.extend(start + i for i in segment_byte_indices[1:])
+
+        cls._store_indices(byte_indices)
+
+    @classmethod
+    def stored_questions(cls):
+        """Return the number of stored questions, and a function that returns the nth stored question.
+
+        The storage is opened and memory-mapped the first time it is needed, and then kept open for the life of the
+        process, so sampling a question only reads that question.
+        """
+        key = (cls.__module__, cls.__name__)
+
+        if key not in _opened_storage:
+            if cls.bank_fields is not None:
+                bank = question_bank.load_bank(cls.bank_path())
+                _opened_storage[key] = (len(bank), lambda n: question_bank.decode(cls.bank_fields, bank[n]))
+            else:
+                indices_path, data_path = cls.storage_paths()
+
+                with open(indices_path, 'rb') as f:
+                    byte_indices = pickle.load(f)[cls.__name__]
+
+                with open(data_path, 'rb') as f:
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+                _opened_storage[key] = (len(byte_indices) - 1,
+                                        lambda n: pickle.loads(data[byte_indices[n]:byte_indices[n + 1]]))
+
+        return _opened_storage[key]
+
+    @classmethod
+    def bank_index(cls, index_name):
+        """Return one of the secondary indexes over this class' bank, opening it once per process.
+
+        An index that hasn't been stored yet is built in memory instead.
+        """
+        if index_name not in cls.bank_indexes:
+            raise ValueError('{0} has no index named: {1}, only: {2}'.format(
+                cls.__name__, index_name, sorted(cls.bank_indexes)))
+
+        key = (cls.__module__, cls.__name__, 'index', index_name)
+
+        if key not in _opened_storage:
+            if os.path.exists(cls.index_path(index_name)):
+                _opened_storage[key] = question_bank.load_bank(cls.index_path(index_name))
+            else:
+                bank = question_bank.load_bank(cls.bank_path())
+                _opened_storage[key] = question_bank.build_index(cls._index_keys(bank, index_name))
+
+        return _opened_storage[key]
+
+    @classmethod
+    def matching_questions(cls, where):
+        """Return the numbers of the stored questions that match a query.
+
+        A query is a dict of index name -> either a value, or an inclusive (low, high) range of values, e.g.
+        {'degree': 3, 'gradient': (-3, 3)}. A query on a single index is a binary search of the index. A query on
+        several indexes intersects their matches, and the most recent MAX_QUERIES of them are remembered.
+        """
+        if cls.bank_fields is None:
+            raise ValueError('Only questions stored in a bank can be queried, and {0} has no bank_fields'.format(
+                cls.__name__))
+
+        bounds = {}
+        for index_name, value in where.items():
+            bounds[index_name] = tuple(value) if isinstance(value, (tuple, list)) else (value, value)
+
+        matches = [question_bank.index_range(cls.bank_index(index_name), low, high)
+                   for index_name, (low, high) in sorted(bounds.items())]
+        if len(matches) == 1:
+            return matches[0]
+
+        key = (cls.__module__, cls.__name__, tuple(sorted(bounds.items())))
+        with time_budget.uninterruptible(), _queries_lock:
+            matching = _queries.get(key)
+            if matching is not None:
+                _queries.move_to_end(key)
+                return matching
+
+        matching = question_bank.intersect(matches)
 
-        with open(data_path, 'rb') as f:
-            question_number = random.randint(0, len(byte_indices) - 1)
-            first_byte = byte_indices[question_number]
-            last_byte = byte_indices[question_number + 1]
+        with time_budget.uninterruptible(), _queries_lock:
+            _queries[key] = matching
+            while len(_queries) > MAX_QUERIES:
+                _queries.popitem(last=False)
 
-            f.seek(first_byte)
-            pickled_question = f.read(last_byte - first_byte)
+        return matching
 
-        return pickle.loads(pickled_question)
+    @classmethod
+    def scan_random_question(cls, where=None):
+        """Return a random set of valid coefficients for this question.
+
+        where -- only return coefficients matching this query - see matching_questions
+        """
+        return cls.scan_random_questions(1, where=where)[0]
+
+    @classmethod
+    def scan_random_questions(cls, k, replace=False, where=None):
+        """Return k random sets of valid coefficients for this question.
+
+        Unless replace is True, no set of coefficients is returned twice - so a class set never repeats a question.
+
+        where -- only return coefficients matching this query - see matching_questions
+        """
+        num_questions, stored_question = cls.stored_questions()
+
+        question_numbers = range(num_questions)
+        if where is not None:
+            question_numbers = cls.matching_questions(where)
+
+        if len(question_numbers) == 0:
+            raise ValueError('There are no stored questions for {0} matching: {1}'.format(cls.__name__, where))
+
+        rng = randomness.current()
+        if replace:
+            chosen = [rng.randrange(len(question_numbers)) for i in range(k)]
+        elif k > len(question_numbers):
+            raise ValueError('There are only {0} stored questions for {1} matching: {2}, so {3} different questions '
+                             'cannot be drawn'.format(len(question_numbers), cls.__name__, where, k))
+        else:
+            chosen = rng.sample(range(len(question_numbers)), k)
+
+        return [stored_question(int(question_numbers[i])) for i in chosen]
 
     def combined_question_dict(self):
         """Return the combined dictionary of a question's parameters and information.
         """
 
-        combined = copy.deepcopy(self._qp)
+        combined = copy_parameters(self._qp)
         if hasattr(self, '_qi'):
             combined.update(self._qi)
 
         return combined
 
 
+def shard(sequence, shard=0, shards=1):
+    """Return the part of a sequence that belongs to one shard of it, for a sharded enumerate_questions.
+
+    Shards are contiguous, so merging the shards' segments in order gives the same questions in the same order as
+    enumerating without shards - and so the same seed picks the same stored question however the bank was built.
+
+    >>> [list(shard(range(7), i, 3)) for i in range(3)]
+    [[0, 1], [2, 3], [4, 5, 6]]
+    """
+
+    start = len(sequence) * shard // shards
+    stop = len(sequence) * (shard + 1) // shards
+
+    return sequence[start:stop]
+
+
+def _write_pickled(data_path, questions):
+    """Pickle every question to a data file one after another, returning the byte offset of each question.
+
+    The offsets end with the offset of the end of the file, so question n is between offsets n and n + 1.
+    """
+
+    byte_indices = [0]
+    with open(data_path, 'wb') as f:
+        for question in questions:
+            pickle.dump(question, f)
+            byte_indices.append(f.tell())
+
+    return byte_indices
+
+
+def _segment_shards(segments_folder):
+    """Return how many shards the finished segments in a folder were split into, or None if there are none.
+    """
+
+    if not os.path.isdir(segments_folder):
+        return None
+
+    for file_name in os.listdir(segments_folder):
+        match = _SEGMENT_PATTERN.match(file_name)
+        if match is not None:
+            return int(match.group(1))
+
+    return None
+
+
+def _store_shard(cls, shard, shards, segment_path):
+    """Enumerate one shard of a class' questions into a segment. This is what each process of a sharded
+    store_question runs.
+
+    The segment is renamed into place once it is complete, so a segment that exists is a finished shard.
+    """
+
+    if hasattr(cls, 'enumerate_columns'):
+        question_bank.write_columns(segment_path, cls.bank_fields, cls.enumerate_columns(shard=shard, shards=shards))
+    elif cls.bank_fields is not None:
+        question_bank.write_bank(segment_path, cls.bank_fields, cls.enumerate_questions(shard=shard, shards=shards))
+    else:
+        byte_indices = _write_pickled(segment_path + '.data', cls.enumerate_questions(shard=shard, shards=shards))
+
+        with open(segment_path + '.tmp', 'wb') as f:
+            pickle.dump(byte_indices, f)
+        os.replace(segment_path + '.tmp', segment_path)
+
+
 def root(cls):
     """A class decorator to specify a question root.
     """
@@ -116,116 +569,193 @@ def is_child_of(*parents):
 
 
 class PartTree:
-    def __init__(self, cls):
+    def __init__(self, cls, seed=None):
         self.cls = cls
+        self.seed = seed  # if set, every question built from this tree is the same question
         self.children = []  # PartTrees of all the subparts
 
     def _find_parent(self, cls):
         """A helper function for "add_subpart".
 
-        Given the existing question tree, find out where to insert a new part.
+        Given the existing question tree, find out where to insert a new part, or return None if its parent isn't in
+        the tree.
         """
 
         if self.cls in cls.parents:  # the current node is the parent
             return self
-        else:  # check if any of the current node's children is the parent
-            for i in self.children:
-                if i._find_parent(cls):
-                    return i._find_parent(cls)
 
-        raise RuntimeError('The class: {0} could not be located in the tree'.format(cls.__name__))
+        for i in self.children:  # check if any of the current node's children is the parent
+            parent = i._find_parent(cls)
+            if parent is not None:
+                return parent
+
+        return None
 
     def add_subpart(self, cls):
         """Add a new class to the tree.
         """
 
-        child = PartTree(cls)
         parent = self._find_parent(cls)
-        parent.children.append(child)
+        if parent is None:
+            raise RuntimeError('The class: {0} could not be located in the tree'.format(cls.__name__))
+
+        parent.children.append(PartTree(cls))
+
+    @classmethod
+    def from_structure(cls, structure, module, seed=None):
+        """Return a tree built from a compiled structure - see compile_structure.
+        """
+
+        class_name, children = structure
+
+        tree = PartTree(DummyPart if class_name == DummyPart.__name__ else getattr(module, class_name), seed)
+        tree.children = [PartTree.from_structure(child, module) for child in children]
+
+        return tree
+
+    def structure(self):
+        """Return the tree's structure as nested [class name, [children]] lists, which can be saved as JSON.
+        """
 
-    def _instantiate_tree(self, depth=0, parent=None):
+        return [self.cls.__name__, [child.structure() for child in self.children]]
+
+    def copy(self, seed=None):
+        """Return a copy of the tree's structure, without any of its instantiated objects.
+
+        This lets a parsed tree be kept as a template, with each question built from a fresh copy of it.
+        """
+
+        tree = PartTree(self.cls, seed)
+        tree.children = [child.copy() for child in self.children]
+
+        return tree
+
+    def _instantiate_tree(self, depth=0, parent=None, rng=None):
         """Traverse the tree and instantiates an object of each class,
         creating a question for the student to do.
+
+        Every part draws its random numbers from rng. If no rng is given, the root builds one from the tree's seed,
+        or uses the current random number generator if the tree has no seed.
         """
 
-        if depth == 0:  # there's no parent part
-            self.object = self.cls()
-        elif isinstance(parent, DummyPart):  # there is a dummy for the parent part - there's no information to inherit
-            self.object = self.cls()
-        else:
-            self.object = self.cls(part=parent)
+        if rng is None:
+            rng = randomness.seeded(self.seed)
+        self.rng = rng
+
+        with randomness.using(rng):
+            if depth == 0:  # there's no parent part
+                self.object = self.cls()
+            elif isinstance(parent, DummyPart):  # there is a dummy for the parent part - there's no information to inherit
+                self.object = self.cls()
+            else:
+                self.object = self.cls(part=parent)
+
+        # hand the part's parameters to a ParameterDict, so its children can copy them without deep-copying them
+        for attribute in ['_qp', '_qi']:
+            parameters = getattr(self.object, attribute, None)
+            if type(parameters) is dict:
+                setattr(self.object, attribute, ParameterDict.adopt(parameters))
 
         for child in self.children:
-            child._instantiate_tree(depth + 1, self.object)
+            child._instantiate_tree(depth + 1, self.object, rng)
 
-    def _question_traversal_to_latex(self, depth=0):  # uses the enumitem package which gives us some hbox errors
-        """Traverse the tree, returning the latex for each instantiated object.
+    def _question_traversal(self, depth=0):  # uses the enumitem package which gives us some hbox errors
+        """Traverse the tree, yielding the latex for each instantiated object as it is reached.
         """
 
-        total_string = r'\item' + '\n'
+        yield r'\item' + '\n'
 
         if depth == 0:
-            total_string += '\n'
+            yield '\n'
 
         if not hasattr(self.object, 'question_statement'):
-            total_string += '$ $'
+            yield '$ $'
         else:
-            total_string += self.object.question_statement() + '\n'
+            yield self.object.question_statement()
+            yield '\n'
 
         if self.object.num_lines != 0:
-            total_string += r'\fillwithlines{{{0}in}}'.format(self.object.num_lines / 4) + '\n'
+            yield r'\fillwithlines{{{0}in}}'.format(self.object.num_lines / 4) + '\n'
 
         if self.children:
-            total_string += r'\begin{parts}' + '\n' + '\n'.join(
-                i._question_traversal_to_latex(depth + 1) for i in self.children) + r'\end{parts}' + '\n'
+            yield r'\begin{parts}' + '\n'
+            for index, child in enumerate(self.children):
+                if index != 0:
+                    yield '\n'
+                yield from child._question_traversal(depth + 1)
+            yield r'\end{parts}' + '\n'
 
-        return total_string + '\n'
+        yield '\n'
 
-    def _solution_traversal_to_latex(self, depth=0):  # uses the enumitem package which gives us some hbox errors
-        """Traverse the tree, returning the latex for each instantiated object.
+    def _solution_traversal(self, depth=0):  # uses the enumitem package which gives us some hbox errors
+        """Traverse the tree, yielding the latex for each instantiated object as it is reached.
         """
 
-        total_string = r'\item' + '\n'
+        yield r'\item' + '\n'
 
         if depth == 0:
-            total_string += '\n'
+            yield '\n'
 
         if not hasattr(self.object, 'solution_statement'):
-            total_string += '$ $'
+            yield '$ $'
         else:
-            total_string += self.object.solution_statement() + '\n'
+            yield self.object.solution_statement()
+            yield '\n'
 
         if self.children:
-            total_string += r'\begin{parts}' + '\n' + '\n'.join(
-                i._solution_traversal_to_latex(depth + 1) for i in self.children) + r'\end{parts}' + '\n'
+            yield r'\begin{parts}' + '\n'
+            for index, child in enumerate(self.children):
+                if index != 0:
+                    yield '\n'
+                yield from child._solution_traversal(depth + 1)
+            yield r'\end{parts}' + '\n'
 
-        return total_string + '\n'
+        yield '\n'
 
-    def write_question(self, f):
-        self._instantiate_tree()
-        f.write(self._question_traversal_to_latex())
+    def _question_traversal_to_latex(self, depth=0):
+        """Traverse the tree, returning the latex for each instantiated object.
+        """
+
+        return ''.join(self._question_traversal(depth))
+
+    def _solution_traversal_to_latex(self, depth=0):
+        """Traverse the tree, returning the latex for each instantiated object.
+        """
+
+        return ''.join(self._solution_traversal(depth))
+
+    def write_question(self, f, rng=None):
+        self._instantiate_tree(rng=rng)
+        with randomness.using(self.rng):
+            for chunk in self._question_traversal():
+                f.write(chunk)
 
     def write_solution(self, f):
-        f.write(self._solution_traversal_to_latex())
+        with randomness.using(self.rng):
+            for chunk in self._solution_traversal():
+                f.write(chunk)
 
     def show_question(self):
         """Return a question's latex (assuming the question tree has already been populated).
         """
         self._instantiate_tree()
-        return self._question_traversal_to_latex()
+        with randomness.using(self.rng):
+            return self._question_traversal_to_latex()
 
-    def question_statement(self):
+    def question_statement(self, rng=None):
         """Return the LaTeX representing the question.
         """
 
-        self._instantiate_tree()
-        return self._question_traversal_to_latex()
+        self._instantiate_tree(rng=rng)
+        with randomness.using(self.rng):
+            return self._question_traversal_to_latex()
 
     def solution_statement(self):
         """Return the LaTeX representing the solution.
         """
 
-        return self._solution_traversal_to_latex()
+        with randomness.using(self.rng):
+            return self._solution_traversal_to_latex()
 
 
 def exists_dummy_parent(parts):
@@ -267,10 +797,10 @@ def ordered_parts(module, parts):
     return sorted(part_locations_in_file, key=part_locations_in_file.get)
 
 
-def parse_structure(module):
-    """Parse the question structure based on the relationships of classes in a module.
+def compile_structure(module):
+    """Return the structure of every question tree in a module, or None if the module's questions aren't complete.
 
-    Will be evolved over time!!!
+    Each tree's structure is nested [class name, [children]] lists - see PartTree.structure.
     """
 
     if hasattr(module, 'question_not_complete'):
@@ -306,33 +836,85 @@ def parse_structure(module):
 
     def build_from_root(root, parts):
         """Given a root, build a question tree out of the part heirarchy.
-        """
 
-        parts = copy.deepcopy(parts)
+        Parts are added in the order they are defined, and a part whose parent isn't in the tree belongs to another
+        root's tree.
+        """
 
         tree = PartTree(root)
-        parts.remove(root)
-
-        # since we will iterate over the reversed list, we want to reverse it here so we are still
-        # technically checking each part in order
-        parts = list(reversed(parts))
-        while parts:
-            # we iterate over the reversed list so we can remove as we go, otherwise we run into unintuitive errors
-            # like skipping items in the iteration
-            for part in reversed(parts):
-                try:
-                    tree.add_subpart(part)
-                except RuntimeError as e:
-                    # the part could not be located in the tree
-                    # we could do this a more efficient way, but we are dealing with O(1) parts so raising a couple of
-                    # exceptions here won't change much
-                    pass
-
-                parts.remove(part)
+        for part in parts:
+            if part is root:
+                continue
+
+            parent = tree._find_parent(part)
+            if parent is not None:
+                parent.children.append(PartTree(part))
 
         return tree
 
     parts = ordered_parts(module, parts)
-    trees = [build_from_root(root, parts) for root in roots]
+    return [build_from_root(root, parts).structure() for root in roots]
+
+
+# bump this whenever compile_structure changes, so structures cached on disk by older code aren't used
+_STRUCTURE_FORMAT = 1
+
+# module name -> ((path, modification time, size) of the module's file, compiled structure)
+_compiled_structures = {}
+
+
+def compiled_structure(module):
+    """Return the compiled structure of a module - see compile_structure - compiling it at most once per version of the
+    module.
+
+    Structures are kept in memory for as long as the module's file is unchanged, and on disk keyed by a hash of the
+    module's source, so a new process doesn't have to compile them again either.
+    """
+
+    stat = os.stat(module.__file__)
+    stamp = (module.__file__, stat.st_mtime_ns, stat.st_size)
+
+    cached = _compiled_structures.get(module.__name__)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    structure_cache = disk_cache.DiskCache('structures')
+    key = disk_cache.hash_key(_STRUCTURE_FORMAT, module.__name__, disk_cache.hash_files([module.__file__]))
+
+    cached_on_disk = False
+    try:
+        entry_path = structure_cache.get(key)
+        if entry_path is not None:
+            with open(os.path.join(entry_path, 'structure.json')) as f:
+                structure = json.load(f)
+            cached_on_disk = True
+    except (OSError, ValueError):
+        pass  # the disk cache is only ever a shortcut
+
+    if not cached_on_disk:
+        structure = compile_structure(module)
+        try:
+            structure_cache.put(key, {'structure.json': json.dumps(structure)})
+        except OSError:
+            pass
+
+    _compiled_structures[module.__name__] = (stamp, structure)
+    return structure
+
+
+def parse_structure(module, seed=None):
+    """Parse the question structure based on the relationships of classes in a module.
+
+    If a seed is given, every question built from the returned trees is the same question for that seed.
+
+    The structure is only worked out once for each version of the module (see compiled_structure), so parsing is just
+    building the trees from it.
+
+    Will be evolved over time!!!
+    """
+
+    structure = compiled_structure(module)
+    if structure is None:
+        return None
 
-    return trees
+    return [PartTree.from_structure(tree_structure, module, seed) for tree_structure in structure]
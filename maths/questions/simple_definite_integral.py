@@ -1,8 +1,8 @@
 import sympy
-import random
+from ..randomness import random
 from ..symbols import x
 from .. import all_functions, not_named_yet
-from ..latex import expressions, solutions
+from ..latex import expressions, solutions, printer
 from . import relationships
 
 
@@ -70,7 +70,7 @@ class SimpleDefiniteIntegral(relationships.QuestionPart):
         )
 
         lines += r'$= {answer}$'.format(
-            answer=sympy.latex(self._qp['answer'])
+            answer=printer.latex(self._qp['answer'])
         )
 
         return lines.write()
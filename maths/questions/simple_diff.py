@@ -1,8 +1,8 @@
 import sympy
-import random
+from ..randomness import random
 from .. import all_functions, not_named_yet
-from ..latex import latex, solutions
-from ..utils import noevals
+from ..latex import latex, solutions, printer
+from ..utils import noevals, retries
 from ..symbols import *
 from . import relationships
 
@@ -55,7 +55,7 @@ class SimpleDiff(relationships.QuestionPart):
 
     def question_statement(self):
         return r"Let $f(x) = {equation}$. Find $f'(x)$.".format(
-            equation=sympy.latex(self._qp['equation'])
+            equation=printer.latex(self._qp['equation'])
         )
 
     def solution_statement(self):
@@ -65,11 +65,11 @@ class SimpleDiff(relationships.QuestionPart):
         if self._qp['equation'].as_base_exp()[1] != 1:
             u = sympy.Symbol('u')
             inner_function, exponent = self._qp['equation'].as_base_exp()
-            lines += r"Let $f(x) = {0} = {1}, u = {2}$".format(sympy.latex(self._qp['equation']), sympy.latex(u ** exponent), sympy.latex(inner_function))
-            lines += r"$f'(x) = \frac{{dy}}{{du}} \times \frac{{du}}{{dx}} = %s \times u'$" % sympy.latex((u ** exponent).diff())
+            lines += r"Let $f(x) = {0} = {1}, u = {2}$".format(printer.latex(self._qp['equation']), printer.latex(u ** exponent), printer.latex(inner_function))
+            lines += r"$f'(x) = \frac{{dy}}{{du}} \times \frac{{du}}{{dx}} = %s \times u'$" % printer.latex((u ** exponent).diff())
 
         lines += r"$f'(x) = {0}$".format(
-            sympy.latex(self._qp['derivative'].factor())
+            printer.latex(self._qp['derivative'].factor())
         )
 
         return lines.write()
@@ -128,7 +128,7 @@ class SimpleDiffEval(relationships.QuestionPart):
             self._qp['equation'] = 1 / self._qp['equation']
         denominator = linear_function.as_numer_denom()[1]
 
-        while True:
+        for attempt in retries.attempts():
             if non_linear_function == sympy.exp(x):
                 self._qp['x_value'] = random.randint(-2, 2)
             else:
@@ -152,7 +152,7 @@ class SimpleDiffEval(relationships.QuestionPart):
         elif outer_function == sympy.log:
             # the inner quadratic may never yield a positive number in this domain, so we will try
             # a couple of times to find an x value that works, then we will request a new quadratic
-            while True:
+            for attempt in retries.attempts():
                 self._qp['x_value'] = random.randint(-3, 3)
                 inner_function = all_functions.request_quadratic(difficulty=random.randint(1, 3)).equation
                 if inner_function.subs({x: self._qp['x_value']}) > 0:
@@ -192,8 +192,8 @@ class SimpleDiffEval(relationships.QuestionPart):
 
     def question_statement(self):
         return r"If $f(x) = {equation}$, find $f'({x_value})$.".format(
-            equation=sympy.latex(self._qp['equation']),
-            x_value=sympy.latex(self._qp['x_value'])
+            equation=printer.latex(self._qp['equation']),
+            x_value=printer.latex(self._qp['x_value'])
         )
 
     def solution_statement(self):
@@ -201,7 +201,7 @@ class SimpleDiffEval(relationships.QuestionPart):
 
         lines = solutions.Lines()
         lines += r"$f'(x) = {derivative}$".format(
-            derivative=sympy.latex(self._qp['derivative'])
+            derivative=printer.latex(self._qp['derivative'])
         )
 
         # print extra steps when dealing with trig functions
@@ -209,8 +209,8 @@ class SimpleDiffEval(relationships.QuestionPart):
             noeval_derivative = noevals.noevalify(self._qp['derivative'], include=[sympy.sin, sympy.cos])
 
             lines += r"$f'({x_value}) = {derivative}$".format(
-                x_value=sympy.latex(self._qp['x_value']),
-                derivative=sympy.latex(noeval_derivative)
+                x_value=printer.latex(self._qp['x_value']),
+                derivative=printer.latex(noeval_derivative)
             )
 
             subpart_values = []
@@ -220,8 +220,8 @@ class SimpleDiffEval(relationships.QuestionPart):
                 subpart_value = subpart.subs({x: self._qp['x_value']})
                 unevaluated_subpart = noeval_subpart.subs({x: self._qp['x_value']})
                 subpart_text = r'${unevaluated_subpart} = {subpart_value}$'.format(
-                    unevaluated_subpart=sympy.latex(unevaluated_subpart),
-                    subpart_value=sympy.latex(subpart_value)
+                    unevaluated_subpart=printer.latex(unevaluated_subpart),
+                    subpart_value=printer.latex(subpart_value)
                 )
 
                 subpart_values.append(subpart_text)
@@ -229,8 +229,8 @@ class SimpleDiffEval(relationships.QuestionPart):
             lines += ', '.join(subpart_values)
 
         lines += r"$f'({x_value}) = {answer}$".format(
-            x_value=sympy.latex(self._qp['x_value']),
-            answer=sympy.latex(self._qp['answer'])
+            x_value=printer.latex(self._qp['x_value']),
+            answer=printer.latex(self._qp['answer'])
         )
 
         return lines.write()
@@ -1,5 +1,5 @@
 import sympy
-import random
+from ..randomness import random
 from .. import all_functions, not_named_yet, simplify
 from ..latex import solutions
 from ..symbols import x
@@ -2,10 +2,9 @@ import sympy
 from ..symbols import x, y
 from ..rich_requests import requests
 from ..plot import plot
-from ..utils import transformations, noevals
-import random
-import copy
-from ..latex import solutions
+from ..utils import transformations, noevals, retries
+from ..randomness import random
+from ..latex import solutions, printer
 from . import relationships
 
 
@@ -49,8 +48,8 @@ class SimpleSketch(relationships.QuestionPart):
 
         return r'''Sketch the graph of $f: {domain} \rightarrow R, f(x) = {equation}$. Label the axes intercepts and
             endpoints with their coordinates. {plot}'''.format(
-            domain=sympy.latex(self._qp['domain']),
-            equation=sympy.latex(self._qp['equation']),
+            domain=printer.latex(self._qp['domain']),
+            equation=printer.latex(self._qp['equation']),
             plot=plot.latex(path)
         )
 
@@ -82,18 +81,19 @@ class PointTransformation(relationships.QuestionPart):
 
     def __init__(self, part):
         self.num_lines, self.num_marks = 4, 1
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
-        y_point = sympy.oo
-        while y_point in [-sympy.oo, sympy.oo]:
+        for attempt in retries.attempts():
             x_point = random.choice(range(self._qp['domain'].left, self._qp['domain'].right + 1))
             y_point = self._qp['equation'].subs({x: x_point})
+            if y_point not in [-sympy.oo, sympy.oo]:
+                break
         self._qp['point'] = (x_point, y_point)
         self._qp['transformations'] = transformations.random_transformation(num_transformations=2)
 
     def question_statement(self):
         return r'''Find the coordinates of the image of the point ${point}$ {description_of_transformations}.'''.format(
-            point=sympy.latex(self._qp['point']),
+            point=printer.latex(self._qp['point']),
             description_of_transformations=transformations.description_of_transformations(self._qp['transformations'])
         )
 
@@ -105,8 +105,8 @@ class PointTransformation(relationships.QuestionPart):
 
         mapped_point = transformations.apply_transformations(self._qp['transformations'], self._qp['point'])
         lines += r'$\therefore {point} \rightarrow {mapped_point}$'.format(
-            point=sympy.latex(self._qp['point']),
-            mapped_point=sympy.latex(mapped_point),
+            point=printer.latex(self._qp['point']),
+            mapped_point=printer.latex(mapped_point),
         )
 
         return lines.write()
@@ -129,7 +129,7 @@ class EquationTransformation(relationships.QuestionPart):
 
     def __init__(self, part):
         self.num_lines, self.num_marks = 8, 2
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
         self._qp['transformations'] = transformations.random_transformation(num_transformations=2)
 
@@ -144,8 +144,8 @@ class EquationTransformation(relationships.QuestionPart):
         x_, y_ = sympy.symbols("x' y'")
         new_coords = (x_, y_)
         lines += r"Let our new ${old_x_y_coordinates}$ coordinates be ${new_x_y_coordinates}$.".format(
-            old_x_y_coordinates=sympy.latex((x, y)),
-            new_x_y_coordinates=sympy.latex((x_, y_))
+            old_x_y_coordinates=printer.latex((x, y)),
+            new_x_y_coordinates=printer.latex((x_, y_))
         )
 
         mapping = transformations.overall_transformation(self._qp['transformations'])
@@ -156,10 +156,10 @@ class EquationTransformation(relationships.QuestionPart):
 
         reversed_mapping = tuple(i.subs({x: x_, y: y_}) for i in reversed_mapping)
         lines += r'Hence, ${mapping} \rightarrow {new_mapping}$ and ${old_x_y_coordinates} \rightarrow {new_x_y_coordinates}$'.format(
-            mapping=sympy.latex(mapping),
-            new_mapping=sympy.latex(new_coords),
-            old_x_y_coordinates=sympy.latex((x, y)),
-            new_x_y_coordinates=sympy.latex(reversed_mapping)
+            mapping=printer.latex(mapping),
+            new_mapping=printer.latex(new_coords),
+            old_x_y_coordinates=printer.latex((x, y)),
+            new_x_y_coordinates=printer.latex(reversed_mapping)
         )
 
         lines += 'Now we apply the mapping to the equation:'
@@ -167,11 +167,11 @@ class EquationTransformation(relationships.QuestionPart):
         noevaled_equation = noevals.noevalify(self._qp['equation'])
         noevalmapped_equation = noevaled_equation.subs({x: reversed_mapping[0]})
         lines += r'${0} = {1}$'.format(
-            sympy.latex(reversed_mapping[1]),
-            sympy.latex(noevalmapped_equation)
+            printer.latex(reversed_mapping[1]),
+            printer.latex(noevalmapped_equation)
         )
 
         answer = transformations.apply_transformations(self._qp['transformations'], self._qp['equation'])
-        lines += r'Hence our mapped equation is $y = {0}$.'.format(sympy.latex(answer.apart()))
+        lines += r'Hence our mapped equation is $y = {0}$.'.format(printer.latex(answer.apart()))
 
         return lines.write()
@@ -1,9 +1,10 @@
 import sympy
 from ..relations.trigonometry import trig
-import random
+from ..randomness import random
 from ..symbols import x, coeff0, coeff1
 from .. import all_functions, sets
-from ..latex import solutions
+from ..latex import solutions, printer
+from ..utils import time_budget
 from . import relationships
 import itertools
 
@@ -63,9 +64,9 @@ class SimpleTrigSolve(relationships.QuestionPart):
 
     def question_statement(self):
         return r'Solve the equation ${equation} = {value}$ for $x \in {domain}$.'.format(
-            equation=sympy.latex(self._qp['equation']),
-            value=sympy.latex(self._qp['value']),
-            domain=sympy.latex(self._qp['domain'])
+            equation=printer.latex(self._qp['equation']),
+            value=printer.latex(self._qp['value']),
+            domain=printer.latex(self._qp['domain'])
         )
 
     def solution_statement(self):
@@ -74,16 +75,16 @@ class SimpleTrigSolve(relationships.QuestionPart):
         true_equation = self._qp['equation'] / self._qp['equation_coeff']
         if self._qp['equation_coeff'] != 1:
             lines += r'${0} = {1}$'.format(
-                sympy.latex(true_equation),
-                sympy.latex(self._qp['true_value'])
+                printer.latex(true_equation),
+                printer.latex(self._qp['true_value'])
             )
 
         # perform the transformation of self._qp['equation_interior'] on the domain
         dilated_domain = sets.transform_set(x, self._qp['equation_interior'].coeff(x) * x, self._qp['domain'])
         if self._qp['equation_interior'].coeff(x) != 1:
             lines += r'${dilated_x} \in {dilated_domain}$'.format(
-                dilated_x=sympy.latex(self._qp['equation_interior'].coeff(x) * x),
-                dilated_domain=sympy.latex(dilated_domain)
+                dilated_x=printer.latex(self._qp['equation_interior'].coeff(x) * x),
+                dilated_domain=printer.latex(dilated_domain)
             )
 
         dilated_and_translated_domain = sets.transform_set(x, self._qp['equation_interior'], self._qp['domain'])
@@ -93,18 +94,18 @@ class SimpleTrigSolve(relationships.QuestionPart):
         # if it's a sympy.Add object, there will be a constant coefficient
         if isinstance(self._qp['equation_interior'], sympy.Add):
             lines += r'${dilated_and_translated_x} \in {dilated_and_translated_domain}$'.format(
-                dilated_and_translated_x=sympy.latex(self._qp['equation_interior']),
-                dilated_and_translated_domain=sympy.latex(dilated_and_translated_domain)
+                dilated_and_translated_x=printer.latex(self._qp['equation_interior']),
+                dilated_and_translated_domain=printer.latex(dilated_and_translated_domain)
             )
 
         trig_type = all_functions.detect_expr_type(self._qp['equation'])
         base_solutions = sympy.solve(trig_type(x) - self._qp['true_value'])
         lines += r'The {base_solutions_maybe_pluralise} for ${basic_expr} = {true_value}$ {is_or_are} ${solutions}$'.format(
             base_solutions_maybe_pluralise='base solution' if len(base_solutions) == 1 else 'base solutions',
-            basic_expr=sympy.latex(trig_type(x)),
-            true_value=sympy.latex(self._qp['true_value']),
+            basic_expr=printer.latex(trig_type(x)),
+            true_value=printer.latex(self._qp['true_value']),
             is_or_are='is' if len(base_solutions) == 1 else 'are',
-            solutions=', '.join(sympy.latex(i) for i in base_solutions)
+            solutions=', '.join(printer.latex(i) for i in base_solutions)
         )
 
         dilated_and_translated_solutions = solutions_for_transformed_domain(true_equation, self._qp['true_value'], dilated_and_translated_domain)
@@ -117,7 +118,7 @@ class SimpleTrigSolve(relationships.QuestionPart):
                 base = base_solutions[1]
 
             n_revolutions = (i - base) / period
-            string = sympy.latex(base)
+            string = printer.latex(base)
             if n_revolutions > 0:
                 string += r' + ({0} \times 2\pi)'.format(n_revolutions)
             elif n_revolutions < 0:
@@ -126,29 +127,29 @@ class SimpleTrigSolve(relationships.QuestionPart):
             revolutions_away.append(string)
 
         lines += r'$\therefore {interior} = {solutions}$'.format(
-            interior=sympy.latex(self._qp['equation_interior']),
+            interior=printer.latex(self._qp['equation_interior']),
             solutions=', '.join(i for i in revolutions_away)
         )
 
         dilated_and_translated_solutions = solutions_for_transformed_domain(true_equation, self._qp['true_value'], dilated_and_translated_domain)
         lines += r'$= {solutions}$'.format(
-            interior=sympy.latex(self._qp['equation_interior']),
-            solutions=', '.join(sympy.latex(i) for i in dilated_and_translated_solutions)
+            interior=printer.latex(self._qp['equation_interior']),
+            solutions=', '.join(printer.latex(i) for i in dilated_and_translated_solutions)
         )
 
         if self._qp['equation_interior'].coeff(x, 0) != 0:
             offset = self._qp['equation_interior'].coeff(x, 0)
             dilated_solutions = [i - offset for i in dilated_and_translated_solutions]
             lines += r'${interior} = {solutions}$'.format(
-                interior=sympy.latex(self._qp['equation_interior'].coeff(x) * x),
-                solutions=', '.join(sympy.latex(i) for i in dilated_solutions)
+                interior=printer.latex(self._qp['equation_interior'].coeff(x) * x),
+                solutions=', '.join(printer.latex(i) for i in dilated_solutions)
             )
 
         if self._qp['equation_interior'].coeff(x) != 1:
             coeff_x = self._qp['equation_interior'].coeff(x)
             final_solutions = sorted([i / coeff_x for i in dilated_solutions])
             lines += r'$x = {solutions}$'.format(
-                solutions=', '.join(sympy.latex(i) for i in final_solutions)
+                solutions=', '.join(printer.latex(i) for i in final_solutions)
             )
 
         return lines.write()
@@ -179,6 +180,7 @@ def solutions_for_transformed_domain(expr, value, transformed_domain):
     for i in base_solutions:
         i_down = i
         while True:  # go down
+            time_budget.check()  # an unbounded domain never ends the walk
             if i_down in transformed_domain:
                 all_solutions.append(i_down)
 
@@ -188,6 +190,7 @@ def solutions_for_transformed_domain(expr, value, transformed_domain):
 
         i_up = i
         while True:  # go up
+            time_budget.check()
             i_up += period
             if i_up in transformed_domain:
                 all_solutions.append(i_up)
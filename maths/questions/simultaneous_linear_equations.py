@@ -1,10 +1,9 @@
 import sympy
-import random
+from ..randomness import random
 from ..symbols import x, y, k
 from .. import not_named_yet
-from ..latex import solutions
+from ..latex import solutions, printer
 from . import relationships
-import copy
 
 
 @relationships.root
@@ -46,12 +45,12 @@ class SimultaneousLinearEquationsSetup(relationships.QuestionPart):
     def question_statement(self):
         lines = solutions.Lines()
         lines += r'equation 1 is: ${0} = {1}$'.format(
-            sympy.latex(self._qp['equation_one'][0]),
-            sympy.latex(self._qp['equation_one'][1])
+            printer.latex(self._qp['equation_one'][0]),
+            printer.latex(self._qp['equation_one'][1])
         )
         lines += r'equation 2 is: ${0} = {1}$'.format(
-            sympy.latex(self._qp['equation_two'][0]),
-            sympy.latex(self._qp['equation_two'][1])
+            printer.latex(self._qp['equation_two'][0]),
+            printer.latex(self._qp['equation_two'][1])
         )
 
         return lines.write()
@@ -74,7 +73,7 @@ class InfiniteOrNoSolutions(relationships.QuestionPart):
 
     def __init__(self, part):
         self.num_lines, self.num_marks = 9, 3
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
     def question_statement(self):
         return r'Find the values of $k$ for which there are {quantity} solutions.'.format(
@@ -92,20 +91,20 @@ class InfiniteOrNoSolutions(relationships.QuestionPart):
         y_equation_two = self._qp['equation_two'][0].coeff(y)
 
         lines += r'$\frac{{{x_equation_one}}}{{{x_equation_two}}} = \frac{{{y_equation_one}}}{{{y_equation_two}}}$'.format(
-            x_equation_one=sympy.latex(x_equation_one),
-            x_equation_two=sympy.latex(x_equation_two),
-            y_equation_one=sympy.latex(y_equation_one),
-            y_equation_two=sympy.latex(y_equation_two)
+            x_equation_one=printer.latex(x_equation_one),
+            x_equation_two=printer.latex(x_equation_two),
+            y_equation_one=printer.latex(y_equation_one),
+            y_equation_two=printer.latex(y_equation_two)
         )
 
         quadratic = x_equation_one * y_equation_two - x_equation_two * y_equation_one
         lines += r'${0} = 0$'.format(
-            sympy.latex(quadratic.expand())
+            printer.latex(quadratic.expand())
         )
 
         k_solutions = sympy.solve(quadratic)
         lines += r'$k = {0}$'.format(
-            ', '.join(sympy.latex(i) for i in k_solutions)
+            ', '.join(printer.latex(i) for i in k_solutions)
         )
 
         return lines.write()
@@ -128,7 +127,7 @@ class UniqueSolution(relationships.QuestionPart):
 
     def __init__(self, part):
         self.num_lines, self.num_marks = 2, 1
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
     def question_statement(self):
         return r'Find the values of $k$ for which there is a unique solution.'
@@ -145,7 +144,7 @@ class UniqueSolution(relationships.QuestionPart):
         k_solutions = sympy.solve(quadratic)
 
         lines += r'$k \neq {0}$'.format(
-            ', '.join(sympy.latex(i) for i in k_solutions)
+            ', '.join(printer.latex(i) for i in k_solutions)
         )
 
         return lines.write()
@@ -1,11 +1,10 @@
 import sympy
-import random
+from ..randomness import random
 from sympy.abc import *
 from ..plot import plot
 from .. import all_functions, not_named_yet
 from ..utils import functions
 from . import relationships
-import copy
 
 
 question_not_complete = True
@@ -17,7 +16,7 @@ class SketchDoubleInverse:
         # 2008 Q10b [0 lines] [1 mark] [Blank plot]
         self.num_lines, self.num_marks = 0, 1
 
-        self._qp = copy.deepcopy(part._qp)
+        self._qp = relationships.copy_parameters(part._qp)
 
         if self._qp['domain'].left != -sympy.oo and self._qp['domain'].right != sympy.oo:
             raise ValueError('This questions needs an open ended domain.')
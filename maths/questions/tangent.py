@@ -1,12 +1,11 @@
 import sympy
-import random
+from ..randomness import random
 from ..symbols import x
 from .. import all_functions, not_named_yet
 from ..latex import solutions
+from ..utils import question_bank, polynomial_grid
 from . import relationships
 import itertools
-import os
-import pickle
 
 
 question_not_complete = True
@@ -40,11 +39,25 @@ def enumerate_cubics():
         yield coeffs[0]*x**3 + coeffs[1]*x**2 + coeffs[2]*x + coeffs[3]
 
 
-def enumerate_curves():
+def curve_coefficients():
+    """Return the coefficients of every quadratic and cubic as a polynomial_grid grid, in enumerate_curves order.
+    """
+    import numpy
+
+    leading_coefficients = [i for i in range(-5, 6) if i != 0]
+    quadratics = polynomial_grid.coefficient_grid(leading_coefficients, range(-10, 11), range(-10, 11))
+    cubics = polynomial_grid.coefficient_grid(leading_coefficients, range(-10, 11), range(-10, 11), range(-10, 11))
+
+    return numpy.concatenate([polynomial_grid.pad(quadratics, 3), cubics])
+
+
+def enumerate_curves(shard=0, shards=1):
     """Combine multiple generators into one to allow easy calling.
+
+    The curves can be split into shards, so they can be enumerated over multiple processes.
     """
-    yield from enumerate_quadratics()
-    yield from enumerate_cubics()
+    for coefficients in relationships.shard(curve_coefficients(), shard, shards):
+        yield polynomial_grid.to_sympy(coefficients)
 
 
 def enumerate_tangents(curve, domain=list(range(-5, 6))):
@@ -96,6 +109,25 @@ def is_reasonable_tangent(tangent):
     return True
 
 
+def reasonable_points(y_coordinates):
+    """Return a mask of which points of tangency have student-friendly coordinates, for arrays of y-coordinates.
+
+    This is is_reasonable_point over a whole polynomial_grid. Integer curves at integer points always give integer
+    coordinates, so only the range is checked.
+    """
+
+    return (y_coordinates >= -20) & (y_coordinates <= 20)
+
+
+def reasonable_tangents(gradients, y_intercepts):
+    """Return a mask of which tangents have student-friendly coefficients, for arrays of gradients and y-intercepts.
+
+    This is is_reasonable_tangent over a whole polynomial_grid.
+    """
+
+    return (gradients >= -5) & (gradients <= 5) & (gradients != 0) & (y_intercepts >= -10) & (y_intercepts <= 10)
+
+
 def polynomial_coefficients(polynomial):
     """Return the coefficients of a polynomial in descending order of degree.
 
@@ -112,17 +144,40 @@ class Tangent(relationships.QuestionPart):
     """ A question on tangents!
     """
 
+    # every coefficient is a small integer, so a record is 6 bytes
+    bank_fields = [question_bank.Polynomial('curve', 3, dtype='i1'), question_bank.Polynomial('tangent', 1, dtype='i1')]
+    bank_indexes = {'degree': bank_fields[0].degrees, 'gradient': 'tangent_1', 'y_intercept': 'tangent_0'}
+
+    @classmethod
+    def enumerate_columns(cls, shard=0, shards=1):
+        """Return the bank columns of all possible question numbers that have student-friendly values.
+
+        Every curve is checked at every point at once over the whole coefficient grid, without any sympy.
+        """
+
+        coefficients = relationships.shard(curve_coefficients(), shard, shards)
+        domain = list(range(-5, 6))
+
+        y_coordinates, gradients, y_intercepts = polynomial_grid.tangents(coefficients, domain)
+        reasonable = reasonable_points(y_coordinates) & reasonable_tangents(gradients, y_intercepts)
+
+        curve_numbers, point_numbers = reasonable.nonzero()
+
+        # the grid has the highest power first, whereas the bank columns are named by power
+        columns = {'curve_{0}'.format(power): coefficients[curve_numbers, 3 - power] for power in range(4)}
+        columns['tangent_1'] = gradients[reasonable]
+        columns['tangent_0'] = y_intercepts[reasonable]
+
+        return columns
 
     @classmethod
-    def enumerate_questions(cls):
+    def enumerate_questions(cls, shard=0, shards=1):
         """Generate all possible question numbers that have student-friendly values.
         """
 
-        for curve in enumerate_curves():
-            for tangent in enumerate_tangents(curve):
-                point_of_tangency = (enumerate_tangents.current_x, tangent.subs({x: enumerate_tangents.current_x}))
-                if is_reasonable_point(point_of_tangency) and is_reasonable_tangent(tangent):
-                    yield {'tangent': tangent, 'curve': curve}
+        bank = question_bank.from_columns(cls.bank_fields, cls.enumerate_columns(shard, shards))
+        for record in bank:
+            yield question_bank.decode(cls.bank_fields, record)
 
 
     def __init__(self):
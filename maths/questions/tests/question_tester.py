@@ -1,81 +1,58 @@
-from maths.latex import latex
-import uuid
+from maths.latex import compiler
+from maths import maths_path
+import io
 import os
+import shutil
 import subprocess
-import errno
-from maths import maths_path
-import glob
-
-
-def question_tester(questions, view_output=False):
-    """ Test whether a question's latex is compilable to a PDF.
-
-    """ 
-
-    #full_path = os.path.split(os.path.abspath(__file__))[0]
-    full_path = os.path.join(maths_path.maths_path(), 'debug')
-    uid = str(uuid.uuid1())
-
-    file_name = os.path.join(full_path, 'test' + uid + '.tex')
+import tempfile
 
-    with open(file_name, 'w') as f:
-        latex.begin_tex_document(f)
-        if isinstance(questions, (list, tuple)):
-            for question in questions:
-                _write_question(f, question)
-                latex.new_page(f)
-        else:
-            _write_question(f, questions)
-        latex.end_tex_document(f)
 
+def question_tester(questions, view_output=False, use_cache=True):
+    """ Test whether the latex of a question, or a list of questions, is compilable to a PDF.
 
-    # change dir to ../maths/debug so that the byproduct tex compilation files are created there
-    # in case something goes wrong in compilation and we want to view them
-    prev_path = os.getcwd()
-    os.chdir(full_path)
-    
-    with open(os.devnull, 'w') as f:
-        retcode = subprocess.call(['xelatex', '-halt-on-error', file_name], stdout=f)
+    The questions are compiled together, one to a page, in a single run of xelatex. If they don't compile, the
+    questions at fault are found by compiling fewer of them at a time, and their .tex and .log files are kept in a
+    directory in ../maths/debug so they can be looked at. Unless use_cache is False, questions that compiled in an
+    earlier run aren't compiled again (see compiler.CompileCache).
 
-    if retcode != 0:
-        # wipe all other files in ../maths/debug so we can easily find the files we want
-
-        keep_files = [os.path.join(full_path, 'test' + uid + i) for i in ['.log', '.aux', '.tex']]
+    """
 
-        for filename in glob.glob(os.path.join(full_path, '*')):
-            if filename not in keep_files:
-                os.remove(filename)
+    if not isinstance(questions, (list, tuple)):
+        questions = [questions]
 
-        subprocess.Popen(['texmaker', os.path.join(full_path, 'test' + uid + '.tex')])
+    pages = [_question_page(question) for question in questions]
 
-        raise RuntimeError("This questions' latex could not be compiled.")
+    # every test compiles in a directory of its own, so tests can run side by side
+    directory = tempfile.mkdtemp(prefix='test', dir=os.path.join(maths_path.maths_path(), 'debug'))
 
+    try:
+        compile_cache = compiler.CompileCache() if use_cache else None
+        failing = compiler.failing_pages(pages, directory, compile_cache=compile_cache)
+    except Exception:  # e.g. xelatex isn't installed
+        shutil.rmtree(directory, ignore_errors=True)
+        raise
 
+    if failing:
+        raise RuntimeError("The latex of these questions could not be compiled: {0} - see the logs in {1}".format(
+            ', '.join(_question_name(questions[i]) for i in failing), directory))
 
     if view_output:
-        subprocess.call(['evince', os.path.join(full_path, 'test' + uid + '.pdf')])
-        # if retcode != 0:
-        #     pass
-            #subprocess.call([''])
+        subprocess.call(['evince', os.path.join(directory, compiler.batch_name(0, len(pages)) + '.pdf')])
 
     # cleanup after .tex compilation
-    silentremove(os.path.join(full_path, 'test' + uid + '.log'))
-    silentremove(os.path.join(full_path, 'test' + uid + '.aux'))
-    silentremove(os.path.join(full_path, 'test' + uid + '.tex'))
+    shutil.rmtree(directory, ignore_errors=True)
 
-    os.chdir(prev_path)
 
+def _question_name(question):
+    return getattr(question, 'cls', type(question)).__name__
 
-def silentremove(filename):
-    try:
-        os.remove(filename)
-    except OSError as e:
-        if e.errno != errno.ENOENT:  # errno.ENOENT = no such file or directory
-            raise  # re-raise exception if a different error occured
 
-
-def _write_question(f, question):
-    """ A helper function to test_question - writes a single question as a standalone .tex file.
+def _question_page(question):
+    """ A helper function to question_tester - returns the latex of a question followed by its solution.
     """
+
+    f = io.StringIO()
     question.write_question(f)
     question.write_solution(f)
+
+    return f.getvalue()
@@ -0,0 +1,77 @@
+from .. import relationships
+import textwrap
+import types
+
+
+source = textwrap.dedent('''\
+    from maths.questions import relationships
+
+
+    @relationships.root
+    class Root(relationships.QuestionPart):
+        pass
+
+
+    @relationships.is_child_of(Root)
+    class First(relationships.QuestionPart):
+        pass
+
+
+    @relationships.is_child_of(Root)
+    class Second(relationships.QuestionPart):
+        pass
+
+
+    @relationships.is_child_of(Second)
+    class UnderSecond(relationships.QuestionPart):
+        pass
+''')
+
+
+def example_module(tmpdir):
+    path = tmpdir.join('example_question.py')
+    path.write(source)
+
+    module = types.ModuleType('example_question')
+    module.__file__ = str(path)
+    exec(compile(source, str(path), 'exec'), module.__dict__)
+
+    return module
+
+
+def test_parse_structure(tmpdir, monkeypatch):
+    monkeypatch.setenv('MATHS_CACHE_DIR', str(tmpdir.join('cache')))
+    module = example_module(tmpdir)
+
+    expected = [['Root', [['First', []], ['Second', [['UnderSecond', []]]]]]]
+    assert relationships.compile_structure(module) == expected
+
+    trees = relationships.parse_structure(module, seed=3)
+    assert [tree.structure() for tree in trees] == expected
+    assert trees[0].seed == 3
+    assert trees[0].children[1].children[0].cls is module.UnderSecond
+
+
+def test_compiled_structure_is_cached(tmpdir, monkeypatch):
+    monkeypatch.setenv('MATHS_CACHE_DIR', str(tmpdir.join('cache')))
+    module = example_module(tmpdir)
+
+    compiled = []
+    compile_structure = relationships.compile_structure
+    monkeypatch.setattr(relationships, 'compile_structure', lambda module: compiled.append(module) or
+                        compile_structure(module))
+
+    relationships._compiled_structures.pop(module.__name__, None)
+    first = relationships.parse_structure(module)
+    assert relationships.parse_structure(module)[0].structure() == first[0].structure()
+    assert len(compiled) == 1
+
+    # a new process has nothing in memory, but finds the structure on disk
+    relationships._compiled_structures.pop(module.__name__)
+    relationships.parse_structure(module)
+    assert len(compiled) == 1
+
+    # changing the module compiles it again
+    tmpdir.join('example_question.py').write(source + '\n')
+    relationships.parse_structure(module)
+    assert len(compiled) == 2
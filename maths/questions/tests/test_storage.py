@@ -0,0 +1,155 @@
+from .. import relationships
+from ...utils import question_bank
+from ... import randomness
+import os
+import pickle
+import shutil
+import tempfile
+import pytest
+
+
+# sharded classes are sent to worker processes, so they live at module level and store their questions in a fixed place
+storage_folder = os.path.join(tempfile.gettempdir(), 'maths_test_storage')
+
+
+class ShardedBanked(relationships.QuestionPart):
+    bank_fields = [question_bank.Integer('n')]
+
+    @classmethod
+    def bank_path(cls):
+        return os.path.join(storage_folder, 'banked.npy')
+
+    @classmethod
+    def enumerate_questions(cls, shard=0, shards=1):
+        for n in relationships.shard(range(20), shard, shards):
+            yield {'n': n}
+
+
+class ShardedPickled(relationships.QuestionPart):
+    @classmethod
+    def storage_paths(cls):
+        return os.path.join(storage_folder, 'pickled_indices'), os.path.join(storage_folder, 'pickled_data')
+
+    @classmethod
+    def enumerate_questions(cls, shard=0, shards=1):
+        for n in relationships.shard(range(20), shard, shards):
+            yield {'n': n}
+
+
+def storage_classes(tmpdir):
+    class Banked(relationships.QuestionPart):
+        bank_fields = [question_bank.Integer('n')]
+        bank_indexes = {'n': 'n', 'parity': lambda bank: bank['n'] % 2}
+
+        @classmethod
+        def bank_path(cls):
+            return str(tmpdir.join('banked.npy'))
+
+        @classmethod
+        def enumerate_questions(cls):
+            for n in range(20):
+                yield {'n': n}
+
+    class Pickled(relationships.QuestionPart):
+        @classmethod
+        def storage_paths(cls):
+            return str(tmpdir.join('pickled_indices')), str(tmpdir.join('pickled_data'))
+
+        @classmethod
+        def enumerate_questions(cls):
+            for n in range(20):
+                yield {'n': n}
+
+    return Banked, Pickled
+
+
+def test_scan_random_questions(tmpdir):
+    for cls in storage_classes(tmpdir):
+        cls.store_question()
+
+        with randomness.using(0):
+            questions = cls.scan_random_questions(20)
+        assert sorted(int(i['n']) for i in questions) == list(range(20))
+
+        assert len(cls.scan_random_questions(30, replace=True)) == 30
+        with pytest.raises(ValueError):
+            cls.scan_random_questions(21)
+
+        with randomness.using(0):
+            assert cls.scan_random_question() == questions[0]
+
+
+def test_storage_is_opened_once(tmpdir):
+    for cls in storage_classes(tmpdir):
+        cls.store_question()
+        question = cls.scan_random_question()
+
+        for path in os.listdir(str(tmpdir)):
+            os.remove(str(tmpdir.join(path)))
+
+        # the storage stays open, so removing its files doesn't stop questions being scanned
+        assert cls.scan_random_question().keys() == question.keys()
+
+
+@pytest.mark.parametrize('processes, shards, resumed', [(2, 4, True), (3, None, True), (2, 5, False)])
+def test_sharded_store_question_resumes(processes, shards, resumed):
+    shutil.rmtree(storage_folder, ignore_errors=True)
+
+    # the interrupted run's shards are used again however many processes resume it, unless there are now more shards
+    for cls in [ShardedBanked, ShardedPickled]:
+        # pretend an earlier run was interrupted after finishing the first shard
+        first_segment = os.path.join(cls.segments_folder(), 'shard-0-of-4')
+        os.makedirs(cls.segments_folder())
+        if cls.bank_fields is not None:
+            question_bank.write_bank(first_segment, cls.bank_fields, [{'n': 100}])
+        else:
+            with open(first_segment, 'wb') as f:
+                pickle.dump(relationships._write_pickled(first_segment + '.data', [{'n': 100}]), f)
+
+        cls.store_question(processes=processes, shards=shards)
+
+        stored = [100] + list(range(5, 20)) if resumed else list(range(20))
+        assert not os.path.exists(cls.segments_folder())
+        assert cls.stored_questions()[0] == len(stored)
+        assert [int(cls.stored_questions()[1](i)['n']) for i in range(len(stored))] == stored
+
+    shutil.rmtree(storage_folder)
+
+
+def test_scan_random_questions_where(tmpdir):
+    Banked, Pickled = storage_classes(tmpdir)
+    Banked.store_question()
+    assert os.path.exists(Banked.index_path('parity'))
+
+    questions = Banked.scan_random_questions(5, where={'n': (3, 7)})
+    assert sorted(int(i['n']) for i in questions) == [3, 4, 5, 6, 7]
+
+    questions = Banked.scan_random_questions(3, where={'n': (3, 7), 'parity': 1})
+    assert sorted(int(i['n']) for i in questions) == [3, 5, 7]
+
+    assert Banked.scan_random_question(where={'n': 12}) == {'n': 12}
+
+    with pytest.raises(ValueError):
+        Banked.scan_random_question(where={'n': 100})
+    with pytest.raises(ValueError):
+        Banked.scan_random_question(where={'size': 1})
+
+    Pickled.store_question()
+    with pytest.raises(ValueError):
+        Pickled.scan_random_question(where={'n': 1})
+
+
+def test_only_the_most_recent_queries_are_remembered(tmpdir, monkeypatch):
+    monkeypatch.setattr(relationships, 'MAX_QUERIES', 2)
+    Banked, Pickled = storage_classes(tmpdir)
+    Banked.store_question()
+    opened = len(relationships._opened_storage)
+
+    for high in range(3, 8):
+        assert Banked.matching_questions({'n': (3, high), 'parity': 1}).tolist() == list(range(3, high + 1, 2))
+
+    assert len(relationships._queries) == 2
+    assert len(relationships._opened_storage) == opened + 2  # just the two indexes, not the queries
+
+    Banked.store_question()
+    assert not [key for key in relationships._queries if key[1] == 'Banked']
@@ -1,4 +1,5 @@
 from .. import relationships, tangent
+from ...symbols import x
 from .question_tester import question_tester
 import pytest
 
@@ -6,4 +7,16 @@ import pytest
 @pytest.mark.xfail
 def test_tangent():
     question = relationships.parse_structure(tangent)
-    question_tester(question)
\ No newline at end of file
+    question_tester(question)
+
+
+def test_vectorised_enumeration_matches_sympy():
+    expected = []
+    for curve in tangent.enumerate_curves(shard=7, shards=2000):
+        for tangent_line in tangent.enumerate_tangents(curve):
+            point_of_tangency = (tangent.enumerate_tangents.current_x,
+                                 tangent_line.subs({x: tangent.enumerate_tangents.current_x}))
+            if tangent.is_reasonable_point(point_of_tangency) and tangent.is_reasonable_tangent(tangent_line):
+                expected.append({'tangent': tangent_line, 'curve': curve})
+
+    assert list(tangent.Tangent.enumerate_questions(shard=7, shards=2000)) == expected
@@ -1,8 +1,8 @@
 import sympy
-import random
+from ..randomness import random
 from ..symbols import x
 from .. import not_named_yet
-from ..latex import solutions
+from ..latex import solutions, printer
 from . import relationships
 
 
@@ -46,7 +46,7 @@ class TrigProperties(relationships.QuestionPart):
 
         return r'''State the {range_or_amplitude} and period of the function $f, R \rightarrow R, f(x) = {equation}$'''.format(
             range_or_amplitude=self._qi['range_or_amplitude'],
-            equation=sympy.latex(self._qp['equation'])
+            equation=printer.latex(self._qp['equation'])
         )
 
     def solution_statement(self):
@@ -57,7 +57,7 @@ class TrigProperties(relationships.QuestionPart):
         )
 
         lines += r'The period is ${answer}$'.format(
-            answer=sympy.latex(self._qp['period'])
+            answer=printer.latex(self._qp['period'])
         )
 
         return lines.write()
@@ -1,12 +1,49 @@
 import sympy
-import random
-from .. import all_functions, not_named_yet
+from .. import all_functions
 from ..symbols import x
-from ..utils import functions
-from ..latex import expressions, solutions
+from ..latex import expressions, solutions, printer
+from ..utils import functions, sampler
 from . import relationships
 
 
+def _domain(bound):
+    """Return the domain between the y-axis and x = bound.
+    """
+
+    if bound < 0:
+        return sympy.Interval(bound, 0, False, False)
+    else:
+        return sympy.Interval(0, bound, False, False)
+
+
+def _feasible(equation, bound):
+    """State whether the region between a curve, the axes and x = bound has an area, i.e. the curve crosses the x-axis
+    between the y-axis and x = bound.
+    """
+
+    domain = _domain(bound)
+    y_intercept = equation.subs({x: 0})
+
+    if bound < 0 and y_intercept < 0 and functions.is_monotone_decreasing(equation, domain):
+        return False
+    elif bound < 0 and y_intercept > 0 and functions.is_monotone_increasing(equation, domain):
+        return False
+    elif bound > 0 and y_intercept < 0 and functions.is_monotone_increasing(equation, domain):
+        return False
+    elif bound > 0 and y_intercept > 0 and functions.is_monotone_decreasing(equation, domain):
+        return False
+
+    return True
+
+
+# the curve is random, so can't be enumerated, and questions are sampled by rejection
+_sampler = sampler.Sampler({
+    'equation': lambda rng: all_functions.request_exp(difficulty=3, rng=rng).equation,
+    'bound': [sympy.Rational(numerator, denominator) for numerator in range(-5, 6) for denominator in range(-5, 6)
+              if numerator != 0 and denominator != 0],
+}, _feasible)
+
+
 @relationships.root
 class WordedDefiniteIntegral(relationships.QuestionPart):
     """
@@ -26,30 +63,10 @@ class WordedDefiniteIntegral(relationships.QuestionPart):
         self._qp = {}
         self.num_lines, self.num_marks = 8, 3
 
-        while True:
-            function_type = random.choice(['log'])
-            if function_type == 'log':
-                equation = all_functions.request_exp(difficulty=3).equation
-
-            bound = sympy.Rational(not_named_yet.randint(-5, 5, exclude=[0]), not_named_yet.randint(-5, 5, exclude=[0]))
-
-            if bound < 0:
-                domain = sympy.Interval(bound, 0, False, False)
-            else:
-                domain = sympy.Interval(0, bound, False, False)
-
-            y_intercept = equation.subs({x: 0})
-            if bound < 0 and y_intercept < 0 and functions.is_monotone_decreasing(equation, domain):
-                continue
-            elif bound < 0 and y_intercept > 0 and functions.is_monotone_increasing(equation, domain):
-                continue
-            elif bound > 0 and y_intercept < 0 and functions.is_monotone_increasing(equation, domain):
-                continue
-            elif bound > 0 and y_intercept > 0 and functions.is_monotone_decreasing(equation, domain):
-                continue
-
-            area = sympy.integrate(equation, (x, domain.left, domain.right))
-            break
+        parameters = _sampler.sample()
+        equation, bound = parameters['equation'], parameters['bound']
+        domain = _domain(bound)
+        area = sympy.integrate(equation, (x, domain.left, domain.right))
 
         self._qp['equation'] = equation
         self._qp['domain'] = domain
@@ -61,8 +78,8 @@ class WordedDefiniteIntegral(relationships.QuestionPart):
 
         return r'''The area of the region bounded by the y-axis, the x-axis, the curve $y = {equation}$ and the line x = {big_letter},
             where {big_letter} is a {positive_or_negative} real constant, is ${area}$. Find {big_letter}.'''.format(
-            equation=sympy.latex(self._qp['equation']),
-            area=sympy.latex(self._qp['area']),
+            equation=printer.latex(self._qp['equation']),
+            area=printer.latex(self._qp['area']),
             big_letter=self._qp['big_letter'],
             positive_or_negative=positive_or_negative
         )
@@ -101,13 +118,13 @@ class WordedDefiniteIntegral(relationships.QuestionPart):
 
         lines += r'''$= {0} = {1}$'''.format(
             expressions.integral_intermediate_eval(lb=question_domain[0], ub=question_domain[1], expr=equation_to_use),
-            sympy.latex(self._qp['area'])
+            printer.latex(self._qp['area'])
         )
 
         # the value of the big letter is the sum of the ends of the domains (since one of the ends of the domains is 0)
         lines += r'''${big_letter} = {big_letter_value}$'''.format(
-            big_letter=sympy.latex(self._qp['big_letter']),
-            big_letter_value=sympy.latex(self._qp['domain'].left + self._qp['domain'].right)
+            big_letter=printer.latex(self._qp['big_letter']),
+            big_letter_value=printer.latex(self._qp['domain'].left + self._qp['domain'].right)
         )
 
         return lines.write()
@@ -0,0 +1,71 @@
+import contextlib
+import contextvars
+import random as _random
+
+
+_current_rng = contextvars.ContextVar('current_rng', default=None)
+
+
+def current():
+    """Return the random number generator that questions are currently being generated with.
+
+    Outside of a 'using' block this is the random module itself, so unseeded generation behaves as it always has.
+    """
+
+    rng = _current_rng.get()
+    return rng if rng is not None else _random
+
+
+def resolve(rng=None):
+    """Return rng if one was passed in, otherwise the current random number generator.
+
+    >>> resolve(_random.Random(1)).randint(0, 100)
+    17
+    """
+
+    return rng if rng is not None else current()
+
+
+def seeded(seed=None):
+    """Return a new random number generator built from seed, or the current generator if there is no seed.
+    """
+
+    return _random.Random(seed) if seed is not None else current()
+
+
+@contextlib.contextmanager
+def using(rng):
+    """Generate with a particular random number generator for the duration of a with block.
+
+    rng can be a random.Random, or a seed to build one from. Each thread (and each asyncio task) has its own current
+    generator, so questions generated side by side never draw from each other's generators.
+
+    >>> with using(1) as rng:
+    ...     current() is rng
+    True
+    """
+
+    if rng is None:
+        rng = current()
+    elif rng is not _random and not isinstance(rng, _random.Random):
+        rng = _random.Random(rng)
+
+    token = _current_rng.set(rng)
+    try:
+        yield rng
+    finally:
+        _current_rng.reset(token)
+
+
+class _CurrentRandom:
+    """A stand-in for the random module, where every draw is made from the current random number generator.
+
+    Question code imports this as 'random' so it can keep calling random.choice(...) and friends, while the draws
+    come from whichever generator the question is being built with.
+    """
+
+    def __getattr__(self, name):
+        return getattr(current(), name)
+
+
+random = _CurrentRandom()
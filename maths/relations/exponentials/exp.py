@@ -1,16 +1,16 @@
-from ... import not_named_yet
+from ... import not_named_yet, randomness
 from ...relations.polynomials.linear import request_linear
 from ...symbols import *
 import sympy
 
 
 class Exp(object):
-    def __init__(self, difficulty):
+    def __init__(self, difficulty, rng=None):
+        rng = randomness.resolve(rng)
 
-
-        a = not_named_yet.randint_no_zero(-3, 2)
-        k = not_named_yet.randint_no_zero(-2, 2)
-        c = not_named_yet.randint_no_zero(-5, 5)
+        a = not_named_yet.randint_no_zero(-3, 2, rng=rng)
+        k = not_named_yet.randint_no_zero(-2, 2, rng=rng)
+        c = not_named_yet.randint_no_zero(-5, 5, rng=rng)
 
         if a == 1:
             a += 1
@@ -20,7 +20,7 @@ class Exp(object):
         elif difficulty == 2:
             self.equation = a * sympy.exp(k * x) + c
         elif difficulty == 3:
-            inner_function = request_linear(difficulty=3).equation
+            inner_function = request_linear(difficulty=3, rng=rng).equation
             self.equation = a * sympy.exp(inner_function) + c
         else:
             raise ValueError('You have given an invalid difficulty level! Please use difficulty levels 1-3')
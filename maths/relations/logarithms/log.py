@@ -1,4 +1,4 @@
-from ... import not_named_yet
+from ... import not_named_yet, randomness
 from ...relations.polynomials.linear import request_linear
 from ...utils import functions
 from ...symbols import *
@@ -8,17 +8,19 @@ coefficients_bound = 5
 
 
 class Log(object):
-    def __init__(self, difficulty):
+    def __init__(self, difficulty, rng=None):
+        rng = randomness.resolve(rng)
+
         # y = a * ln(k * x) + c
-        a = not_named_yet.randint(-3, 3, exclude=[0, 1])
-        k = not_named_yet.randint(-3, 3, exclude=[0])
-        c = not_named_yet.randint(-4, 4, exclude=[0])
+        a = not_named_yet.randint(-3, 3, exclude=[0, 1], rng=rng)
+        k = not_named_yet.randint(-3, 3, exclude=[0], rng=rng)
+        c = not_named_yet.randint(-4, 4, exclude=[0], rng=rng)
         if difficulty == 1:
             self.equation = sympy.log(k*x) + c
         elif difficulty == 2:
             self.equation = a * sympy.log(k*x) + c
         elif difficulty == 3:
-            inner_function = request_linear(difficulty=3).equation
+            inner_function = request_linear(difficulty=3, rng=rng).equation
             self.equation = a*sympy.log(inner_function) + c
         else:
             raise ValueError('You have supplied an invalid difficulty level! Choose between 1, 2 or 3')
@@ -1,14 +1,15 @@
 from ...symbols import *
-from ... import not_named_yet
+from ... import not_named_yet, randomness
 from ...relations.polynomials.linear import request_linear
 
 
 class Hyperbola(object):
-    def __init__(self, difficulty):
+    def __init__(self, difficulty, rng=None):
+        rng = randomness.resolve(rng)
 
-        c = not_named_yet.randint_no_zero(-4, 4)
-        m = not_named_yet.randint_no_zero(-3, 3)
-        inner_function = request_linear(difficulty=3).equation
+        c = not_named_yet.randint_no_zero(-4, 4, rng=rng)
+        m = not_named_yet.randint_no_zero(-3, 3, rng=rng)
+        inner_function = request_linear(difficulty=3, rng=rng).equation
         if difficulty == 1:
             denominator = x
             self.equation = 1 / x + c
@@ -17,7 +18,7 @@ class Hyperbola(object):
             self.equation = 1 / inner_function + c
         elif difficulty == 3:
             denominator = inner_function
-            m = not_named_yet.randint_no_zero(-2, 2)
+            m = not_named_yet.randint_no_zero(-2, 2, rng=rng)
             if m < 0:
                 m -= 1
             else:
@@ -1,13 +1,13 @@
-import random
 import sympy
 from ...symbols import *
-from ... import not_named_yet
+from ... import not_named_yet, randomness
+from ...utils import retries
 
 coefficients_bound = 5
 
 
-def request_linear(difficulty, var=x):
-    return Linear(difficulty, var)
+def request_linear(difficulty, var=x, rng=None):
+    return Linear(difficulty, var, rng)
 
 
 class Linear(object):
@@ -27,22 +27,24 @@ class Linear(object):
 
     """
 
-    def __init__(self, difficulty, var=None):
+    def __init__(self, difficulty, var=None, rng=None):
 
         if var is None:
             var = x
 
+        rng = randomness.resolve(rng)
+
         if difficulty == 1:
             c = 0
-            m = random.randint(-coefficients_bound + 2, coefficients_bound - 4)
+            m = rng.randint(-coefficients_bound + 2, coefficients_bound - 4)
             if m >= 0:  # make sure m is not 0 or 1
                 m += 2
         elif difficulty == 2:
-            c = not_named_yet.randint_no_zero(-coefficients_bound, coefficients_bound)
+            c = not_named_yet.randint_no_zero(-coefficients_bound, coefficients_bound, rng=rng)
             m = 1
         elif difficulty == 3:
-            c = not_named_yet.randint_no_zero(-coefficients_bound, coefficients_bound)
-            m = random.randint(-coefficients_bound + 2, coefficients_bound - 4)
+            c = not_named_yet.randint_no_zero(-coefficients_bound, coefficients_bound, rng=rng)
+            m = rng.randint(-coefficients_bound + 2, coefficients_bound - 4)
             if m >= 0:  # make sure m is not 0 or 1
                 m += 2
         else:
@@ -57,23 +59,25 @@ class Linear(object):
 class SimultaneousLinearEquations(object):
     global coefficients_bound
 
-    def __init__(self):
-        while True:
+    def __init__(self, rng=None):
+        rng = randomness.resolve(rng)
+
+        for attempt in retries.attempts():
             equations = []
             x, y, k = sympy.symbols('x, y, k')
             coefficients = [[], []]
 
             small_domain = [i for i in range(-coefficients_bound + 2, coefficients_bound - 1) if i != 0]
             large_domain = [i for i in range(-2 * coefficients_bound, 2 * coefficients_bound) if i != 0]
-            coefficients[0].append((random.sample(small_domain, 1)[0] * k + random.sample(large_domain, 1)[0]) * x)
-            coefficients[0].append((random.sample(small_domain, 1)[0] * k + random.sample(large_domain, 1)[0]) * y)
-            coefficients[0].append((random.sample(small_domain, 1)[0] * k + random.sample(large_domain, 1)[0]))
-            coefficients[1].append(random.sample(large_domain, 1)[0] * x)
-            coefficients[1].append(random.sample(large_domain, 1)[0] * y)
-            coefficients[1].append(random.sample(large_domain, 1)[0])
+            coefficients[0].append((rng.sample(small_domain, 1)[0] * k + rng.sample(large_domain, 1)[0]) * x)
+            coefficients[0].append((rng.sample(small_domain, 1)[0] * k + rng.sample(large_domain, 1)[0]) * y)
+            coefficients[0].append((rng.sample(small_domain, 1)[0] * k + rng.sample(large_domain, 1)[0]))
+            coefficients[1].append(rng.sample(large_domain, 1)[0] * x)
+            coefficients[1].append(rng.sample(large_domain, 1)[0] * y)
+            coefficients[1].append(rng.sample(large_domain, 1)[0])
             choices = [0, 1, 2]
 
-            equations_layout = {choices.pop(random.randint(0, 2)): 0, choices.pop(random.randint(0, 1)): 0, choices[0]: 1}
+            equations_layout = {choices.pop(rng.randint(0, 2)): 0, choices.pop(rng.randint(0, 1)): 0, choices[0]: 1}
             equations = [[coefficients[equations_layout[i]][i] for i in equations_layout],
                         [coefficients[1 - equations_layout[i]][i] for i in equations_layout]]
 
@@ -85,7 +89,7 @@ class SimultaneousLinearEquations(object):
             if len(parallel) == 1 and coefficients[0][0] != coefficients[1][0] and coefficients[0][0] != -coefficients[1][0]:
                 break
 
-        infinite_solutions = random.randint(0, 1)
+        infinite_solutions = rng.randint(0, 1)
         if infinite_solutions == 1:
             equations_fixed = [[i.subs({k: parallel[0]}) if type(i) != int else i for i in equations[0]],
                                [i.subs({k: parallel[0]}) if type(i) != int else i for i in equations[1]]]
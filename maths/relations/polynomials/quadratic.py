@@ -1,12 +1,34 @@
+import functools
 import sympy
-import random
-import gmpy
-from ... import not_named_yet
 from ...symbols import *
+from ...utils import sampler
 
 coefficients_bound = 5
 
 
+@functools.lru_cache(maxsize=None)
+def coefficient_sampler(difficulty):
+    """Return the sampler of the coefficients a, b and c of a quadratic of a difficulty.
+    """
+
+    import gmpy  # only needed here, so it isn't loaded just by importing the module
+
+    def feasible(a, b, c):
+        discriminant = b ** 2 - 4 * a * c
+        if difficulty == 1:
+            return discriminant == 0 and (b == 0 or c == 0)
+        elif difficulty == 2:
+            return discriminant > 0 and gmpy.is_square(discriminant)
+        else:
+            return discriminant > 0 and not gmpy.is_square(discriminant)
+
+    return sampler.Sampler({
+        'a': [i for i in range(-coefficients_bound + 2, coefficients_bound - 1) if i != 0],
+        'b': range(-coefficients_bound * 4, coefficients_bound * 4 + 1),
+        'c': range(-coefficients_bound * 4, coefficients_bound * 4 + 1),
+    }, feasible)
+
+
 class Quadratic(object):
     """ Return a quadratic polynomial in one variable.
 
@@ -21,22 +43,12 @@ class Quadratic(object):
 
     """
 
-    def __init__(self, difficulty):
-
+    def __init__(self, difficulty, rng=None):
         if difficulty not in [1, 2, 3]:
             raise ValueError('You gave an invalid difficulty of %d!' % difficulty)
 
-        while True:
-            a = not_named_yet.randint_no_zero(-coefficients_bound + 2, coefficients_bound - 2)
-            b = random.randint(-coefficients_bound * 4, coefficients_bound * 4)
-            c = random.randint(-coefficients_bound * 4, coefficients_bound * 4)
-            discriminant = b ** 2 - 4 * a * c
-            if difficulty == 1 and discriminant == 0 and (b == 0 or c == 0):
-                break
-            elif difficulty == 2 and discriminant > 0 and gmpy.is_square(discriminant):
-                break
-            elif difficulty == 3 and discriminant > 0 and not gmpy.is_square(discriminant):
-                break
+        coefficients = coefficient_sampler(difficulty).sample(rng)
+        a, b, c = coefficients['a'], coefficients['b'], coefficients['c']
 
         self.equation = a * x ** 2 + b * x + c
         self.discriminant = b ** 2 - 4 * a * c
@@ -1,10 +1,10 @@
-import random
 import sympy
 import copy
 import operator
 import itertools
 import math
-from ... import not_named_yet
+from ... import not_named_yet, randomness
+from ...utils import sampler
 from ...symbols import *
 from functools import reduce
 
@@ -12,12 +12,14 @@ coefficients_bound = 5
 
 
 class Sin(object):
-    def __init__(self, difficulty):
+    def __init__(self, difficulty, rng=None):
+        rng = randomness.resolve(rng)
+
         # general: y = a * sin(h * [pi * ]x) + k
         # base: h == 1 or pi
         # difficulty +: h != 1, h is an integer or the reciprocal of one
-        a = not_named_yet.randint_no_zero(-2, 2)
-        c = random.choice([-5*sympy.pi/6, -3*sympy.pi/4, -2*sympy.pi/3, -sympy.pi/2, -sympy.pi/3, -sympy.pi/4, -sympy.pi/6,
+        a = not_named_yet.randint_no_zero(-2, 2, rng=rng)
+        c = rng.choice([-5*sympy.pi/6, -3*sympy.pi/4, -2*sympy.pi/3, -sympy.pi/2, -sympy.pi/3, -sympy.pi/4, -sympy.pi/6,
                                          sympy.pi/6, sympy.pi/4, sympy.pi/3, sympy.pi/2, 2*sympy.pi/3, 3*sympy.pi/4, 5*sympy.pi/6])
 
         if difficulty == 1:
@@ -29,12 +31,14 @@ class Sin(object):
 
 
 class Cos(object):
-    def __init__(self, difficulty):
+    def __init__(self, difficulty, rng=None):
+        rng = randomness.resolve(rng)
+
         # general: y = a * cos(h * [pi * ]x) + k
         # base: h == 1 or pi
         # difficulty +: h != 1, h is an integer or the reciprocal of one
-        a = not_named_yet.randint_no_zero(-2, 2)
-        c = random.choice([-5*sympy.pi/6, -3*sympy.pi/4, -2*sympy.pi/3, -sympy.pi/2, -sympy.pi/3, -sympy.pi/4, -sympy.pi/6,
+        a = not_named_yet.randint_no_zero(-2, 2, rng=rng)
+        c = rng.choice([-5*sympy.pi/6, -3*sympy.pi/4, -2*sympy.pi/3, -sympy.pi/2, -sympy.pi/3, -sympy.pi/4, -sympy.pi/6,
                                          sympy.pi/6, sympy.pi/4, sympy.pi/3, sympy.pi/2, 2*sympy.pi/3, 3*sympy.pi/4, 5*sympy.pi/6])
 
         if difficulty == 1:
@@ -46,12 +50,14 @@ class Cos(object):
 
 
 class Tan(object):
-    def __init__(self, difficulty):
+    def __init__(self, difficulty, rng=None):
+        rng = randomness.resolve(rng)
+
         # general: y = a * tan(h * [pi * ]x) + k
         # base: h == 1 or pi
         # difficulty +: h != 1, h is an integer or the reciprocal of one
-        a = not_named_yet.randint_no_zero(-2, 2)
-        c = random.choice([-5*sympy.pi/6, -3*sympy.pi/4, -2*sympy.pi/3, -sympy.pi/2, -sympy.pi/3, -sympy.pi/4, -sympy.pi/6,
+        a = not_named_yet.randint_no_zero(-2, 2, rng=rng)
+        c = rng.choice([-5*sympy.pi/6, -3*sympy.pi/4, -2*sympy.pi/3, -sympy.pi/2, -sympy.pi/3, -sympy.pi/4, -sympy.pi/6,
                                          sympy.pi/6, sympy.pi/4, sympy.pi/3, sympy.pi/2, 2*sympy.pi/3, 3*sympy.pi/4, 5*sympy.pi/6])
 
         if difficulty == 1:
@@ -62,31 +68,36 @@ class Tan(object):
             raise ValueError('You have supplied an invalid difficulty level! Choose between 1 or 2')
 
 
+# the frequencies h of Trig's harder difficulties, which can be any fraction except 1 and -1
+_frequency_sampler = sampler.Sampler({
+    'positive_or_negative': [-1, 1],
+    'numerator': range(1, coefficients_bound),
+    'denominator': range(1, coefficients_bound - 1),
+}, lambda positive_or_negative, numerator, denominator: numerator != denominator)
+
+
 # deprecated
 class Trig(object):
     global coefficients_bound
 
-    def __init__(self, difficulty, exclude=[]):
+    def __init__(self, difficulty, exclude=[], rng=None):
+        rng = randomness.resolve(rng)
+
         # general: y = a * sin^n(h * [pi * ]x) + k
         # base: h == 1 or pi
         # difficulty +: h != 1, n == 1, h is an integer or the reciprocal of one
         # difficulty ++: n != 1
-        a = 0
-        while a == 0:
-            a = random.randint(-coefficients_bound // 2, coefficients_bound // 2)
+        a = not_named_yet.randint_no_zero(-coefficients_bound // 2, coefficients_bound // 2, rng=rng)
 
         if difficulty in [1, 2]:
-            h = random.sample([1, sympy.pi], 1)[0]
+            h = rng.sample([1, sympy.pi], 1)[0]
             positive_or_negative = 1
             n = 1
         if difficulty in [3, 4]:
             n = 1
-            while True:
-                positive_or_negative = random.sample([-1, 1], 1)[0]
-                h = sympy.Rational(random.randint(1, coefficients_bound - 1),
-                                   random.randint(1, coefficients_bound - 2) * positive_or_negative)
-                if h not in [-1, 1]:
-                    break
+            frequency = _frequency_sampler.sample(rng)
+            positive_or_negative = frequency['positive_or_negative']
+            h = sympy.Rational(frequency['numerator'], frequency['denominator'] * positive_or_negative)
         if difficulty == 4:
             n = 2
         if difficulty not in [1, 2, 3, 4]:
@@ -95,7 +106,7 @@ class Trig(object):
         x, k = sympy.symbols('x, k')
         f = sympy.Function('f')
 
-        contains_pi = random.sample([1, sympy.pi], 1)[0]  # used for determining the length of a domain
+        contains_pi = rng.sample([1, sympy.pi], 1)[0]  # used for determining the length of a domain
         f = contains_pi * x
 
         self.restricted_solutions = []
@@ -103,10 +114,7 @@ class Trig(object):
             equations, general_solutions = [], []
             for factor in range(n):
                 intermediate_solutions, general_solution = [], []
-                while True:
-                    pathway = random.sample(['sin', 'cos', 'tan'], 1)[0]
-                    if pathway not in exclude:
-                        break
+                pathway = rng.choice([i for i in ['sin', 'cos', 'tan'] if i not in exclude])
 
                 value_to_radians = \
                     {
@@ -151,7 +159,7 @@ class Trig(object):
                 if difficulty == 1:
                     trig_value = 0
                 else:
-                    trig_value = random.choice(list(value_to_radians.keys()))
+                    trig_value = rng.choice(list(value_to_radians.keys()))
 
 
                 equation = a * \
@@ -196,11 +204,11 @@ class Trig(object):
                     solutions.append(general_solution.subs({k: j}))
 
             if contains_pi == sympy.pi:
-                start_of_domain = random.randint(-1, 0)
-                length_of_domain = random.randint(1, 3)
+                start_of_domain = rng.randint(-1, 0)
+                length_of_domain = rng.randint(1, 3)
             else:
-                start_of_domain = random.randint(-3, 0)
-                length_of_domain = random.randint(1, 4)
+                start_of_domain = rng.randint(-3, 0)
+                length_of_domain = rng.randint(1, 4)
             self.domain = [sympy.pi / contains_pi * start_of_domain, sympy.pi / contains_pi * (start_of_domain + length_of_domain)]
 
             restricted_solutions = []
@@ -218,10 +226,11 @@ class Trig(object):
                 self.amplitude = abs(a)
 
 
-def plausible_value(trig_function):
+def plausible_value(trig_function, rng=None):
+    rng = randomness.resolve(rng)
 
     if trig_function in [sympy.sin, sympy.cos]:
-        return random.choice([
+        return rng.choice([
                              sympy.Rational(-1),
                              -sympy.sqrt(3) / 2,
                              -sympy.sqrt(2) / 2,
@@ -232,7 +241,7 @@ def plausible_value(trig_function):
                              sympy.sqrt(3) / 2,
                              sympy.Rational(1)])
     elif trig_function == sympy.tan:
-        return random.choice([
+        return rng.choice([
                              -sympy.sqrt(3),
                              sympy.Rational(-1),
                              -sympy.sqrt(3) / 3,
@@ -242,10 +251,11 @@ def plausible_value(trig_function):
                              sympy.sqrt(3)])
 
 
-def plausible_value_no_zero(trig_type):
+def plausible_value_no_zero(trig_type, rng=None):
+    rng = randomness.resolve(rng)
 
     if trig_type in [sympy.sin, sympy.cos]:
-        return random.choice([
+        return rng.choice([
                              sympy.Rational(-1),
                              -sympy.sqrt(3) / 2,
                              -sympy.sqrt(2) / 2,
@@ -255,7 +265,7 @@ def plausible_value_no_zero(trig_type):
                              sympy.sqrt(3) / 2,
                              sympy.Rational(1)])
     elif trig_type == sympy.tan:
-        return random.choice([
+        return rng.choice([
                              -sympy.sqrt(3),
                              sympy.Rational(-1),
                              -sympy.sqrt(3) / 3,
@@ -307,7 +317,9 @@ def expr_period(expr):
         return abs(sympy.pi / interior.coeff(x))
 
 
-def request_limited_domain(trig_function):
+def request_limited_domain(trig_function, rng=None):
+    rng = randomness.resolve(rng)
+
     if trig_function.has(sympy.cos):
         function_type = sympy.cos
     elif trig_function.has(sympy.sin):
@@ -321,9 +333,9 @@ def request_limited_domain(trig_function):
 
     period = expr_period(trig_function)
 
-    domain_middle = random.choice([sympy.pi/2 * i for i in range(-2, 3)])
+    domain_middle = rng.choice([sympy.pi/2 * i for i in range(-2, 3)])
     if function_type in [sympy.cos, sympy.sin]:
-        domain_length = random.choice([1, 2]) * period
+        domain_length = rng.choice([1, 2]) * period
     elif function_type in [sympy.tan, sympy.cot]:
         domain_length = period
 
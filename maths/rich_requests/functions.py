@@ -1,6 +1,7 @@
-import random
+from ..randomness import random
 from ..symbols import *
 from .. import all_functions
+from ..utils import retries
 import copy
 
 
@@ -110,7 +111,7 @@ def cubic(spec):
 
 
     information_master = copy.copy(information)
-    while True:
+    for attempt in retries.attempts():
         num_points_specified = num_points_specified_master
         num_tps_specified = num_tps_specified_master
         num_spis_specified = num_spis_specified_master
@@ -280,7 +281,7 @@ def absolute_value(spec):
         b = [i for i in b if i in spec['turning_point']['location'] ]
 
     master_a, master_b, master_c = a, b, c
-    while True:
+    for attempt in retries.attempts():
         a, b, c = copy.copy(master_a), copy.copy(master_b), copy.copy(master_c)
 
         a, b, c = list(a), list(b), list(c)  # ensure we are dealing with lists, not iterables
@@ -0,0 +1,66 @@
+import argparse
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+
+def compile_questions(module_names=None, seed=None, compile_cache=None):
+    """Compile a question from every question tree of the question modules as one LaTeX document, returning the
+    (module name, tree index) of every question whose LaTeX couldn't be compiled, along with the directory their logs
+    were left in.
+
+    All of the questions share one run of xelatex, unless some fail, when they are bisected to find the failing ones.
+    Documents found in compile_cache (a compiler.CompileCache) aren't compiled again.
+    """
+
+    from maths import maths_path
+    from maths.api import api
+    from maths.latex import compiler
+
+    if module_names is None:
+        module_names = api.registry.module_names()
+
+    candidates, pages = [], []
+    for module_name in module_names:
+        for tree_index, tree in enumerate(api.registry.trees(module_name)):
+            question = tree.copy(seed)
+
+            page = io.StringIO()
+            question.write_question(page)
+            question.write_solution(page)
+
+            candidates.append((module_name, tree_index))
+            pages.append(page.getvalue())
+
+    directory = tempfile.mkdtemp(prefix='compile', dir=os.path.join(maths_path.maths_path(), 'debug'))
+    failing = [candidates[i] for i in compiler.failing_pages(pages, directory, compile_cache=compile_cache)]
+
+    if not failing:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    return failing, directory
+
+
+if __name__ == '__main__':
+    from maths.latex import compiler
+    from maths.utils import disk_cache
+
+    parser = argparse.ArgumentParser(description='Check that the LaTeX of every question compiles, in one run of '
+                                                 'xelatex, finding the questions at fault if it does not.')
+    parser.add_argument('modules', nargs='*', help='only compile questions from these question modules')
+    parser.add_argument('--seed', type=int, default=None, help='seed for reproducible questions')
+    parser.add_argument('--cache', nargs='?', const=disk_cache.default_directory(), default=None,
+                        help='reuse the PDFs of documents compiled before, kept in this directory '
+                             '(default: $MATHS_CACHE_DIR or ~/.cache/mathsexams)')
+    args = parser.parse_args()
+
+    compile_cache = compiler.CompileCache(args.cache) if args.cache is not None else None
+    failing, directory = compile_questions(args.modules or None, args.seed, compile_cache)
+    for module_name, tree_index in failing:
+        print('Could not compile: {0} (tree {1})'.format(module_name, tree_index))
+
+    if failing:
+        print('The logs are in {0}'.format(directory))
+        sys.exit(1)
@@ -0,0 +1,24 @@
+import argparse
+import importlib
+import os
+
+
+def store_questions(module_name, class_name, processes=None, shards=None):
+    """Enumerate and store every question of a question part, e.g. store_questions('tangent', 'Tangent').
+    """
+
+    module = importlib.import_module('maths.questions.' + module_name)
+    getattr(module, class_name).store_question(processes=processes, shards=shards)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Enumerate and store every question of a question part. '
+                                                 'If a sharded run is interrupted, run it again to resume.')
+    parser.add_argument('module', help='the question module, e.g. tangent')
+    parser.add_argument('cls', help='the question part, e.g. Tangent')
+    parser.add_argument('--processes', type=int, nargs='?', const=os.cpu_count(), default=None,
+                        help='enumerate in shards over this many processes (default: one per core)')
+    parser.add_argument('--shards', type=int, default=None, help='how many shards to split the questions into')
+    args = parser.parse_args()
+
+    store_questions(args.module, args.cls, args.processes, args.shards)
@@ -1,11 +1,11 @@
-import sympy
+from .latex import printer
 
 
 def substitute(expr, var, value):
-    latex = sympy.latex(expr)
+    latex = printer.latex(expr)
     print(latex)
 
-    latex = latex.replace(sympy.latex(var), sympy.latex(value))
+    latex = latex.replace(printer.latex(var), printer.latex(value))
 
     return latex
 
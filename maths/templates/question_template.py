@@ -1,5 +1,5 @@
 import sympy
-import random
+from maths.randomness import random
 from maths.symbols import *
 from maths import all_functions, not_named_yet
 from maths.latex import solutions
@@ -0,0 +1,66 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+
+
+budget_path = os.path.join(os.path.split(os.path.abspath(__file__))[0], 'import_time_budget.json')
+with open(budget_path) as f:
+    budget = json.load(f)
+
+project_path = os.path.split(os.path.split(os.path.split(os.path.abspath(__file__))[0])[0])[0]
+
+
+def import_time(module_name):
+    """Return the total time (in microseconds) and the modules imported by importing a module in a fresh interpreter.
+
+    The time is the sum of every module's own import time reported by `python -X importtime`, not counting the
+    interpreter's own startup.
+    """
+
+    output = subprocess.check_output(
+        [sys.executable, '-X', 'importtime', '-c', 'import {0}'.format(module_name)],
+        stderr=subprocess.STDOUT, cwd=project_path, universal_newlines=True
+    )
+
+    lines = output.splitlines()
+    # everything up to and including site is the interpreter starting up
+    site_index = max(index for index, line in enumerate(lines) if line.split('|')[-1].strip() == 'site')
+
+    total, imported = 0, []
+    for line in lines[site_index + 1:]:
+        self_time, cumulative_time, name = line.split(':', 1)[1].split('|')
+        total += int(self_time)
+        imported.append(name.strip())
+
+    return total, imported
+
+
+@pytest.mark.parametrize('module_name', sorted(budget['budgets_us']))
+def test_import_time(module_name):
+    total, imported = import_time(module_name)
+
+    heavy = [name for name in imported if name.split('.')[0] in budget['forbidden']]
+    assert not heavy, '{0} imports heavy modules: {1}'.format(module_name, heavy)
+
+    # the budgets are several times what the imports take on a developer's machine, so a slower machine still fits in
+    # them, but pulling in a heavy module doesn't
+    module_budget = budget['budgets_us'][module_name]
+    assert total <= module_budget, \
+        '{0} took {1}us to import, over its budget of {2}us'.format(module_name, total, module_budget)
+
+
+def test_the_api_is_exported_lazily():
+    import maths
+    from maths.api import api
+
+    # everything the api defines, rather than imports
+    exported = {name for name, value in vars(api).items()
+                if not name.startswith('_') and (getattr(value, '__module__', None) == api.__name__ or
+                                                 isinstance(value, (str, int, float)))}
+    exported.add('registry')
+
+    assert set(maths.__all__) == exported
+    assert set(maths.__all__) <= set(dir(maths))
+    assert all(getattr(maths, name) is getattr(api, name) for name in maths.__all__)
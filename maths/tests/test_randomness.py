@@ -0,0 +1,41 @@
+from maths import randomness, domains
+from maths.relations.polynomials import linear
+import random
+import threading
+
+
+def test_using_seed():
+    with randomness.using(5):
+        first = [randomness.random.randint(0, 1000) for i in range(10)]
+    with randomness.using(5):
+        second = [randomness.random.randint(0, 1000) for i in range(10)]
+
+    assert first == second
+
+
+def test_using_restores_current():
+    with randomness.using(random.Random(1)):
+        pass
+
+    assert randomness.current() is random
+
+
+def test_threads_have_their_own_generator():
+    draws = {}
+
+    def draw(name):
+        with randomness.using(3):
+            draws[name] = [randomness.random.randint(0, 1000) for i in range(100)]
+
+    threads = [threading.Thread(target=draw, args=(i, )) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(i == draws[0] for i in draws.values())
+
+
+def test_explicit_rng():
+    assert domains.integer_domain(rng=random.Random(2)) == domains.integer_domain(rng=random.Random(2))
+    assert linear.Linear(3, rng=random.Random(1)).equation == linear.Linear(3, rng=random.Random(1)).equation
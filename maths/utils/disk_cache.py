@@ -0,0 +1,163 @@
+import hashlib
+import os
+import shutil
+import tempfile
+
+
+# how many entries can be put into a cache before its size is measured again, in case other processes have grown it
+MEASURE_EVERY = 100
+
+# cache directory -> [its size in bytes as last measured, plus the entries put since, and how many entries that is]
+_sizes = {}
+
+
+def default_directory():
+    """Return the directory caches are kept under - $MATHS_CACHE_DIR if it is set, otherwise ~/.cache/mathsexams.
+    """
+
+    directory = os.environ.get('MATHS_CACHE_DIR')
+    if directory is None:
+        directory = os.path.join(os.path.expanduser('~'), '.cache', 'mathsexams')
+
+    return directory
+
+
+def hash_key(*parts):
+    """Return a hex digest identifying a combination of strings and bytes.
+
+    >>> hash_key('simple_diff', 'SimpleDiff', 4) == hash_key('simple_diff', 'SimpleDiff', 4)
+    True
+    >>> hash_key('ab', 'c') == hash_key('a', 'bc')
+    False
+    """
+
+    digest = hashlib.sha256()
+    for part in parts:
+        if not isinstance(part, bytes):
+            part = str(part).encode('utf-8')
+        digest.update(str(len(part)).encode('ascii') + b':' + part)
+
+    return digest.hexdigest()
+
+
+def hash_files(paths):
+    """Return a hex digest of the contents of some files.
+    """
+
+    contents = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            contents.append(f.read())
+
+    return hash_key(*contents)
+
+
+class DiskCache:
+    """A size-bounded directory of cache entries, where each entry is a directory of files stored under a key.
+
+    Once the cache grows past max_bytes, the least recently used entries are removed until it fits again. Rather than
+    measuring the whole cache after every put, each process keeps a running total of its size, which is measured again
+    every MEASURE_EVERY puts to count entries other processes have put.
+
+    Entries are written to a temporary directory and then renamed into place, so processes can share a cache without
+    ever seeing a half-written entry.
+
+    name -- the name of the cache's directory under 'directory'
+    directory -- where caches are kept, defaulting to default_directory()
+    max_bytes -- how big the cache can grow
+    """
+
+    def __init__(self, name, directory=None, max_bytes=500 * 1024 ** 2):
+        if directory is None:
+            directory = default_directory()
+
+        self.path = os.path.join(directory, name)
+        self.max_bytes = max_bytes
+
+    def entry_path(self, key):
+        return os.path.join(self.path, key)
+
+    def get(self, key):
+        """Return the directory of the entry stored under key, or None if there isn't one.
+        """
+
+        entry_path = self.entry_path(key)
+
+        try:
+            os.utime(entry_path)  # mark the entry as recently used
+        except OSError:
+            return None
+
+        return entry_path
+
+    def put(self, key, files):
+        """Store an entry under key, given as a dict of relative file path -> the file's contents (str or bytes).
+
+        Return the directory of the entry.
+        """
+
+        os.makedirs(self.path, exist_ok=True)
+        temporary_path = tempfile.mkdtemp(prefix='.tmp', dir=self.path)
+
+        for relative_path, contents in files.items():
+            file_path = os.path.join(temporary_path, relative_path)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+            with open(file_path, 'wb' if isinstance(contents, bytes) else 'w') as f:
+                f.write(contents)
+
+        try:
+            os.rename(temporary_path, self.entry_path(key))
+        except OSError:
+            # another process stored the same entry first - theirs is just as good
+            shutil.rmtree(temporary_path, ignore_errors=True)
+        else:
+            self._count(_directory_size(self.entry_path(key)))
+
+        return self.entry_path(key)
+
+    def _count(self, entry_bytes):
+        """Add a new entry's size to the cache's running total, evicting entries if the cache has grown too big.
+        """
+
+        size = _sizes.get(self.path)
+        if size is None or size[1] >= MEASURE_EVERY or size[0] + entry_bytes > self.max_bytes:
+            self.evict()
+        else:
+            size[0] += entry_bytes
+            size[1] += 1
+
+    def evict(self):
+        """Remove the least recently used entries until the cache fits within max_bytes.
+        """
+
+        entries = []
+        total_bytes = 0
+        for entry in os.scandir(self.path):
+            if entry.name.startswith('.tmp') or not entry.is_dir():
+                continue
+
+            entry_bytes = _directory_size(entry.path)
+            entries.append((entry.stat().st_mtime, entry_bytes, entry.path))
+            total_bytes += entry_bytes
+
+        for last_used, entry_bytes, entry_path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+
+            shutil.rmtree(entry_path, ignore_errors=True)
+            total_bytes -= entry_bytes
+
+        _sizes[self.path] = [total_bytes, 0]
+
+
+def _directory_size(path):
+    total_bytes = 0
+    for directory_path, directory_names, file_names in os.walk(path):
+        for file_name in file_names:
+            try:
+                total_bytes += os.path.getsize(os.path.join(directory_path, file_name))
+            except OSError:
+                pass
+
+    return total_bytes
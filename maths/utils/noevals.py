@@ -2,6 +2,7 @@ import sympy
 from sympy.core.sympify import _sympify
 from sympy.printing.latex import LatexPrinter
 from ..symbols import x
+from ..latex import printer
 import re
 import collections
 
@@ -262,7 +263,7 @@ class NoEvalLatexPrinter(LatexPrinter):
 def latex(expr, **settings):
     """A rudimentary printer for noevals.
     """
-    return NoEvalLatexPrinter(settings).doprint(expr)
+    return printer.latex(expr, printer=NoEvalLatexPrinter, **settings)
 
 
 def noevalmapping():
@@ -0,0 +1,108 @@
+"""Vectorised arithmetic over grids of integer polynomials, for enumerating polynomial question families.
+
+A grid is a 2D integer array with one polynomial per row, its coefficients in descending order of degree (the same
+order as tangent.polynomial_coefficients). Evaluating a whole grid at once with NumPy is far quicker than building and
+substituting into one sympy expression per polynomial, so questions are enumerated by masking the grid down to the
+student-friendly rows and only turning those into sympy.
+
+numpy is imported inside each function, so importing this module is free.
+"""
+
+
+def coefficient_grid(*coefficient_ranges):
+    """Return every combination of coefficients as a grid, in the order itertools.product would give them.
+
+    >>> coefficient_grid([1, 2], range(3)).tolist()
+    [[1, 0], [1, 1], [1, 2], [2, 0], [2, 1], [2, 2]]
+    """
+
+    import numpy
+
+    ranges = [numpy.asarray(list(coefficient_range), dtype=numpy.int64) for coefficient_range in coefficient_ranges]
+    grids = numpy.meshgrid(*ranges, indexing='ij')
+
+    return numpy.stack([grid.ravel() for grid in grids], axis=1)
+
+
+def pad(coefficients, degree):
+    """Return a grid with zero leading coefficients added, so its polynomials have the given degree's number of columns.
+
+    This lets polynomials of different degrees be concatenated into one grid.
+
+    >>> pad(coefficient_grid([1], [2]), 3).tolist()
+    [[0, 0, 1, 2]]
+    """
+
+    import numpy
+
+    missing = degree + 1 - coefficients.shape[1]
+    return numpy.hstack([numpy.zeros((len(coefficients), missing), dtype=coefficients.dtype), coefficients])
+
+
+def evaluate(coefficients, points):
+    """Return the value of every polynomial at every point, as an array of shape (polynomials, points).
+
+    >>> evaluate(coefficient_grid([1], [0], [-4]), [-2, 0, 2]).tolist()
+    [[0, -4, 0]]
+    """
+
+    import numpy
+
+    points = numpy.asarray(points, dtype=coefficients.dtype)
+
+    # Horner's method, a column of coefficients at a time
+    values = numpy.zeros((len(coefficients), len(points)), dtype=coefficients.dtype)
+    for column in coefficients.T:
+        values = values * points + column[:, numpy.newaxis]
+
+    return values
+
+
+def derivative(coefficients):
+    """Return the grid of the derivatives of every polynomial.
+
+    >>> derivative(coefficient_grid([2], [5], [-3])).tolist()
+    [[4, 5]]
+    """
+
+    import numpy
+
+    degree = coefficients.shape[1] - 1
+    if degree == 0:
+        return numpy.zeros_like(coefficients)
+
+    return coefficients[:, :-1] * numpy.arange(degree, 0, -1, dtype=coefficients.dtype)
+
+
+def tangents(coefficients, points):
+    """Return the y-coordinates, gradients and y-intercepts of the tangents to every polynomial at every point.
+
+    Each is an array of shape (polynomials, points).
+
+    >>> [i.tolist() for i in tangents(coefficient_grid([1], [0], [0]), [1])]
+    [[[1]], [[2]], [[-1]]]
+    """
+
+    import numpy
+
+    y_coordinates = evaluate(coefficients, points)
+    gradients = evaluate(derivative(coefficients), points)
+    y_intercepts = y_coordinates - gradients * numpy.asarray(points, dtype=coefficients.dtype)
+
+    return y_coordinates, gradients, y_intercepts
+
+
+def to_sympy(coefficients, var=None):
+    """Return a row of a grid as a sympy polynomial.
+
+    >>> to_sympy([0, 2, 5, -3])
+    2*x**2 + 5*x - 3
+    """
+
+    import sympy
+
+    if var is None:
+        from ..symbols import x as var
+
+    degree = len(coefficients) - 1
+    return sympy.Add(*[int(coefficient) * var ** (degree - i) for i, coefficient in enumerate(coefficients)])
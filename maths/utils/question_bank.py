@@ -0,0 +1,337 @@
+"""Compact, memory-mapped banks of pre-computed question parameters.
+
+A bank is a NumPy structured array saved as a .npy file, with one fixed-width record per question. Each record holds
+the integer (or rational) coefficients of the question's parameters, as described by a list of fields, e.g.
+
+    bank_fields = [question_bank.Polynomial('curve', 3), question_bank.Polynomial('tangent', 1)]
+
+Banks are memory-mapped read-only, so sampling a question only reads its own record from disk, and sympy objects
+are only built for the record that was sampled.
+
+numpy and sympy are only imported once a bank is actually written or read, so question modules can declare their
+fields without paying for either.
+"""
+
+import math
+import os
+
+
+class Integer:
+    """A single integer parameter.
+
+    name -- the key of the parameter in the question dict
+    dtype -- the NumPy integer type it is stored as
+    """
+
+    def __init__(self, name, dtype='i4'):
+        self.name = name
+        self.dtype = dtype
+
+    def columns(self):
+        return [(self.name, self.dtype)]
+
+    def encode(self, value):
+        return (_as_integer(value, self.name), )
+
+    def decode(self, values):
+        import sympy
+
+        return sympy.Integer(int(values[0]))
+
+
+class Rational:
+    """A single rational parameter, stored as its numerator and denominator.
+    """
+
+    def __init__(self, name, dtype='i4'):
+        self.name = name
+        self.dtype = dtype
+
+    def columns(self):
+        return [(self.name + '_numerator', self.dtype), (self.name + '_denominator', self.dtype)]
+
+    def encode(self, value):
+        import sympy
+
+        value = sympy.Rational(value)
+        return (int(value.p), int(value.q))
+
+    def decode(self, values):
+        import sympy
+
+        return sympy.Rational(int(values[0]), int(values[1]))
+
+
+class Polynomial:
+    """A polynomial parameter of at most some degree, stored as one coefficient per power of its variable.
+
+    The coefficient of var**i is stored in the column '<name>_<i>', e.g. the gradient of a stored tangent is
+    'tangent_1'. Lower degree polynomials are stored with leading zeros, so quadratics and cubics can share a bank.
+
+    name -- the key of the parameter in the question dict
+    degree -- the highest degree of polynomial that can be stored
+    rational -- whether the coefficients can be rational rather than just integers
+    dtype -- the NumPy integer type each coefficient (or numerator and denominator) is stored as
+    var -- the polynomial's variable, x by default
+    """
+
+    def __init__(self, name, degree, rational=False, dtype='i4', var=None):
+        self.name = name
+        self.degree = degree
+        self.rational = rational
+        self.dtype = dtype
+        self.var = var
+
+    def _coefficient_fields(self):
+        field_type = Rational if self.rational else Integer
+        return [field_type('{0}_{1}'.format(self.name, i), self.dtype) for i in range(self.degree + 1)]
+
+    def _var(self):
+        if self.var is not None:
+            return self.var
+
+        from ..symbols import x
+        return x
+
+    def columns(self):
+        return [column for field in self._coefficient_fields() for column in field.columns()]
+
+    def encode(self, value):
+        import sympy
+
+        polynomial = sympy.Poly(value, self._var())
+        if polynomial.degree() > self.degree:
+            raise ValueError('{0} has a higher degree than the {1} field can store: {2}'.format(
+                value, self.name, self.degree))
+
+        coefficients = [polynomial.coeff_monomial(self._var() ** i) for i in range(self.degree + 1)]
+
+        return tuple(number for field, coefficient in zip(self._coefficient_fields(), coefficients)
+                     for number in field.encode(coefficient))
+
+    def degrees(self, bank):
+        """Return the degree of this field's polynomial in every record of a bank, e.g. for a bank index.
+
+        A zero polynomial is given degree 0.
+        """
+
+        import numpy
+
+        degrees = numpy.zeros(len(bank), dtype='i1')
+        for i in range(1, self.degree + 1):
+            nonzero = (bank[self.columns()[i * (2 if self.rational else 1)][0]] != 0)
+            degrees[nonzero] = i
+
+        return degrees
+
+    def decode(self, values):
+        width = 2 if self.rational else 1
+
+        polynomial = 0
+        for i, field in enumerate(self._coefficient_fields()):
+            polynomial += field.decode(values[i * width:(i + 1) * width]) * self._var() ** i
+
+        return polynomial
+
+
+def _as_integer(value, name):
+    """Return a sympy or Python integer as an int, refusing anything that isn't a whole number.
+
+    >>> _as_integer(3, 'a')
+    3
+    """
+
+    if int(value) != value:
+        raise ValueError('The {0} field can only store integers, not: {1}'.format(name, value))
+
+    return int(value)
+
+
+def dtype(fields):
+    """Return the NumPy structured type of a record of a bank with the given fields.
+    """
+
+    import numpy
+
+    return numpy.dtype([column for field in fields for column in field.columns()])
+
+
+def encode(fields, question):
+    """Return a question dict as a flat record of integers.
+    """
+
+    return tuple(number for field in fields for number in field.encode(question[field.name]))
+
+
+def decode(fields, record):
+    """Return the question dict a record was encoded from, rebuilding its sympy objects.
+    """
+
+    values = record.tolist()
+
+    question = {}
+    start = 0
+    for field in fields:
+        width = len(field.columns())
+        question[field.name] = field.decode(values[start:start + width])
+        start += width
+
+    return question
+
+
+def from_columns(fields, columns):
+    """Return a bank built from a dict of column name -> array of that column's values, e.g. {'curve_0': [...], ...}.
+
+    This lets a vectorised enumerate_columns build a bank without ever building sympy objects.
+    """
+
+    import numpy
+
+    record_type = dtype(fields)
+
+    lengths = {len(columns[name]) for name in record_type.names}
+    if len(lengths) > 1:
+        raise ValueError('The columns of a bank must all be the same length, not: {0}'.format(sorted(lengths)))
+
+    bank = numpy.empty(lengths.pop() if lengths else 0, dtype=record_type)
+    for name in record_type.names:
+        column = numpy.asarray(columns[name])
+
+        # check every value fits its column, rather than letting numpy silently wrap an overflowing coefficient
+        limits = numpy.iinfo(record_type[name])
+        if len(column) and (column.min() < limits.min or column.max() > limits.max):
+            raise ValueError('Values from {0} to {1} do not fit in the {2} column'.format(
+                column.min(), column.max(), name))
+
+        bank[name] = column
+
+    return bank
+
+
+def write_bank(path, fields, questions):
+    """Write every question dict in an iterable of them to a bank at path, returning the number written.
+    """
+
+    names = dtype(fields).names
+    records = [encode(fields, question) for question in questions]
+
+    columns = dict(zip(names, zip(*records))) if records else {name: [] for name in names}
+    return write_columns(path, fields, columns)
+
+
+def write_columns(path, fields, columns):
+    """Write a dict of column name -> array of that column's values to a bank at path, returning the number written.
+    """
+
+    bank = from_columns(fields, columns)
+    _save(path, bank)
+
+    return len(bank)
+
+
+def merge_banks(path, bank_paths):
+    """Concatenate the banks at bank_paths, in order, into one bank at path, returning the number of questions in it.
+    """
+
+    import numpy
+
+    bank = numpy.concatenate([load_bank(bank_path) for bank_path in bank_paths])
+    _save(path, bank)
+
+    return len(bank)
+
+
+def _save(path, bank):
+    """Save a bank, renaming it into place once it is complete so a half-written bank is never read.
+    """
+
+    import numpy
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temporary_path = path + '.tmp.npy'
+    numpy.save(temporary_path, bank)
+    os.replace(temporary_path, path)
+
+
+def build_index(keys):
+    """Return a secondary index over a bank, given the key of every record (e.g. a column of the bank).
+
+    The index is a 2 row array of the keys in ascending order, above the number of the record each key belongs to, so
+    the records with keys in a range can be found by binary search. Each row is contiguous, so searching doesn't
+    copy the keys.
+
+    >>> build_index([3, 1, 2, 1]).tolist()
+    [[1, 1, 2, 3], [1, 3, 2, 0]]
+    """
+
+    import numpy
+
+    keys = numpy.asarray(keys)
+    order = numpy.argsort(keys, kind='stable')
+
+    index = numpy.empty((2, len(keys)), dtype=numpy.promote_types(keys.dtype, 'i4' if len(keys) < 2 ** 31 else 'i8'))
+    index[0] = keys[order]
+    index[1] = order
+
+    return index
+
+
+def write_index(path, keys):
+    """Write a secondary index over a bank to path - see build_index.
+    """
+
+    _save(path, build_index(keys))
+
+
+def index_range(index, low, high):
+    """Return the numbers of the records whose keys are between low and high (inclusive), in O(log n).
+
+    The record numbers are a view of the index, so nothing is copied.
+
+    >>> index_range(build_index([3, 1, 2, 1]), 1, 2).tolist()
+    [1, 3, 2]
+    >>> index_range(build_index([0, 1, 2]), 0.5, 1.5).tolist()
+    [1]
+    """
+
+    import numpy
+
+    # the keys are integers, so a range with fractional ends only includes the integers inside it
+    limits = numpy.iinfo(index.dtype)
+    low = math.ceil(low) if low > limits.min else limits.min
+    high = math.floor(high) if high < limits.max else limits.max
+
+    # searching with numbers of the index's own type is an order of magnitude quicker than with Python ints
+    low, high = [index.dtype.type(min(max(i, limits.min), limits.max)) for i in [low, high]]
+
+    start = index[0].searchsorted(low, side='left')
+    stop = index[0].searchsorted(high, side='right')
+
+    return index[1][start:stop]
+
+
+def intersect(record_numbers):
+    """Return the record numbers that are in every one of several arrays of them, in ascending order.
+
+    >>> intersect([[5, 1, 3], [3, 4, 5]]).tolist()
+    [3, 5]
+    """
+
+    import numpy
+
+    record_numbers = sorted(record_numbers, key=len)
+
+    matching = numpy.sort(record_numbers[0])
+    for other in record_numbers[1:]:
+        matching = numpy.intersect1d(matching, other, assume_unique=True)
+
+    return matching
+
+
+def load_bank(path):
+    """Return a read-only, memory-mapped view of the bank at path.
+    """
+
+    import numpy
+
+    return numpy.load(path, mmap_mode='r')
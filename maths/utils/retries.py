@@ -0,0 +1,176 @@
+"""Counting how many attempts the question generators' retry loops take, and how long they spend on them.
+
+A retry loop draws some parameters, and starts again if they aren't any good. Looping over attempts() instead of
+`while True` records every loop:
+
+    for attempt in retries.attempts():
+        a, b = random.randint(1, 5), random.randint(1, 5)
+        if a < b:
+            break
+
+Each loop is counted under the module and class (or function) it runs in, along with how many attempts it took and
+how long it ran for. The last attempt of a loop is the one that was accepted, and the attempts before it were rejected.
+Every attempt also checks the current time_budget, so a loop that keeps rejecting can't outlast its question's budget.
+
+The counts are kept per process. Work done in other processes can be counted with collect() and merge():
+
+    result, counts = retries.collect(build_question, job)  # in the worker
+    retries.merge(counts)                                  # back in the parent
+
+and report() summarises them, the loops that spent the most time first.
+"""
+
+import sys
+import threading
+import time
+from . import time_budget
+
+
+# (module name, class or function name) -> [loops, attempts, seconds, slowest loop's seconds]
+_counts = {}
+# loops are counted on whichever thread they run on, and merged in on the threads that collect other processes' counts
+_lock = threading.Lock()
+
+
+def _owner(frame):
+    """Return the (module name, class or function name) of the code running in frame.
+    """
+
+    code = frame.f_code
+    instance = frame.f_locals.get('self')
+    if instance is not None:
+        name = '{0}.{1}'.format(type(instance).__name__, code.co_name)
+    else:
+        name = getattr(code, 'co_qualname', code.co_name)
+
+    return frame.f_globals.get('__name__'), name
+
+
+def record(key, attempts, seconds):
+    """Count one finished loop of key, which made attempts attempts in seconds.
+    """
+
+    with time_budget.uninterruptible(), _lock:
+        counts = _counts.get(key)
+        if counts is None:
+            counts = _counts[key] = [0, 0, 0.0, 0.0]
+
+        counts[0] += 1
+        counts[1] += attempts
+        counts[2] += seconds
+        counts[3] = max(counts[3], seconds)
+
+
+def attempts(depth=1):
+    """Return an iterator of attempt numbers (1, 2, ...) that never ends, counting the loop over it once it's left.
+
+    depth -- how many frames up to find the code the loop is counted under, for loops inside helpers of that code
+    """
+
+    return _attempts(_owner(sys._getframe(depth)))
+
+
+def _attempts(key):
+    start = time.perf_counter()
+    attempt = 0
+    try:
+        while True:
+            time_budget.check()
+            attempt += 1
+            yield attempt
+    finally:
+        # the loop has been left - by a break, a return or an exception - and the iterator closed
+        record(key, attempt, time.perf_counter() - start)
+
+
+def counts():
+    """Return a dict of (module name, class or function name) -> the counts of its loops, as a dict of:
+
+    loops -- how many loops ran
+    attempts -- how many attempts they made between them
+    accepted, rejected -- how many of those attempts were accepted and rejected
+    seconds, max_seconds -- the total time spent in the loops, and the time spent in the slowest one
+    """
+
+    with time_budget.uninterruptible(), _lock:
+        return _as_dicts(_counts)
+
+
+def _as_dicts(loop_counts):
+    return {key: {'loops': loops, 'attempts': attempts, 'accepted': loops, 'rejected': attempts - loops,
+                  'seconds': seconds, 'max_seconds': max_seconds}
+            for key, (loops, attempts, seconds, max_seconds) in loop_counts.items()}
+
+
+def reset():
+    """Forget every loop counted so far.
+    """
+
+    with time_budget.uninterruptible(), _lock:
+        _counts.clear()
+
+
+def take():
+    """Return the counts so far, and forget them.
+    """
+
+    with time_budget.uninterruptible(), _lock:
+        taken = _as_dicts(_counts)
+        _counts.clear()
+
+    return taken
+
+
+def merge(other_counts):
+    """Add counts taken in another process to this process' counts.
+    """
+
+    with time_budget.uninterruptible(), _lock:
+        for key, other in other_counts.items():
+            counts = _counts.get(key)
+            if counts is None:
+                counts = _counts[key] = [0, 0, 0.0, 0.0]
+
+            counts[0] += other['loops']
+            counts[1] += other['attempts']
+            counts[2] += other['seconds']
+            counts[3] = max(counts[3], other['max_seconds'])
+
+
+def collect(function, *args, **kwargs):
+    """Call function, returning its result along with the loops it counted - for running function in another process.
+
+    Counts from before the call, such as ones from an earlier job of the same worker, are left out, and are counted
+    again after it.
+    """
+
+    before = take()
+    try:
+        return function(*args, **kwargs), take()
+    finally:
+        merge(before)
+
+
+def report(loop_counts=None, top=None):
+    """Return a table of the loops counted in this process (or of loop_counts), the most time spent first.
+
+    >>> print(report({('maths.domains', 'integer_domain'): {'loops': 2, 'attempts': 6, 'accepted': 2, 'rejected': 4,
+    ...                                                      'seconds': 0.003, 'max_seconds': 0.002}}))
+      loops  attempts  rejected  rejected %   total ms     max ms  loop
+          2         6         4       66.7%        3.0        2.0  maths.domains.integer_domain
+    """
+
+    if loop_counts is None:
+        loop_counts = counts()
+
+    # the loop's name goes last, as names are too different in length to line up in a column
+    lines = ['{0:>7}{1:>10}{2:>10}{3:>12}{4:>11}{5:>11}  {6}'.format(
+        'loops', 'attempts', 'rejected', 'rejected %', 'total ms', 'max ms', 'loop')]
+
+    ordered = sorted(loop_counts.items(), key=lambda item: item[1]['seconds'], reverse=True)
+    for (module_name, name), loop in ordered[:top]:
+        lines.append('{0:>7}{1:>10}{2:>10}{3:>11.1f}%{4:>11.1f}{5:>11.1f}  {6}.{7}'.format(
+            loop['loops'], loop['attempts'], loop['rejected'], 100 * loop['rejected'] / max(loop['attempts'], 1),
+            loop['seconds'] * 1000, loop['max_seconds'] * 1000, module_name, name))
+
+    return '\n'.join(lines)
@@ -0,0 +1,109 @@
+"""Sampling question parameters that have to satisfy some constraints, without drawing them over and over.
+
+Rather than a rejection loop:
+
+    while True:
+        a, b = random.randint(1, 5), random.randint(1, 5)
+        if a < b:
+            break
+
+a part declares each parameter's possible values, and the constraint they must satisfy between them:
+
+    sampler = Sampler({'a': range(1, 6), 'b': range(1, 6)}, lambda a, b: a < b)
+    parameters = sampler.sample()  # e.g. {'a': 2, 'b': 4}
+
+The first sample enumerates every combination of the parameters' values once, keeping the feasible ones, and every
+sample after that is a single draw from them. Each feasible combination is as likely as it is under the rejection
+loop, so the questions generated are the same, only without the rejected draws.
+
+A parameter can also be drawn by a function of the rng, for values that can't be listed (such as a random curve). Its
+sampler then falls back to drawing every parameter and rejecting the infeasible combinations, as does a sampler with
+too many combinations to enumerate.
+"""
+
+import itertools
+from .. import randomness
+from . import retries
+
+
+class Sampler:
+    """Sample combinations of parameters that satisfy a constraint, uniformly.
+
+    domains -- a dict of parameter name -> its possible values, or a function of an rng that draws one of them
+    constraint -- a function of the parameters (as keyword arguments) that is True when they are feasible together
+    limit -- the most combinations to enumerate; a sampler with more of them samples by rejection
+    """
+
+    def __init__(self, domains, constraint=None, limit=100000):
+        self.domains = {name: domain if callable(domain) else list(domain) for name, domain in domains.items()}
+        self.constraint = constraint
+        self.limit = limit
+        self._feasible = None
+
+    def combinations(self):
+        """Return how many combinations of the parameters there are, or None if any parameter's values can't be listed.
+        """
+
+        combinations = 1
+        for domain in self.domains.values():
+            if callable(domain):
+                return None
+            combinations *= len(domain)
+
+        return combinations
+
+    def enumerable(self):
+        """State whether the feasible combinations are (or can be) enumerated, rather than sampled by rejection.
+        """
+
+        combinations = self.combinations()
+        return combinations is not None and combinations <= self.limit
+
+    def _satisfied(self, parameters):
+        return self.constraint is None or self.constraint(**parameters)
+
+    def feasible(self):
+        """Return a list of every feasible combination of the parameters, as tuples in the order of the domains.
+
+        It is enumerated on the first call, and kept for every call after that.
+
+        >>> Sampler({'a': range(3), 'b': range(3)}, lambda a, b: a + b == 2).feasible()
+        [(0, 2), (1, 1), (2, 0)]
+        """
+
+        if self._feasible is None:
+            if not self.enumerable():
+                raise ValueError('The parameters {0} have too many combinations to enumerate'.format(
+                    list(self.domains)))
+
+            names = list(self.domains)
+            self._feasible = [values for values in itertools.product(*self.domains.values())
+                              if self._satisfied(dict(zip(names, values)))]
+
+        return self._feasible
+
+    def _draw(self, rng):
+        return {name: domain(rng) if callable(domain) else rng.choice(domain) for name, domain in self.domains.items()}
+
+    def sample(self, rng=None):
+        """Return a dict of parameter name -> value, drawn uniformly from the feasible combinations.
+
+        >>> import random
+        >>> Sampler({'a': range(3), 'b': range(3)}, lambda a, b: a > b).sample(random.Random(0))
+        {'a': 2, 'b': 0}
+        """
+
+        rng = randomness.resolve(rng)
+
+        # counted under whatever is sampling, so an enumerated sampler's loops show up as never rejecting
+        for attempt in retries.attempts(depth=2):
+            if self.enumerable():
+                feasible = self.feasible()
+                if not feasible:
+                    raise ValueError('No combination of the parameters {0} is feasible'.format(list(self.domains)))
+
+                return dict(zip(self.domains, rng.choice(feasible)))
+
+            parameters = self._draw(rng)
+            if self._satisfied(parameters):
+                return parameters
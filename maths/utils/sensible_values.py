@@ -1,5 +1,5 @@
 import sympy
-import random
+from .. import randomness
 from ..symbols import *
 import math
 import itertools
@@ -9,55 +9,57 @@ MAX_INPUT = 5
 MAX_OUTPUT = 30
 
 
-def integral_domain(expr, domain):
+def integral_domain(expr, domain, rng=None):
     ''' Return a sensible domain to integrate a function over.
     '''
 
-    return sorted(_delegate(expr, domain, num=2))
+    return sorted(_delegate(expr, domain, num=2, rng=rng))
 
 
-def derivative(expr, domain):
+def derivative(expr, domain, rng=None):
     deriv = expr.diff()
 
-    return _delegate(deriv, domain)
+    return _delegate(deriv, domain, rng=rng)
 
 
-def antiderivative(expr, domain):
+def antiderivative(expr, domain, rng=None):
     antideriv = expr.integrate()
 
-    return _delegate(antideriv, domain)
+    return _delegate(antideriv, domain, rng=rng)
 
 
-def standard(expr, domain):
-    return _delegate(expr, domain)
+def standard(expr, domain, rng=None):
+    return _delegate(expr, domain, rng=rng)
 
 
-def conditional_integral(expr, domain):
+def conditional_integral(expr, domain, rng=None):
     ''' Return two points within the domain (excluding the end-points) on which to perform a conditional integral from one side of the domain.
     '''
 
     modified_domain = sympy.Interval(domain.left, domain.right, True, True)
 
-    return _delegate(expr, modified_domain, num=2)
+    return _delegate(expr, modified_domain, num=2, rng=rng)
 
 
 
 
 
-def _delegate(expr, domain, num=1):
+def _delegate(expr, domain, num=1, rng=None):
+    rng = randomness.resolve(rng)
+
     trigs = (sympy.sin, sympy.cos, sympy.tan, sympy.cot, sympy.sec, sympy.csc)
 
     for trig in trigs:
         if expr.find(trig):
-            return _trig(expr, domain, num)
+            return _trig(expr, domain, num, rng)
 
     if expr.find(sympy.log):
-        return _log(expr, domain, num)
+        return _log(expr, domain, num, rng)
 
     if expr.find(sympy.exp):
-        return _exp(expr, domain, num)
+        return _exp(expr, domain, num, rng)
 
-    return _polynomial(expr, domain, num)        
+    return _polynomial(expr, domain, num, rng)        
 
 
 def looks_good(value):
@@ -81,7 +83,7 @@ def looks_good(value):
 
 
 
-def _polynomial(expr, domain, num=1):
+def _polynomial(expr, domain, num, rng):
     points = set()
 
     for denom in range(1, MAX_INPUT + 1):
@@ -103,10 +105,10 @@ def _polynomial(expr, domain, num=1):
             good_choices.append(point)
 
 
-    return random.sample(good_choices, num)
+    return rng.sample(good_choices, num)
 
     
-def _trig(expr, domain, num=1):
+def _trig(expr, domain, num, rng):
     inner_function = [particle.func for particle in expr.atoms(sympy.Function)][0]
     function = list(expr.atoms(sympy.Function))[0].replace(inner_function(x0), x0)
 
@@ -128,16 +130,16 @@ def _trig(expr, domain, num=1):
     good_choices = [sympy.solve(function - test_value)[0] for test_value in values]
     good_choices = sorted([i for i in good_choices if i in domain])
 
-    return random.sample(good_choices, num)
+    return rng.sample(good_choices, num)
 
 
-def _exp(expr, domain, num=1):
+def _exp(expr, domain, num, rng):
     exp_interior = expr.find(sympy.exp).pop().args[0]
 
-    return _polynomial(exp_interior, domain, num)    
+    return _polynomial(exp_interior, domain, num, rng)    
 
 
-def _log(expr, domain, num=1):
+def _log(expr, domain, num, rng):
     log_interior = expr.find(sympy.log).pop().args[0]
 
     # for now, let's trial this range of powers of "e". 
@@ -151,4 +153,4 @@ def _log(expr, domain, num=1):
     # now flatten the solutions
     solutions = list(itertools.chain(*solutions))
 
-    return random.sample(solutions, num)
+    return rng.sample(solutions, num)
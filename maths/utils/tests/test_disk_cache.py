@@ -0,0 +1,48 @@
+from maths.utils import disk_cache
+import os
+
+
+def test_put_then_get(tmpdir):
+    cache = disk_cache.DiskCache('test', str(tmpdir))
+
+    assert cache.get('key') is None
+
+    entry_path = cache.put('key', {'a.tex': 'question', os.path.join('figures', 'b.eps'): b'figure'})
+    assert cache.get('key') == entry_path
+
+    with open(os.path.join(entry_path, 'a.tex')) as f:
+        assert f.read() == 'question'
+    with open(os.path.join(entry_path, 'figures', 'b.eps'), 'rb') as f:
+        assert f.read() == b'figure'
+
+
+def test_least_recently_used_are_evicted(tmpdir):
+    cache = disk_cache.DiskCache('test', str(tmpdir), max_bytes=25)
+
+    for i, key in enumerate(['first', 'second']):
+        cache.put(key, {'a': 'x' * 10})
+        os.utime(cache.entry_path(key), (i, i))
+
+    # using the first entry makes the second the least recently used
+    cache.get('first')
+    cache.put('third', {'a': 'x' * 10})
+
+    assert cache.get('first') is not None
+    assert cache.get('second') is None
+    assert cache.get('third') is not None
+
+
+def test_the_cache_is_only_measured_now_and_then(tmpdir, monkeypatch):
+    cache = disk_cache.DiskCache('test', str(tmpdir), max_bytes=1000)
+    measured = []
+    evict = disk_cache.DiskCache.evict
+    monkeypatch.setattr(disk_cache.DiskCache, 'evict', lambda self: measured.append(1) or evict(self))
+
+    for i in range(disk_cache.MEASURE_EVERY + 2):
+        cache.put(str(i), {'a': 'x'})
+    assert len(measured) == 2  # the first put, and the first after MEASURE_EVERY more
+
+    # an entry that takes the cache past max_bytes evicts the others straight away
+    cache.put('big', {'a': 'x' * 1000})
+    assert len(measured) == 3
+    assert cache.get('0') is None and cache.get('big') is not None
@@ -0,0 +1,37 @@
+from maths.utils import question_bank
+from maths.symbols import x
+import sympy
+import pytest
+
+
+fields = [question_bank.Polynomial('curve', 3), question_bank.Polynomial('line', 1, rational=True),
+          question_bank.Integer('n', dtype='i1')]
+
+questions = [
+    {'curve': 2*x**3 - x + 4, 'line': sympy.Rational(1, 2)*x - 3, 'n': 5},
+    {'curve': -x**2 + 7, 'line': 4*x, 'n': -2},
+]
+
+
+def test_round_trip(tmpdir):
+    path = str(tmpdir.join('bank.npy'))
+
+    assert question_bank.write_bank(path, fields, questions) == 2
+
+    bank = question_bank.load_bank(path)
+    assert not bank.flags.writeable
+    assert bank['curve_3'].tolist() == [2, 0]
+    assert [question_bank.decode(fields, record) for record in bank] == questions
+
+
+def test_values_that_do_not_fit_are_refused(tmpdir):
+    path = str(tmpdir.join('bank.npy'))
+
+    with pytest.raises(ValueError):
+        question_bank.write_bank(path, fields, [dict(questions[0], n=1000)])
+
+    with pytest.raises(ValueError):
+        question_bank.write_bank(path, fields, [dict(questions[0], curve=x**4)])
+
+    with pytest.raises(ValueError):
+        question_bank.write_bank(path, fields, [dict(questions[0], curve=x/2)])
@@ -0,0 +1,78 @@
+from maths.utils import retries, sampler
+import random
+import sys
+import threading
+
+
+class Generator:
+    def __init__(self, rejections):
+        for attempt in retries.attempts():
+            if attempt > rejections:
+                break
+
+
+def setup_function(function):
+    retries.reset()
+
+
+def test_loops_are_counted_by_class():
+    Generator(3)
+    Generator(1)
+
+    counts = retries.counts()[(__name__, 'Generator.__init__')]
+    assert counts['loops'] == 2
+    assert counts['attempts'] == 6
+    assert counts['rejected'] == 4
+    assert counts['max_seconds'] <= counts['seconds']
+
+
+def test_samplers_are_counted_under_what_samples_them():
+    parameters = sampler.Sampler({'a': lambda rng: rng.randint(0, 9)}, lambda a: a == 0)
+    parameters.sample(random.Random(0))
+
+    assert (__name__, 'test_samplers_are_counted_under_what_samples_them') in retries.counts()
+
+
+def test_collect_and_merge():
+    Generator(0)
+
+    result, counts = retries.collect(Generator, 2)
+    assert isinstance(result, Generator)
+    assert counts[(__name__, 'Generator.__init__')]['attempts'] == 3
+
+    # the counts from before the collected call are kept, and the collected ones are only added once merged
+    assert retries.counts()[(__name__, 'Generator.__init__')]['attempts'] == 1
+    retries.merge(counts)
+    assert retries.counts()[(__name__, 'Generator.__init__')]['attempts'] == 4
+
+
+def test_report():
+    Generator(1)
+
+    assert 'Generator.__init__' in retries.report()
+
+
+def test_counting_on_many_threads():
+    def count(thread):
+        for i in range(5000):
+            retries.merge({('thread', '{0}.{1}'.format(thread, i)): {'loops': 1, 'attempts': 2, 'seconds': 0.0,
+                                                                     'max_seconds': 0.0}})
+            Generator(1)
+
+    # switch threads as often as possible, to give them every chance to get in each other's way
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=count, args=(thread,)) for thread in range(4)]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            retries.report()  # reading the counts while they grow
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    counts = retries.counts()
+    assert len([key for key in counts if key[0] == 'thread']) == 20000
+    assert counts[(__name__, 'Generator.__init__')]['attempts'] == 2 * 20000
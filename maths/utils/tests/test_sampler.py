@@ -0,0 +1,54 @@
+import collections
+import random
+
+import pytest
+
+from maths.utils import sampler
+
+
+def test_only_feasible_combinations_are_sampled():
+    parameters = sampler.Sampler({'a': range(5), 'b': range(5)}, lambda a, b: a < b)
+
+    rng = random.Random(0)
+    for i in range(100):
+        sample = parameters.sample(rng)
+        assert sample['a'] < sample['b']
+
+    assert len(parameters.feasible()) == 10
+
+
+def test_feasible_combinations_are_equally_likely():
+    parameters = sampler.Sampler({'a': range(3), 'b': range(3)}, lambda a, b: a != b)
+
+    rng = random.Random(1)
+    counts = collections.Counter(tuple(parameters.sample(rng).values()) for i in range(6000))
+
+    assert len(counts) == 6
+    assert all(800 < count < 1200 for count in counts.values())
+
+
+def test_unlistable_parameters_are_sampled_by_rejection():
+    parameters = sampler.Sampler({'a': lambda rng: rng.randint(0, 9), 'b': range(10)}, lambda a, b: a + b == 9)
+    assert not parameters.enumerable()
+
+    sample = parameters.sample(random.Random(2))
+    assert sample['a'] + sample['b'] == 9
+
+
+def test_too_many_combinations_are_sampled_by_rejection():
+    parameters = sampler.Sampler({'a': range(1000), 'b': range(1000)}, lambda a, b: a == b, limit=1000)
+    assert not parameters.enumerable()
+
+    sample = parameters.sample(random.Random(3))
+    assert sample['a'] == sample['b']
+
+
+def test_seeded_samples_are_repeatable():
+    parameters = sampler.Sampler({'a': range(10), 'b': range(10)}, lambda a, b: (a * b) % 3 == 1)
+
+    assert parameters.sample(random.Random(4)) == parameters.sample(random.Random(4))
+
+
+def test_infeasible_parameters():
+    with pytest.raises(ValueError):
+        sampler.Sampler({'a': range(3)}, lambda a: a > 5).sample(random.Random(5))
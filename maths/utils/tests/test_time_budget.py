@@ -0,0 +1,104 @@
+from maths.api import cache
+from maths.utils import retries, time_budget
+import os
+import threading
+import types
+import time
+import pytest
+
+
+def test_no_budget():
+    with time_budget.limit(None):
+        assert time_budget.remaining() is None
+        time_budget.check()
+
+
+def test_retry_loops_stop_when_the_budget_runs_out():
+    start = time.monotonic()
+
+    with pytest.raises(time_budget.BudgetExceeded):
+        with time_budget.limit(0.05):
+            for attempt in retries.attempts():
+                pass  # never accepts
+
+    assert time.monotonic() - start < 1
+
+
+def test_the_main_thread_is_interrupted():
+    start = time.monotonic()
+
+    with pytest.raises(time_budget.BudgetExceeded):
+        with time_budget.limit(0.05):
+            time.sleep(5)  # stands in for a sympy call that never checks the budget
+
+    assert time.monotonic() - start < 1
+
+
+def test_inner_budgets_only_shorten_outer_ones():
+    with time_budget.limit(0.05):
+        with time_budget.limit(10):
+            assert time_budget.remaining() <= 0.05
+
+
+def test_other_threads_stop_at_their_next_check():
+    errors = []
+
+    def spin():
+        try:
+            with time_budget.limit(0.05):
+                while True:
+                    time_budget.check()
+        except time_budget.BudgetExceeded as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=spin)
+    thread.start()
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert len(errors) == 1
+
+
+def test_a_finished_block_is_not_interrupted():
+    with time_budget.limit(0.05):
+        pass
+
+    time.sleep(0.1)
+    assert time_budget.remaining() is None
+
+
+def test_running_out_inside_file_operations_is_not_swallowed(tmpdir, monkeypatch):
+    question_cache = cache.QuestionCache(str(tmpdir))
+    tree = types.SimpleNamespace(cls=cache.QuestionCache, seed=1)
+    question_cache._disk_cache.put(question_cache.key(tree, cache), {'question.tex': 'q', 'solution.tex': 's'})
+
+    utime = os.utime
+
+    def interrupted_utime(*args, **kwargs):  # the budget runs out while the cache is marking its entry as used
+        time_budget.check()
+        return utime(*args, **kwargs)
+
+    monkeypatch.setattr(os, 'utime', interrupted_utime)
+
+    with pytest.raises(time_budget.BudgetExceeded):
+        with time_budget.limit(0):
+            question_cache.get(tree, cache)
+
+
+def test_uninterruptible_blocks_finish_before_the_budget_is_enforced():
+    lock = threading.Lock()
+    finished = []
+
+    start = time.monotonic()
+    with pytest.raises(time_budget.BudgetExceeded):
+        with time_budget.limit(0.05):
+            with time_budget.uninterruptible(), lock:
+                time.sleep(0.2)  # the timer goes off in here
+                finished.append(True)
+
+            finished.append(False)
+
+    assert finished == [True]
+    assert not lock.locked()
+    assert time.monotonic() - start < 1
+
@@ -0,0 +1,177 @@
+"""Time budgets for building questions, so an unlucky draw can't keep a question (or a worker) busy forever.
+
+    with time_budget.limit(10):
+        question = tree.question_statement()
+
+raises BudgetExceeded once the block has run for 10 seconds. Long-running loops check the budget as they go - every
+retries.attempts() loop checks it on each attempt - so they stop at their next check after the budget runs out. In the
+main thread, which is where worker processes build their questions, a timer also interrupts whatever is running when
+the budget runs out, so even a single sympy call that never returns is stopped.
+
+The timer can go off anywhere, so whatever was being built when it did is thrown away - every attempt at a question
+builds its own copy of the question tree. Code that holds a lock, or would otherwise leave state shared between
+attempts broken, runs in an uninterruptible() block, which the timer doesn't interrupt:
+
+    with time_budget.uninterruptible(), _lock:
+        _counts[key] = counts
+
+The budget is checked instead as the block is left, once its lock has been released.
+"""
+
+import contextvars
+import signal
+import threading
+import time
+
+
+class BudgetExceeded(Exception):
+    """Raised when building a question takes longer than its time budget.
+
+    It isn't a TimeoutError, which is an OSError, so that code handling failed file operations doesn't swallow it.
+    """
+
+
+# the time.monotonic() by which the current block has to finish, or None if it has no budget
+_deadline = contextvars.ContextVar('time_budget_deadline', default=None)
+
+# how many uninterruptible() blocks the main thread is inside, and whether the timer went off while it was in them
+_uninterruptible_depth = 0
+_interrupted = False
+
+
+def remaining():
+    """Return how many seconds are left of the current time budget, or None if there is no budget.
+    """
+
+    deadline = _deadline.get()
+    return deadline - time.monotonic() if deadline is not None else None
+
+
+def check():
+    """Raise BudgetExceeded if the current time budget has run out.
+
+    >>> with limit(0):
+    ...     check()
+    Traceback (most recent call last):
+    ...
+    maths.utils.time_budget.BudgetExceeded: Ran out of time
+    """
+
+    deadline = _deadline.get()
+    if deadline is not None and time.monotonic() >= deadline:
+        raise BudgetExceeded('Ran out of time')
+
+
+def _can_interrupt():
+    """State whether a timer can interrupt the running code - only the main thread receives signals, and a timer that
+    is already set belongs to someone else.
+    """
+
+    return (hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread() and
+            signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0))
+
+
+def _interrupt(signum, frame):
+    global _interrupted
+
+    # a budget that is being left has already done its work, and raising in its __exit__ would stop it cleaning up
+    if frame is not None and frame.f_code is _Limit.__exit__.__code__:
+        return
+
+    # the uninterruptible block raises once it is left instead
+    if _uninterruptible_depth:
+        _interrupted = True
+        return
+
+    raise BudgetExceeded('Ran out of time')
+
+
+class _Limit:
+    """The with block of limit().
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def __enter__(self):
+        self._token = None
+        self._interrupting = False
+        if self.seconds is None:
+            return self
+
+        outer_deadline = _deadline.get()
+        deadline = time.monotonic() + self.seconds
+        if outer_deadline is not None:
+            deadline = min(deadline, outer_deadline)
+
+        # only the outermost budget sets the timer; budgets inside it are enforced by their checks alone
+        self._interrupting = outer_deadline is None and self.seconds > 0 and _can_interrupt()
+
+        self._token = _deadline.set(deadline)
+        if self._interrupting:
+            self._previous_handler = signal.signal(signal.SIGALRM, _interrupt)
+            signal.setitimer(signal.ITIMER_REAL, self.seconds)
+
+        return self
+
+    def __exit__(self, *exc_info):
+        global _interrupted
+
+        if self._interrupting:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous_handler)
+            _interrupted = False
+
+        if self._token is not None:
+            _deadline.reset(self._token)
+
+
+def limit(seconds):
+    """Return a with block with a time budget of 'seconds', which raises BudgetExceeded if it runs out.
+
+    A budget inside another budget can only shorten it. With seconds of None, the block has no budget of its own.
+    """
+
+    return _Limit(seconds)
+
+
+class _Uninterruptible:
+    """The with block of uninterruptible().
+    """
+
+    def __enter__(self):
+        global _uninterruptible_depth
+
+        self._counted = threading.current_thread() is threading.main_thread()
+        if self._counted:
+            _uninterruptible_depth += 1
+
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        global _uninterruptible_depth, _interrupted
+
+        if self._counted:
+            _uninterruptible_depth -= 1
+            if _uninterruptible_depth == 0 and _interrupted:
+                _interrupted = False
+                if exc_type is None:
+                    raise BudgetExceeded('Ran out of time')
+
+        if exc_type is None:
+            check()
+
+
+def uninterruptible():
+    """Return a with block that the timer of a time budget can't interrupt, which checks the budget as it is left
+    instead.
+
+    >>> with limit(0):
+    ...     with uninterruptible():
+    ...         pass
+    Traceback (most recent call last):
+    ...
+    maths.utils.time_budget.BudgetExceeded: Ran out of time
+    """
+
+    return _Uninterruptible()
@@ -1,7 +1,8 @@
 import sympy
-import random
+from ..randomness import random
 from sympy.abc import *
 from .. import not_named_yet
+from ..latex import printer
 
 
 def translation(lb=-5, ub=5, direction_of_change=None):
@@ -122,7 +123,7 @@ def _print_transformation(transformation):
                 amount = transformation[3]
 
 
-            return r'dilation of factor ${0}$ from the {1}-axis'.format(sympy.latex(amount), dilated_from_which_axis)
+            return r'dilation of factor ${0}$ from the {1}-axis'.format(printer.latex(amount), dilated_from_which_axis)
 
     # translation
     elif transformation.shape == (2, 1):
@@ -136,7 +137,7 @@ def _print_transformation(transformation):
         return r'translation of ${amount}$ in the {direction} direction of the {axis}-axis'.format(
                     direction=direction,
                     axis=axis,
-                    amount=sympy.latex(abs(amount))
+                    amount=printer.latex(abs(amount))
                 )
 
 
@@ -147,13 +148,13 @@ def description_of_transformations(transformations):
 
 def show_mapping(transformations):
     coords = (x, y)
-    mapping = sympy.latex(coords)
+    mapping = printer.latex(coords)
 
     for transf in transformations:
         mapped_coords = _reduce_transformation(transf, coords)
         coords = mapped_coords
 
-        mapping += r' \rightarrow {0}'.format(sympy.latex(mapped_coords))
+        mapping += r' \rightarrow {0}'.format(printer.latex(mapped_coords))
 
 
     return mapping